@@ -3,15 +3,109 @@ mmic_translator
 Generic MMSchema translator
 """
 
-# Add imports here
-from .models import *
-from .components import *
-from .mmic_translator import *
-
-# Handle versioneer
-from ._version import get_versions
-
-versions = get_versions()
-__version__ = versions["version"]
-__git_revision__ = versions["full-revisionid"]
-del get_versions, versions
+# Public names are resolved lazily (PEP 562) so that importing the package does not
+# pull in pydantic, mmic, mmelemental, cmselemental or versioneer until they are used.
+import importlib
+
+_lazy_attrs = {
+    # models
+    "ToolkitModel": "models",
+    "InputTrans": "models",
+    "OutputTrans": "models",
+    "ToolkitWriter": "models",
+    "ArrayBuffer": "models",
+    "share_array": "models",
+    "save_schema": "models",
+    "load_schema": "models",
+    "select_indices": "models",
+    "ColumnarBatch": "models",
+    "SharedArray": "models",
+    "SharedSchema": "models",
+    "LazySchema": "models",
+    # components
+    "TransComponent": "components",
+    "TransExecutor": "components",
+    # mmic_translator
+    "reg_trans": "mmic_translator",
+    "debug_validation": "mmic_translator",
+    "set_debug_validation": "mmic_translator",
+    # discovery
+    "TransInfo": "discovery",
+    "discover_translators": "discovery",
+    "register_discovered": "discovery",
+    "installed_translators": "discovery",
+    "get_trans_info": "discovery",
+    "probe_trans_info": "discovery",
+    "cache_dir": "discovery",
+    "clear_disk_cache": "discovery",
+    # cache
+    "TransCache": "cache",
+    "trans_cache": "cache",
+    # units
+    "UnitFactor": "units",
+    "unit_factor": "units",
+    "convert_units": "units",
+    # instrument
+    "StageHook": "instrument",
+    "StageHistogram": "instrument",
+    "add_hook": "instrument",
+    "remove_hook": "instrument",
+    # planner
+    "ConversionStep": "planner",
+    "ConversionPlan": "planner",
+    "ConversionPlanner": "planner",
+    "conversion_planner": "planner",
+    # registry
+    "TransCapability": "registry",
+    "TransRegistry": "registry",
+    "trans_registry": "registry",
+}
+_lazy_submodules = {
+    "models",
+    "components",
+    "mmic_translator",
+    "discovery",
+    "registry",
+    "instrument",
+    "planner",
+    "cache",
+    "units",
+}
+
+__all__ = list(_lazy_attrs)
+
+
+def _get_versions():
+    # Handle versioneer
+    from ._version import get_versions
+
+    versions = get_versions()
+    return {
+        "__version__": versions["version"],
+        "__git_revision__": versions["full-revisionid"],
+    }
+
+
+def __getattr__(name):
+    if name in _lazy_attrs:
+        value = getattr(
+            importlib.import_module("." + _lazy_attrs[name], __name__), name
+        )
+    elif name in _lazy_submodules:
+        value = importlib.import_module("." + name, __name__)
+    elif name in ("__version__", "__git_revision__"):
+        globals().update(_get_versions())
+        return globals()[name]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(
+        set(globals())
+        | set(_lazy_attrs)
+        | _lazy_submodules
+        | {"__version__", "__git_revision__"}
+    )
@@ -0,0 +1,279 @@
+"""
+cache.py
+Content-addressed cache of translation results
+
+Results are keyed by a digest of the translated input (file path, mtime and size for files,
+array contents for MMSchema models and NumPy arrays) combined with the translator name, its
+installed version and the translation kwargs. Entries are kept in an in-memory LRU and
+pickled under ``<cache_dir>/results``, evicting the least recently used files when the
+directory grows beyond ``max_bytes``.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import numpy
+from .discovery import cache_dir
+
+__all__ = ["TransCache", "digest", "trans_cache"]
+
+RESULTS_DIR = "results"
+_CACHE_FORMAT = 1
+_PICKLE_PROTOCOL = 4
+
+
+def _update(h, obj: Any):
+    if obj is None or isinstance(obj, (bool, int, float, complex, str)):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        h.update(b"bytes:%d;" % len(obj))
+        h.update(obj)
+    elif isinstance(obj, numpy.ndarray):
+        # dtype.str would reduce structured dtypes to |V<size>, dropping their fields
+        descr = numpy.lib.format.dtype_to_descr(obj.dtype)
+        h.update(f"ndarray:{descr}:{obj.shape};".encode())
+        if obj.dtype.hasobject:
+            _update(h, obj.tolist())
+        else:
+            h.update(numpy.ascontiguousarray(obj).data)
+    elif isinstance(obj, dict):
+        h.update(b"dict:%d;" % len(obj))
+        for key in sorted(obj, key=repr):
+            _update(h, key)
+            _update(h, obj[key])
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        items = sorted(obj, key=repr) if isinstance(obj, (set, frozenset)) else obj
+        h.update(f"{type(obj).__name__}:{len(obj)};".encode())
+        for item in items:
+            _update(h, item)
+    elif hasattr(obj, "__fields__"):
+        # pydantic models e.g. MMSchema or ToolkitModel objects
+        h.update(f"model:{type(obj).__module__}.{type(obj).__qualname__};".encode())
+        _update(h, {name: getattr(obj, name, None) for name in obj.__fields__})
+    else:
+        h.update(f"pickle:{type(obj).__module__}.{type(obj).__qualname__};".encode())
+        h.update(pickle.dumps(obj, protocol=_PICKLE_PROTOCOL))
+
+
+def digest(obj: Any) -> str:
+    """Returns a content digest of an object. Files (paths to existing files) are identified
+    by their real path, modification time and size rather than their contents.
+
+    Parameters
+    ----------
+    obj: Any
+        File path, MMSchema model, NumPy array, container of those, or any picklable object.
+
+    Returns
+    -------
+    str
+        Hexadecimal sha1 digest.
+
+    Raises
+    ------
+    TypeError
+        If the object cannot be digested e.g. an unpicklable toolkit object.
+
+    """
+    h = hashlib.sha1()
+    if isinstance(obj, os.PathLike) or (isinstance(obj, str) and os.path.isfile(obj)):
+        path = os.path.realpath(obj)
+        stat = os.stat(path)
+        _update(h, ("file", path, stat.st_mtime_ns, stat.st_size))
+    else:
+        try:
+            _update(h, obj)
+        except (pickle.PicklingError, AttributeError, TypeError) as exc:
+            raise TypeError(
+                f"Cannot compute a cache digest of {type(obj).__name__} objects: {exc}"
+            ) from exc
+    return h.hexdigest()
+
+
+class TransCache:
+    """A memory + disk LRU cache of translation results. Memory entries are bounded by count
+    and disk entries by total size. Results are not copied: every hit from memory returns the
+    same object, which callers must therefore not modify.
+
+    Parameters
+    ----------
+    maxsize: int, optional
+        Maximum number of results kept in memory.
+    max_bytes: int, optional
+        Maximum total size in bytes of the results stored on disk.
+    path: Optional[str], optional
+        Directory of the stored results. Defaults to ``results`` under :func:`cache_dir`,
+        the on-disk cache being disabled when the latter is.
+
+    Examples
+    --------
+    >>> cache = TransCache(max_bytes=2**30)
+    >>> outputs = TransComponent.compute_cached(inputs, cache=cache)
+    """
+
+    def __init__(
+        self, maxsize: int = 128, max_bytes: int = 2**30, path: Optional[str] = None
+    ):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._path = path
+        self._lock = threading.RLock()
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._disk_bytes: Optional[int] = None
+
+    @property
+    def path(self) -> Optional[str]:
+        """Returns the directory of the stored results, or None if not stored on disk."""
+        if self._path is not None:
+            return self._path or None
+        base = cache_dir()
+        return os.path.join(base, RESULTS_DIR) if base else None
+
+    @staticmethod
+    def key(
+        source: Any, translator: str, version: Optional[str] = None, **kwargs
+    ) -> str:
+        """Returns the cache key of a translation.
+
+        Parameters
+        ----------
+        source: Any
+            Translated input e.g. a file path, an MMSchema model or an InputTrans object.
+        translator: str
+            Translator name e.g. mmic_mda.
+        version: Optional[str], optional
+            Installed version of the translator.
+        **kwargs
+            Translation kwargs.
+
+        Returns
+        -------
+        str
+            Hexadecimal digest.
+
+        """
+        return digest(
+            (_CACHE_FORMAT, digest(source), translator, version, digest(kwargs))
+        )
+
+    def _file(self, key: str) -> Optional[str]:
+        path = self.path
+        return os.path.join(path, key + ".pkl") if path else None
+
+    def _remember(self, key: str, value: Any):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns a stored result, or ``default`` if not found. Results kept in memory are
+        shared between hits, not copied."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        fname = self._file(key)
+        if fname is None:
+            return default
+        try:
+            with open(fname, "rb") as fp:
+                value = pickle.load(fp)
+            # Marks the file as recently used for eviction
+            os.utime(fname)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return default
+        with self._lock:
+            self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: Any):
+        """Stores a result in memory and, if it is picklable, on disk."""
+        with self._lock:
+            self._remember(key, value)
+        fname = self._file(key)
+        if fname is None:
+            return
+        try:
+            data = pickle.dumps(value, protocol=_PICKLE_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return
+        if len(data) > self.max_bytes:
+            return
+        # Write atomically so concurrent processes never read a partial file
+        try:
+            os.makedirs(os.path.dirname(fname), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(fname), suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                fp.write(data)
+            os.replace(tmp, fname)
+        except OSError:
+            os.remove(tmp)
+            return
+        with self._lock:
+            if self._disk_bytes is None:
+                self._evict()
+            else:
+                self._disk_bytes += len(data)
+                if self._disk_bytes > self.max_bytes:
+                    self._evict()
+
+    def _evict(self):
+        # Rescans the directory since other processes may share it
+        path = self.path
+        entries = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name.endswith(".pkl"):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, fname in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(fname)
+            except OSError:
+                continue
+            total -= size
+        self._disk_bytes = total
+
+    def get_or_compute(self, key: str, func: Callable[[], Any]) -> Any:
+        """Returns a stored result, or computes and stores it with ``func()``. Results kept
+        in memory are shared between hits, not copied."""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = func()
+            self.put(key, value)
+        return value
+
+    def clear(self, disk: bool = True):
+        """Removes all stored results from memory and optionally from disk."""
+        with self._lock:
+            self._memory.clear()
+            path = self.path
+            if not disk or not path or not os.path.isdir(path):
+                return
+            for fname in os.listdir(path):
+                if fname.endswith(".pkl"):
+                    try:
+                        os.remove(os.path.join(path, fname))
+                    except OSError:
+                        pass
+            self._disk_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+
+trans_cache = TransCache()
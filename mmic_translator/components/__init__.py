@@ -1 +1,2 @@
 from .template_component import *
+from .executor import *
@@ -0,0 +1,207 @@
+from concurrent.futures import ProcessPoolExecutor
+import concurrent.futures
+from typing import Any, Dict, Iterable, List, Optional, Set, Type, Union
+import importlib
+import itertools
+import math
+import os
+from ..models import InputTrans, OutputTrans, SharedSchema
+from ..registry import trans_registry
+from ..discovery import installed_translators
+from .template_component import TransComponent
+
+__all__ = ["TransExecutor"]
+
+
+def _init_worker(warm: Optional[Set[str]]):
+    """Warms the caches of a worker process: builds the capability registry and
+    imports translators once so that tasks never pay for it."""
+    trans_registry.installed()
+    for tname in installed_translators(warm):
+        importlib.import_module(tname)
+
+
+# Shared schema objects received by this worker process and not yet detached
+_attached: List[SharedSchema] = []
+
+
+def _replace_schema(
+    inputs: Union[Dict[str, Any], InputTrans, OutputTrans], schema_object: Any
+):
+    if isinstance(inputs, dict):
+        return {**inputs, "schema_object": schema_object}
+    return inputs.copy(update={"schema_object": schema_object})
+
+
+def _schema_object(inputs: Union[Dict[str, Any], InputTrans, OutputTrans]) -> Any:
+    if isinstance(inputs, dict):
+        return inputs.get("schema_object")
+    return inputs.schema_object
+
+
+def _compute(
+    component: Type[TransComponent],
+    inputs: Union[Dict[str, Any], InputTrans],
+    share_memory: bool = False,
+):
+    shared = _schema_object(inputs)
+    if isinstance(shared, SharedSchema):
+        inputs = _replace_schema(inputs, shared.to_schema())
+    output = component.compute(inputs)
+    if isinstance(shared, SharedSchema):
+        del inputs
+        # Outputs may still view the segments, retry detaching them on the next task
+        _attached.append(shared)
+    _attached[:] = [handle for handle in _attached if not handle.close()]
+    if share_memory and hasattr(output.schema_object, "__fields__"):
+        # The parent process copies the arrays out and destroys the segments
+        result = SharedSchema.from_schema(output.schema_object)
+        result.close()
+        output = _replace_schema(output, result)
+    return output
+
+
+def _compute_chunk(
+    component: Type[TransComponent], inputs: List[Union[Dict[str, Any], InputTrans]]
+) -> List[OutputTrans]:
+    outputs = []
+    try:
+        for inp in inputs:
+            outputs.append(_compute(component, inp, share_memory=True))
+    except BaseException:
+        # The parent process never receives the outputs of a failed chunk
+        for output in outputs:
+            if isinstance(output.schema_object, SharedSchema):
+                output.schema_object.unlink()
+                output.schema_object.close()
+        raise
+    return outputs
+
+
+class TransExecutor:
+    """Translates a batch of inputs in parallel across a pool of worker processes.
+    Results are returned in the same order as the inputs.
+
+    Parameters
+    ----------
+    component: Type[TransComponent], optional
+        Translation component used to run each input.
+    max_workers: Optional[int], optional
+        Number of worker processes. Defaults to the number of CPUs.
+    chunksize: Optional[int], optional
+        Number of inputs sent to a worker at a time. Defaults to splitting each batch
+        into 4 chunks per worker.
+    warm: Optional[Set[str]], optional
+        Translator names to import in each worker on startup. Defaults to all installed translators.
+    mp_context: optional
+        multiprocessing context used to start the workers e.g. multiprocessing.get_context("spawn").
+    share_memory: bool, optional
+        Send the arrays of input and output schema objects through shared memory instead of
+        pickling them (python >= 3.8). Segments are destroyed once each batch completes,
+        including when a translation fails.
+
+    Examples
+    --------
+    >>> with TransExecutor(max_workers=4) as executor:
+    ...     outputs = executor.map(inputs)
+    """
+
+    def __init__(
+        self,
+        component: Type[TransComponent] = TransComponent,
+        max_workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        warm: Optional[Set[str]] = None,
+        mp_context=None,
+        share_memory: bool = False,
+    ):
+        self.component = component
+        self.chunksize = chunksize
+        self.share_memory = share_memory
+        self._pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(warm,),
+        )
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def map(
+        self, inputs: Iterable[Union[Dict[str, Any], InputTrans]]
+    ) -> List[OutputTrans]:
+        """Translates inputs in parallel.
+
+        Parameters
+        ----------
+        inputs: Iterable[Union[Dict[str, Any], InputTrans]]
+            Translation procedure inputs.
+
+        Returns
+        -------
+        List[OutputTrans]
+            Translation procedure outputs, in input order.
+
+        """
+        inputs = list(inputs)
+        chunksize = self.chunksize or max(
+            1, math.ceil(len(inputs) / (4 * self.max_workers))
+        )
+        if not self.share_memory:
+            return list(
+                self._pool.map(
+                    _compute,
+                    itertools.repeat(self.component),
+                    inputs,
+                    chunksize=chunksize,
+                )
+            )
+
+        shared = []
+        try:
+            for i, inp in enumerate(inputs):
+                schema_object = _schema_object(inp)
+                if hasattr(schema_object, "__fields__"):
+                    shared.append(SharedSchema.from_schema(schema_object))
+                    inputs[i] = _replace_schema(inp, shared[-1])
+            # Chunks are collected as they finish so that the segments of completed outputs
+            # can be destroyed if another chunk fails
+            futures = [
+                self._pool.submit(
+                    _compute_chunk, self.component, inputs[start : start + chunksize]
+                )
+                for start in range(0, len(inputs), chunksize)
+            ]
+            try:
+                outputs = [output for future in futures for output in future.result()]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                concurrent.futures.wait(futures)
+                for future in futures:
+                    if not future.cancelled() and future.exception() is None:
+                        for output in future.result():
+                            if isinstance(output.schema_object, SharedSchema):
+                                output.schema_object.unlink()
+                                output.schema_object.close()
+                raise
+        finally:
+            for handle in shared:
+                handle.unlink()
+                handle.close()
+
+        for i, output in enumerate(outputs):
+            if isinstance(output.schema_object, SharedSchema):
+                with output.schema_object as handle:
+                    outputs[i] = _replace_schema(output, handle.to_schema(copy=True))
+        return outputs
+
+    def shutdown(self, wait: bool = True):
+        """Shuts down the worker processes."""
+        self._pool.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        return False
@@ -1,13 +1,28 @@
 from mmic.components.blueprints import StrategyComponent
 from cmselemental.util.decorators import classproperty
-from ..mmic_translator import reg_trans
-from ..models import InputTrans, OutputTrans
-from typing import Dict, Any, List, Union, Set, Optional
-import importlib
+from ..mmic_translator import reg_trans, reg_vers
+from ..models import InputTrans, OutputTrans, ToolkitModel, ColumnarBatch
+from ..registry import trans_registry
+from ..discovery import installed_translators, probe_trans_info, register_discovered
+from ..instrument import instrumented
+from ..planner import conversion_planner
+from ..cache import TransCache, trans_cache
+from typing import Dict, Any, Iterable, List, Union, Set, Optional, Sequence
+from concurrent.futures import Executor
+import asyncio
+import functools
+import os
 
 __all__ = ["TransComponent"]
 
 
+def _infer_dtype(obj: Any) -> str:
+    """Infers the data type of a toolkit object from the root of its module, e.g.
+    MDAnalysis.core.universe -> mdanalysis, or the translator's own data types."""
+    root = type(obj).__module__.split(".", 1)[0]
+    return reg_trans.get(root, root.lower())
+
+
 class TransComponent(StrategyComponent):
     """An abstract template component that provides methods for converting between MMSchema and other MM codes."""
 
@@ -39,55 +54,57 @@ class TransComponent(StrategyComponent):
         Set[str]
 
         """
+        register_discovered()
         return set(reg_trans)
 
     @staticmethod
-    def installed_comps(trans: Optional[Set[str]] = set(reg_trans)) -> Set[str]:
-        """Returns module spec if it exists.
+    @instrumented("discovery")
+    def installed_comps(trans: Optional[Set[str]] = None) -> Set[str]:
+        """Returns installed translators. Translators registered via entry points are
+        found from distribution metadata, others by probing their module spec.
 
         Parameters
         ----------
-        trans: Optional[Tuple[str]], optional
-            Supported translator names to check.
+        trans: Optional[Set[str]], optional
+            Supported translator names to check. Defaults to all registered translators.
 
         Returns
         -------
-        List[str]
+        Set[str]
             Translator names that are installed.
 
         """
-        return set([spec for spec in trans if importlib.util.find_spec(spec)])
+        if trans is None:
+            return trans_registry.installed()
+        return installed_translators(trans)
 
     @staticmethod
-    def installed_comps_model(
-        model: str, trans: Optional[Set[str]] = set(reg_trans)
-    ) -> Set[str]:
+    def installed_comps_model(model: str, trans: Optional[Set[str]] = None) -> Set[str]:
         """Returns module spec if it exists and supports a specific model.
 
         Parameters
         ----------
         model: str
             Model name e.g. Molecule, ForceField, ...
-        trans: Optional[Tuple[str]], optional
-            Supported Molecule translator names to check.
+        trans: Optional[Set[str]], optional
+            Supported Molecule translator names to check. Defaults to all registered translators.
 
         Returns
         -------
-        List[str]
+        Set[str]
             Molecule Translator names that are installed.
 
         """
+        if trans is None:
+            return trans_registry.installed_model(model)
         ins_comps = TransComponent.installed_comps(trans)
         return set(
-            [
-                tname
-                for tname in ins_comps
-                if importlib.import_module(tname)._classes_map.get(model)
-            ]
+            [tname for tname in ins_comps if model in probe_trans_info(tname).models]
         )
 
     @staticmethod
     def get_dtype(tname: str, trans: Optional[Dict[str, str]] = reg_trans):
+        register_discovered()
         if tname not in trans:
             raise KeyError(
                 f"{tname} not found in the following available translators: {trans}."
@@ -96,6 +113,7 @@ class TransComponent(StrategyComponent):
 
     # Trans-specific methods
     @staticmethod
+    @instrumented("find_trans")
     def find_trans(dtype: str, trans: Optional[Dict[str, str]] = reg_trans) -> str:
         """Returns mmic_translator name (if any) corresponding to a specific data type.
         If no appropriate toolkit is available on the system, this method raises an error.
@@ -113,45 +131,498 @@ class TransComponent(StrategyComponent):
             Translator name e.g. mmic_parmed
 
         """
+        register_discovered()
         for trans, tk in trans.items():
             if dtype == tk:
                 return trans
 
         raise ValueError(f"Could not find appropriate toolkit for {dtype} object.")
 
+    @staticmethod
+    def find_model(tname: str, model: str):
+        """Returns the ToolkitModel subclass a translator uses for a specific model.
+
+        Parameters
+        ----------
+        tname: str
+            Translator name e.g. mmic_mda
+        model: str
+            Model name e.g. Molecule, ForceField, ...
+
+        Returns
+        -------
+        ToolkitModel
+            Translator model class e.g. MdaMol
+
+        """
+        return trans_registry.model_class(tname, model)
+
+    ################################################################
+    ###################### Asynchronous translation ################
+
+    @classmethod
+    async def acompute(
+        cls,
+        inputs: Union[Dict[str, Any], InputTrans],
+        executor: Optional[Executor] = None,
+        **kwargs,
+    ) -> OutputTrans:
+        """Asynchronous :meth:`compute`, run in an executor so that the event loop is not blocked
+        while the toolkit converts the data.
+
+        Parameters
+        ----------
+        inputs: Union[Dict[str, Any], InputTrans]
+            Translation procedure input.
+        executor: Optional[Executor], optional
+            Executor running the blocking call e.g. a ProcessPoolExecutor for CPU-bound
+            conversions. Defaults to the event loop's default executor.
+        **kwargs
+            Additional kwargs to pass to :meth:`compute`.
+
+        Returns
+        -------
+        OutputTrans
+            Translation procedure output.
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, functools.partial(cls.compute, inputs, **kwargs)
+        )
+
+    @classmethod
+    async def acompute_many(
+        cls,
+        inputs: Iterable[Union[Dict[str, Any], InputTrans]],
+        max_concurrency: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        **kwargs,
+    ) -> List[OutputTrans]:
+        """Translates inputs concurrently with :meth:`acompute`, running at most ``max_concurrency``
+        translations at a time.
+
+        Parameters
+        ----------
+        inputs: Iterable[Union[Dict[str, Any], InputTrans]]
+            Translation procedure inputs.
+        max_concurrency: Optional[int], optional
+            Maximum number of translations running at a time. Unbounded by default, in which
+            case the executor's number of workers is the only limit.
+        executor: Optional[Executor], optional
+            Executor running the blocking calls. Defaults to the event loop's default executor.
+        **kwargs
+            Additional kwargs to pass to :meth:`compute`.
+
+        Returns
+        -------
+        List[OutputTrans]
+            Translation procedure outputs, in input order.
+
+        """
+        if max_concurrency is None:
+            return await asyncio.gather(
+                *(cls.acompute(inp, executor, **kwargs) for inp in inputs)
+            )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(inp):
+            async with semaphore:
+                return await cls.acompute(inp, executor, **kwargs)
+
+        return await asyncio.gather(*(bounded(inp) for inp in inputs))
+
+    ################################################################
+    ###################### Cached translation ######################
+
+    @staticmethod
+    def _trans_version(tname: str) -> Optional[str]:
+        version = reg_vers.get(tname)
+        if version is None and tname in reg_trans:
+            info = probe_trans_info(tname)
+            version = info and info.version
+        return version
+
+    @classmethod
+    def compute_cached(
+        cls,
+        inputs: Union[Dict[str, Any], InputTrans],
+        cache: Optional[TransCache] = None,
+        **kwargs,
+    ) -> OutputTrans:
+        """Runs :meth:`compute`, returning the stored output when the same inputs were already
+        translated by the same translator version with the same kwargs. Inputs that cannot be
+        digested (e.g. unpicklable toolkit objects) are translated without caching. Stored
+        outputs are shared between calls and must not be modified.
+
+        Parameters
+        ----------
+        inputs: Union[Dict[str, Any], InputTrans]
+            Translation procedure input.
+        cache: Optional[TransCache], optional
+            Result cache. Defaults to the process-wide ``trans_cache``.
+        **kwargs
+            Additional kwargs to pass to :meth:`compute`.
+
+        Returns
+        -------
+        OutputTrans
+            Translation procedure output.
+
+        """
+        if isinstance(inputs, dict):
+            inputs = cls.input(**inputs)
+        cache = cache or trans_cache
+        tname = cls.__module__.split(".", 1)[0]
+        try:
+            key = cache.key(
+                inputs, tname, cls._trans_version(tname) or cls.version, **kwargs
+            )
+        except TypeError:
+            return cls.compute(inputs, **kwargs)
+        return cache.get_or_compute(key, lambda: cls.compute(inputs, **kwargs))
+
+    @classmethod
+    def from_file_cached(
+        cls,
+        filename: str,
+        dtype: Optional[str] = None,
+        model: str = "Molecule",
+        cache: Optional[TransCache] = None,
+        **kwargs,
+    ) -> Any:
+        """Reads a file and converts it to MMSchema, returning the stored MMSchema object when
+        the file (identified by its path, modification time and size) was already translated
+        by the same translator version with the same kwargs. Stored objects are shared between
+        calls and must not be modified.
+
+        Parameters
+        ----------
+        filename: str
+            The filename to read from
+        dtype: Optional[str], optional
+            File format, inferred from the extension of ``filename`` by default.
+        model: str, optional
+            Model name e.g. Molecule, ForceField, ...
+        cache: Optional[TransCache], optional
+            Result cache. Defaults to the process-wide ``trans_cache``.
+        **kwargs
+            Additional kwargs to pass to ``from_file``.
+
+        Returns
+        -------
+        Any
+            MMSchema object e.g. mmelemental.models.Molecule.
+
+        """
+        kind = trans_registry.kind_of(model)
+        dtype = dtype or os.path.splitext(filename)[1].strip(".")
+        tname = cls.find_tk(kind, "read", dtype)
+        if tname is None:
+            raise ValueError(f"Could not find appropriate toolkit for reading {dtype}.")
+        cache = cache or trans_cache
+        key = cache.key(
+            filename,
+            tname,
+            cls._trans_version(tname),
+            dtype=dtype,
+            model=model,
+            **kwargs,
+        )
+        return cache.get_or_compute(
+            key,
+            lambda: cls.find_model(tname, model)
+            .from_file(filename, dtype=dtype, **kwargs)
+            .to_schema(),
+        )
+
+    ################################################################
+    ###################### Batch translation #######################
+
+    @classmethod
+    def compute_batch(
+        cls,
+        data_objects: Optional[Sequence[Any]] = None,
+        schema_objects: Optional[Union[Sequence[Any], ColumnarBatch]] = None,
+        dtype: Optional[str] = None,
+        model: str = "Molecule",
+        version: Optional[str] = None,
+        validate: bool = False,
+        columnar: bool = False,
+        **kwargs,
+    ) -> Union[List[Any], ColumnarBatch]:
+        """Translates many data objects to MMSchema, or many MMSchema objects to a toolkit, in one call.
+        The translator and model class are resolved once for the whole batch, and data objects are
+        validated once per distinct type unless ``validate`` is set (see :meth:`ToolkitModel.trusted`).
+
+        Parameters
+        ----------
+        data_objects: Optional[Sequence[Any]], optional
+            Toolkit-specific data objects to convert to MMSchema e.g. MDAnalysis.Universe objects.
+        schema_objects: Optional[Union[Sequence[Any], ColumnarBatch]], optional
+            MMSchema objects to convert to ``dtype``, possibly stored as columns.
+        dtype: Optional[str], optional
+            Toolkit data type e.g. mdanalysis, parmed, etc. Required for ``schema_objects``, inferred
+            from the first data object otherwise.
+        model: str, optional
+            Model name e.g. Molecule, ForceField, ...
+        version: Optional[str], optional
+            Schema specification version to comply with e.g. 1.0.1.
+        validate: bool, optional
+            Validate every data object instead of once per type.
+        columnar: bool, optional
+            Return the MMSchema objects for ``data_objects`` stored as columns, which is cheaper
+            to send across processes.
+        **kwargs
+            Additional kwargs to pass to ``to_schema`` or ``from_schema``.
+
+        Returns
+        -------
+        Union[List[Any], ColumnarBatch]
+            MMSchema objects for ``data_objects``, or ToolkitModel objects for ``schema_objects``.
+
+        """
+        if (data_objects is None) == (schema_objects is None):
+            raise ValueError(
+                "Exactly one of data_objects or schema_objects must be defined."
+            )
+
+        if schema_objects is not None:
+            if dtype is None:
+                raise ValueError(
+                    "dtype must be specified when translating schema_objects."
+                )
+            model_cls = cls.find_model(cls.find_trans(dtype), model)
+            if isinstance(schema_objects, ColumnarBatch):
+                return model_cls.from_columnar(
+                    schema_objects, version=version, **kwargs
+                )
+            return [
+                model_cls.from_schema(obj, version=version, **kwargs)
+                for obj in schema_objects
+            ]
+
+        if not data_objects:
+            return []
+        if dtype is None:
+            dtype = _infer_dtype(data_objects[0])
+        model_cls = cls.find_model(cls.find_trans(dtype), model)
+
+        outputs, validated = [], set()
+        for obj in data_objects:
+            if validate or type(obj) not in validated:
+                tk_obj = model_cls(data=obj)
+                validated.add(type(obj))
+            else:
+                tk_obj = model_cls.trusted(obj)
+            outputs.append(tk_obj.to_schema(version=version, **kwargs))
+        return ColumnarBatch.from_schema(outputs) if columnar else outputs
+
+    @classmethod
+    def compute_parallel(
+        cls,
+        inputs: Sequence[Union[Dict[str, Any], InputTrans]],
+        max_workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+    ) -> List[OutputTrans]:
+        """Translates inputs in parallel across worker processes. See :class:`TransExecutor`
+        to reuse the same pool of workers across several batches.
+
+        Parameters
+        ----------
+        inputs: Sequence[Union[Dict[str, Any], InputTrans]]
+            Translation procedure inputs.
+        max_workers: Optional[int], optional
+            Number of worker processes. Defaults to the number of CPUs.
+        chunksize: Optional[int], optional
+            Number of inputs sent to a worker at a time.
+
+        Returns
+        -------
+        List[OutputTrans]
+            Translation procedure outputs, in input order.
+
+        """
+        from .executor import TransExecutor
+
+        with TransExecutor(
+            cls, max_workers=max_workers, chunksize=chunksize
+        ) as executor:
+            return executor.map(inputs)
+
+    @classmethod
+    def translate_stream(
+        cls,
+        infile: str,
+        outfile: str,
+        in_dtype: Optional[str] = None,
+        out_dtype: Optional[str] = None,
+        model: str = "Trajectory",
+        chunk_size: Optional[int] = None,
+        **kwargs,
+    ):
+        """Converts a file to another format in bounded memory by streaming MMSchema objects
+        from the reading translator's :meth:`ToolkitModel.iter_schema` to the writing
+        translator's :meth:`ToolkitModel.open_writer`.
+
+        Parameters
+        ----------
+        infile: str
+            The filename to read from
+        outfile: str
+            The filename to write to
+        in_dtype: Optional[str], optional
+            Input file format, inferred from the extension of ``infile`` by default.
+        out_dtype: Optional[str], optional
+            Output file format, inferred from the extension of ``outfile`` by default.
+        model: str, optional
+            Model name e.g. Trajectory, Molecule, ...
+        chunk_size: Optional[int], optional
+            Number of frames read and written at a time.
+        **kwargs
+            Additional kwargs to pass to ``iter_schema``.
+
+        """
+        kind = trans_registry.kind_of(model)
+        in_dtype = in_dtype or os.path.splitext(infile)[1].strip(".")
+        out_dtype = out_dtype or os.path.splitext(outfile)[1].strip(".")
+
+        reader, writer = cls.find_tk(kind, "read", in_dtype), cls.find_tk(
+            kind, "write", out_dtype
+        )
+        if reader is None or writer is None:
+            raise ValueError(
+                f"Could not find appropriate toolkits for streaming {in_dtype} to {out_dtype}."
+            )
+        reader_cls, writer_cls = cls.find_model(reader, model), cls.find_model(
+            writer, model
+        )
+        with writer_cls.open_writer(outfile, dtype=out_dtype) as fwriter:
+            fwriter.write_all(
+                reader_cls.iter_schema(
+                    infile, dtype=in_dtype, chunk_size=chunk_size, **kwargs
+                )
+            )
+
+    @classmethod
+    def convert(
+        cls,
+        data: Any,
+        dtype: str,
+        model: Optional[str] = None,
+        data_dtype: Optional[str] = None,
+        **kwargs,
+    ) -> ToolkitModel:
+        """Converts a toolkit data object to another toolkit along the cheapest route found by
+        :class:`ConversionPlanner`, using direct toolkit-to-toolkit conversions
+        (:meth:`ToolkitModel.to_toolkit`) when available instead of going through MMSchema.
+
+        Parameters
+        ----------
+        data: Any
+            ToolkitModel object, or toolkit-specific data object e.g. parmed.Structure.
+        dtype: str
+            Target data type e.g. mdanalysis.
+        model: Optional[str], optional
+            Model name e.g. Molecule, ForceField, ... Defaults to the model of ``data`` if it is a
+            ToolkitModel object, Molecule otherwise.
+        data_dtype: Optional[str], optional
+            Data type of ``data``, inferred from its module if not a ToolkitModel object.
+        **kwargs
+            Additional kwargs to pass to every conversion.
+
+        Returns
+        -------
+        ToolkitModel
+            Translator model object of data type ``dtype``.
+
+        """
+        if not isinstance(data, ToolkitModel):
+            if data_dtype is None:
+                data_dtype = _infer_dtype(data)
+            data = cls.find_model(cls.find_trans(data_dtype), model or "Molecule")(
+                data=data
+            )
+        model = model or data.schema_model
+        plan = conversion_planner.plan(data.dtype, dtype, model)
+        return plan.run(data, **kwargs)
+
+    ################################################################
+    ###################### Extension maps ##########################
+
+    @staticmethod
+    def find_ext_maps(
+        kind: str, direction: str, trans: Optional[Set[str]] = None
+    ) -> Dict[str, Dict]:
+        """Finds a Dict of translators and the file formats they support for a given model kind.
+
+        Parameters
+        ----------
+        kind: str
+            Model kind e.g. mol, ff, traj.
+        direction: str
+            Either read or write.
+        trans: Optional[Set[str]], optional
+            Supported translator names to check. Defaults to all registered translators.
+
+        Returns
+        -------
+        Dict[str, Dict]
+            Dictionary of mmic_translators: dictionary of file formats they support.
+
+        """
+        return trans_registry.ext_maps(kind, direction, trans)
+
+    @staticmethod
+    def find_tk(
+        kind: str, direction: str, dtype: str, trans: Optional[Set[str]] = None
+    ) -> Union[str, None]:
+        """Finds the preferred translator for reading or writing a specific model kind.
+
+        Parameters
+        ----------
+        kind: str
+            Model kind e.g. mol, ff, traj.
+        direction: str
+            Either read or write.
+        dtype: str
+            Data type object e.g. gro, pdb, etc.
+        trans: Optional[Set[str]], optional
+            Supported translator names to check. Defaults to all registered translators.
+
+        Returns
+        -------
+        str or None
+            Translator name e.g. mmic_mda
+
+        """
+        return trans_registry.lookup(kind, direction, dtype, trans)
+
     ################################################################
     ###################### Molecule extension maps #################
 
     @staticmethod
     def find_molread_ext_maps(
-        trans: Optional[Set[str]] = set(reg_trans),
+        trans: Optional[Set[str]] = None,
     ) -> Dict[str, Dict]:
         """Finds a Dict of molecule translators and the file formats they support reading.
 
         Parameters
         ----------
-        trans: Optional[Tuple[str]], optional
-            Supported translator names to check.
+        trans: Optional[Set[str]], optional
+            Supported translator names to check. Defaults to all registered translators.
 
         Returns
         -------
-        Dict
-            Dictionary of mmic_translators and molecule files they can read.
+        Dict[str, Dict]
+            Dictionary of mmic_translators: dictionary of molecule file formats they support reading.
 
         """
-        trans_mod = (
-            importlib.import_module(mod)
-            for mod in TransComponent.installed_comps(trans)
-        )
-        return {
-            mod.__name__: mod.molread_ext_maps
-            for mod in trans_mod
-            if hasattr(mod, "molread_ext_maps")
-        }
+        return trans_registry.ext_maps("mol", "read", trans)
 
     @staticmethod
     def find_molread_tk(
-        dtype: str, trans: Optional[Set[str]] = set(reg_trans)
+        dtype: str, trans: Optional[Set[str]] = None
     ) -> Union[str, None]:
         """Finds an appropriate translator for reading a specific molecule object.
 
@@ -159,8 +630,8 @@ class TransComponent(StrategyComponent):
         ----------
         dtype: str
             Data type object e.g. gro, pdb, etc.
-        trans: Optional[Tuple[str]], optional
-            Supported translator names to check.
+        trans: Optional[Set[str]], optional
+            Supported translator names to check. Defaults to all registered translators.
 
         Returns
         -------
@@ -168,43 +639,30 @@ class TransComponent(StrategyComponent):
             Translator name e.g. mmic_mda
 
         """
-        extension_maps = TransComponent.find_molread_ext_maps(trans)
-        for toolkit in extension_maps:
-            if extension_maps[toolkit].get(dtype):
-                if importlib.util.find_spec(toolkit):
-                    return toolkit
-        return None
+        return trans_registry.lookup("mol", "read", dtype, trans)
 
     @staticmethod
     def find_molwrite_ext_maps(
-        trans: Optional[Set[str]] = set(reg_trans),
+        trans: Optional[Set[str]] = None,
     ) -> Dict[str, Dict]:
-        """Returns a Dict of molecule translators and the file formats they can write.
+        """Finds a Dict of molecule translators and the file formats they support writing.
 
         Parameters
         ----------
-        trans: Optional[Tuple[str]], optional
-            Supported translator names to check.
+        trans: Optional[Set[str]], optional
+            Supported translator names to check. Defaults to all registered translators.
 
         Returns
         -------
         Dict[str, Dict]
-            A dictionary of molecule translators: dictionary file formats they can write.
+            Dictionary of mmic_translators: dictionary of molecule file formats they support writing.
 
         """
-        trans_mod = (
-            importlib.import_module(mod)
-            for mod in TransComponent.installed_comps(trans)
-        )
-        return {
-            mod.__name__: mod.molwrite_ext_maps
-            for mod in trans_mod
-            if hasattr(mod, "molwrite_ext_maps")
-        }
+        return trans_registry.ext_maps("mol", "write", trans)
 
     @staticmethod
     def find_molwrite_tk(
-        dtype: str, trans: Optional[Set[str]] = set(reg_trans)
+        dtype: str, trans: Optional[Set[str]] = None
     ) -> Union[str, None]:
         """Finds an appropriate translator for writing a specific molecule object.
 
@@ -212,8 +670,8 @@ class TransComponent(StrategyComponent):
         ----------
         dtype: str
             Data type object e.g. gro, pdb, etc.
-        trans: Optional[Tuple[str]], optional
-            Supported translator names to check.
+        trans: Optional[Set[str]], optional
+            Supported translator names to check. Defaults to all registered translators.
 
         Returns
         -------
@@ -221,55 +679,42 @@ class TransComponent(StrategyComponent):
             Translator name e.g. mmic_mda
 
         """
-        extension_maps = TransComponent.find_molwrite_ext_maps(trans)
-        for toolkit in extension_maps:
-            if extension_maps[toolkit].get(dtype):
-                if importlib.util.find_spec(toolkit):
-                    return toolkit
-        return None
+        return trans_registry.lookup("mol", "write", dtype, trans)
 
     ################################################################
     #################### ForceField extension maps #################
 
     @staticmethod
     def find_ffread_ext_maps(
-        trans: Optional[Set[str]] = set(reg_trans),
+        trans: Optional[Set[str]] = None,
     ) -> Dict[str, Dict]:
         """Finds a Dict of forcefield translators and the file formats they support reading.
 
         Parameters
         ----------
-        trans: Optional[Tuple[str]], optional
-            Supported translator names to check.
+        trans: Optional[Set[str]], optional
+            Supported translator names to check. Defaults to all registered translators.
 
         Returns
         -------
         Dict[str, Dict]
-            Dictionary of mmic_translators: dictionary of forcefield file formats they can read.
+            Dictionary of mmic_translators: dictionary of forcefield file formats they support reading.
 
         """
-        trans_mod = (
-            importlib.import_module(mod)
-            for mod in TransComponent.installed_comps(trans)
-        )
-        return {
-            mod.__name__: mod.ffread_ext_maps
-            for mod in trans_mod
-            if hasattr(mod, "ffread_ext_maps")
-        }
+        return trans_registry.ext_maps("ff", "read", trans)
 
     @staticmethod
     def find_ffread_tk(
-        dtype: str, trans: Optional[Set[str]] = set(reg_trans)
+        dtype: str, trans: Optional[Set[str]] = None
     ) -> Union[str, None]:
         """Finds an appropriate translator for reading a specific forcefield object.
 
         Parameters
         ----------
         dtype: str
-            Data type object e.g. gro, pdb, etc.
-        trans: Optional[Tuple[str]], optional
-            Supported translator names to check.
+            Data type object e.g. top, psf, etc.
+        trans: Optional[Set[str]], optional
+            Supported translator names to check. Defaults to all registered translators.
 
         Returns
         -------
@@ -277,53 +722,39 @@ class TransComponent(StrategyComponent):
             Translator name e.g. mmic_mda
 
         """
-        extension_maps = TransComponent.find_ffread_ext_maps(trans)
-        for toolkit in extension_maps:
-            if extension_maps[toolkit].get(dtype):
-                if importlib.util.find_spec(toolkit):
-                    return toolkit
-        return None
+        return trans_registry.lookup("ff", "read", dtype, trans)
 
     @staticmethod
     def find_ffwrite_ext_maps(
-        trans: Optional[Set[str]] = set(reg_trans),
+        trans: Optional[Set[str]] = None,
     ) -> Dict[str, Dict]:
-        """
-        Finds a Dict of forcefield translators and the file formats they can write.
+        """Finds a Dict of forcefield translators and the file formats they support writing.
 
         Parameters
         ----------
-        trans: Optional[Tuple[str]], optional
-            Supported translator names to check.
+        trans: Optional[Set[str]], optional
+            Supported translator names to check. Defaults to all registered translators.
 
         Returns
         -------
         Dict[str, Dict]
-            A dictionary of forcefield translators: dictionary of forcefield file formats they can write.
+            Dictionary of mmic_translators: dictionary of forcefield file formats they support writing.
 
         """
-        trans_mod = (
-            importlib.import_module(mod)
-            for mod in TransComponent.installed_comps(trans)
-        )
-        return {
-            mod.__name__: mod.ffwrite_ext_maps
-            for mod in trans_mod
-            if hasattr(mod, "ffwrite_ext_maps")
-        }
+        return trans_registry.ext_maps("ff", "write", trans)
 
     @staticmethod
     def find_ffwrite_tk(
-        dtype: str, trans: Optional[Set[str]] = set(reg_trans)
+        dtype: str, trans: Optional[Set[str]] = None
     ) -> Union[str, None]:
         """Finds an appropriate translator for writing a specific forcefield object.
 
         Parameters
         ----------
         dtype: str
-            Data type object e.g. gro, pdb, etc.
-        trans: Optional[Tuple[str]], optional
-            Supported translator names to check.
+            Data type object e.g. top, psf, etc.
+        trans: Optional[Set[str]], optional
+            Supported translator names to check. Defaults to all registered translators.
 
         Returns
         -------
@@ -331,55 +762,42 @@ class TransComponent(StrategyComponent):
             Translator name e.g. mmic_mda
 
         """
-        extension_maps = TransComponent.find_ffwrite_ext_maps(trans)
-        for toolkit in extension_maps:
-            if extension_maps[toolkit].get(dtype):
-                if importlib.util.find_spec(toolkit):
-                    return toolkit
-        return None
+        return trans_registry.lookup("ff", "write", dtype, trans)
 
     ################################################################
     #################### Trajectory extension maps #################
 
     @staticmethod
     def find_trajread_ext_maps(
-        trans: Optional[Set[str]] = set(reg_trans),
+        trans: Optional[Set[str]] = None,
     ) -> Dict[str, Dict]:
         """Finds a Dict of trajectory translators and the file formats they support reading.
 
         Parameters
         ----------
-        trans: Optional[Tuple[str]], optional
-            Supported translator names to check.
+        trans: Optional[Set[str]], optional
+            Supported translator names to check. Defaults to all registered translators.
 
         Returns
         -------
         Dict[str, Dict]
-            Dictionary of mmic_translators: dictionary of trajectory file formats they can read.
+            Dictionary of mmic_translators: dictionary of trajectory file formats they support reading.
 
         """
-        trans_mod = (
-            importlib.import_module(mod)
-            for mod in TransComponent.installed_comps(trans)
-        )
-        return {
-            mod.__name__: mod.trajread_ext_maps
-            for mod in trans_mod
-            if hasattr(mod, "trajread_ext_maps")
-        }
+        return trans_registry.ext_maps("traj", "read", trans)
 
     @staticmethod
     def find_trajread_tk(
-        dtype: str, trans: Optional[Set[str]] = set(reg_trans)
+        dtype: str, trans: Optional[Set[str]] = None
     ) -> Union[str, None]:
         """Finds an appropriate translator for reading a specific trajectory object.
 
         Parameters
         ----------
         dtype: str
-            Data type object e.g. gro, dcd, etc.
-        trans: Tuple[str], optional
-            Supported translator names to check.
+            Data type object e.g. trr, dcd, etc.
+        trans: Optional[Set[str]], optional
+            Supported translator names to check. Defaults to all registered translators.
 
         Returns
         -------
@@ -387,44 +805,30 @@ class TransComponent(StrategyComponent):
             Translator name e.g. mmic_mda
 
         """
-        extension_maps = TransComponent.find_trajread_ext_maps(trans)
-        for toolkit in extension_maps:
-            if extension_maps[toolkit].get(dtype):
-                if importlib.util.find_spec(toolkit):
-                    return toolkit
-        return None
+        return trans_registry.lookup("traj", "read", dtype, trans)
 
     @staticmethod
     def find_trajwrite_ext_maps(
-        trans: Optional[Set[str]] = set(reg_trans),
+        trans: Optional[Set[str]] = None,
     ) -> Dict[str, Dict]:
-        """
-        Finds a dict of trajectory translators and the file formats they can write.
+        """Finds a Dict of trajectory translators and the file formats they support writing.
 
         Parameters
         ----------
-        trans: Optional[Tuple[str]], optional
-            Supported translator names to check.
+        trans: Optional[Set[str]], optional
+            Supported translator names to check. Defaults to all registered translators.
 
         Returns
         -------
         Dict[str, Dict]
-            A dictionary of trajectory translators: dictionary oftrajectory file formats they can write.
+            Dictionary of mmic_translators: dictionary of trajectory file formats they support writing.
 
         """
-        trans_mod = (
-            importlib.import_module(mod)
-            for mod in TransComponent.installed_comps(trans)
-        )
-        return {
-            mod.__name__: mod.ffwrite_ext_maps
-            for mod in trans_mod
-            if hasattr(mod, "trajwrite_ext_maps")
-        }
+        return trans_registry.ext_maps("traj", "write", trans)
 
     @staticmethod
     def find_trajwrite_tk(
-        dtype: str, trans: Optional[Set[str]] = set(reg_trans)
+        dtype: str, trans: Optional[Set[str]] = None
     ) -> Union[str, None]:
         """Finds an appropriate translator for writing a specific trajectory object.
 
@@ -432,8 +836,8 @@ class TransComponent(StrategyComponent):
         ----------
         dtype: str
             Data type object e.g. trr, dcd, tng, etc.
-        trans: Optional[Tuple[str]], optional
-            Supported translator names to check.
+        trans: Optional[Set[str]], optional
+            Supported translator names to check. Defaults to all registered translators.
 
         Returns
         -------
@@ -441,9 +845,4 @@ class TransComponent(StrategyComponent):
             Translator name e.g. mmic_mda
 
         """
-        extension_maps = TransComponent.find_trajwrite_ext_maps(trans)
-        for toolkit in extension_maps:
-            if extension_maps[toolkit].get(dtype):
-                if importlib.util.find_spec(toolkit):
-                    return toolkit
-        return None
+        return trans_registry.lookup("traj", "write", dtype, trans)
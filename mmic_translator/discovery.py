@@ -0,0 +1,335 @@
+"""
+discovery.py
+Entry-point based translator discovery
+
+Translators advertise themselves in the ``mmic_translator.translators`` entry point group e.g.
+in setup.py:
+
+    entry_points={
+        "mmic_translator.translators": ["mmic_mda = mmic_mda_info:info"]
+    }
+
+where ``info`` is a plain dict (or a callable returning one) of the form:
+
+    {
+        "dtype": "mdanalysis",
+        "models": ["Molecule", "Trajectory"],
+        "ext_maps": {"molread": {"pdb": "pdb", ...}, "trajread": {...}, ...},
+    }
+
+The object should live in a module that does not import the toolkit so that discovering
+translators and their capabilities never imports MDAnalysis, ParmEd, etc.
+
+Translators listed in ``reg_trans`` without an entry point are probed by importing them once;
+the probed capabilities are persisted to an on-disk cache (see :func:`cache_dir`) keyed by the
+translator's installed version and the mtimes of the modules imported by the probe, so fresh
+processes do not import them again.
+"""
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import tempfile
+import sys
+import threading
+from .mmic_translator import reg_trans, reg_vers
+
+try:
+    from importlib import metadata as importlib_metadata
+except ImportError:  # python < 3.8
+    import importlib_metadata
+
+__all__ = [
+    "TransInfo",
+    "discover_translators",
+    "register_discovered",
+    "installed_translators",
+    "get_trans_info",
+    "probe_trans_info",
+    "cache_dir",
+    "clear_disk_cache",
+]
+
+ENTRY_POINT_GROUP = "mmic_translator.translators"
+CACHE_FILE = "discovery.json"
+_CACHE_FORMAT = 2
+
+_lock = threading.RLock()
+_discovered: Optional[Dict[str, "TransInfo"]] = None
+_probed: Optional[Dict[str, dict]] = None
+# Translators whose disk cache entry was checked against the installed version in this process
+_verified: Dict[str, "TransInfo"] = {}
+
+
+class TransInfo(NamedTuple):
+    """Capabilities declared by a translator in its entry point metadata."""
+
+    name: str
+    dtype: str
+    models: Tuple[str, ...] = ()
+    ext_maps: Dict[str, Dict[str, str]] = {}
+    version: Optional[str] = None
+    distribution: Optional[str] = None
+
+
+def _entry_points(group: str):
+    eps = importlib_metadata.entry_points()
+    if hasattr(eps, "select"):
+        return eps.select(group=group)
+    return eps.get(group, ())
+
+
+def _load_info(ep) -> TransInfo:
+    info = ep.load()
+    if callable(info):
+        info = info()
+    if not isinstance(info, dict) or "dtype" not in info:
+        raise ValueError(
+            f"Entry point {ep.name} in {ENTRY_POINT_GROUP} must define a dict with at least a 'dtype' key."
+        )
+    dist = getattr(ep, "dist", None)
+    return TransInfo(
+        name=ep.name,
+        dtype=info["dtype"],
+        models=tuple(info.get("models", ())),
+        ext_maps={key: dict(val) for key, val in info.get("ext_maps", {}).items()},
+        version=info.get("version") or getattr(dist, "version", None),
+        distribution=None if dist is None else dist.metadata["Name"],
+    )
+
+
+def discover_translators(refresh: bool = False) -> Dict[str, TransInfo]:
+    """Returns all translators registered via entry points. Discovery is done once per process
+    from the installed distributions' metadata.
+
+    Parameters
+    ----------
+    refresh: bool, optional
+        Rescan the installed distributions.
+
+    Returns
+    -------
+    Dict[str, TransInfo]
+        Dictionary of translator names: declared capabilities.
+
+    """
+    global _discovered
+    if _discovered is not None and not refresh:
+        return _discovered
+    with _lock:
+        if _discovered is None or refresh:
+            found = {}
+            for ep in _entry_points(ENTRY_POINT_GROUP):
+                if ep.name not in found:
+                    found[ep.name] = _load_info(ep)
+            _discovered = found
+    return _discovered
+
+
+def register_discovered(refresh: bool = False) -> Dict[str, TransInfo]:
+    """Adds the translators registered via entry points to ``reg_trans`` and ``reg_vers``.
+    Translators already present in ``reg_trans`` are left untouched.
+
+    Parameters
+    ----------
+    refresh: bool, optional
+        Rescan the installed distributions.
+
+    Returns
+    -------
+    Dict[str, TransInfo]
+        Dictionary of translator names: declared capabilities.
+
+    """
+    infos = discover_translators(refresh)
+    for name, info in infos.items():
+        reg_trans.setdefault(name, info.dtype)
+        if info.version is not None:
+            reg_vers.setdefault(name, info.version)
+    return infos
+
+
+def get_trans_info(tname: str) -> Optional[TransInfo]:
+    """Returns the capabilities a translator declared in its entry point, if any."""
+    return discover_translators().get(tname)
+
+
+def installed_translators(trans: Optional[Set[str]] = None) -> Set[str]:
+    """Returns the translators that are installed. Translators registered via entry points
+    are installed by definition, others are probed with ``importlib.util.find_spec``.
+
+    Parameters
+    ----------
+    trans: Optional[Set[str]], optional
+        Translator names to check. Defaults to all registered translators.
+
+    Returns
+    -------
+    Set[str]
+        Translator names that are installed.
+
+    """
+    infos = register_discovered()
+    trans = set(reg_trans) if trans is None else trans
+    return set(
+        name for name in trans if name in infos or importlib.util.find_spec(name)
+    )
+
+
+def cache_dir() -> Optional[str]:
+    """Returns the directory of the on-disk discovery cache, or None if disabled.
+    Defaults to ``$XDG_CACHE_HOME/mmic_translator`` (``~/.cache/mmic_translator``), and can be
+    overridden with the ``MMIC_TRANSLATOR_CACHE_DIR`` environment variable. Setting the
+    variable to an empty string disables the cache.
+    """
+    path = os.environ.get("MMIC_TRANSLATOR_CACHE_DIR")
+    if path is not None:
+        return path or None
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "mmic_translator")
+
+
+def _stamp(path: str) -> Optional[List[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _fingerprint(tname: str) -> Optional[str]:
+    spec = importlib.util.find_spec(tname)
+    if spec is None:
+        return None
+    try:
+        version = importlib_metadata.version(tname)
+    except importlib_metadata.PackageNotFoundError:
+        version = None
+    origin = spec.origin or ""
+    key = json.dumps([_CACHE_FORMAT, tname, version, origin, _stamp(origin)])
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def _load_disk_cache() -> Dict[str, dict]:
+    global _probed
+    if _probed is None:
+        path = cache_dir()
+        _probed = {}
+        _verified.clear()
+        if path:
+            try:
+                with open(os.path.join(path, CACHE_FILE), "r") as fp:
+                    data = json.load(fp)
+                if data.get("format") == _CACHE_FORMAT:
+                    _probed = data.get("translators", {})
+            except (OSError, ValueError):
+                pass
+    return _probed
+
+
+def _save_disk_cache(entries: Dict[str, dict]):
+    path = cache_dir()
+    if not path:
+        return
+    # Write atomically so concurrent workers never read a partial file
+    try:
+        os.makedirs(path, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w") as fp:
+            json.dump({"format": _CACHE_FORMAT, "translators": entries}, fp)
+        os.replace(tmp, os.path.join(path, CACHE_FILE))
+    except (OSError, TypeError, ValueError):
+        os.remove(tmp)
+
+
+def clear_disk_cache():
+    """Removes the on-disk discovery cache and forgets all probed translators."""
+    global _probed
+    with _lock:
+        _probed = None
+        path = cache_dir()
+        if path:
+            try:
+                os.remove(os.path.join(path, CACHE_FILE))
+            except OSError:
+                pass
+
+
+def probe_trans_info(tname: str, refresh: bool = False) -> Optional[TransInfo]:
+    """Returns the capabilities of a translator that is not registered via entry points.
+    The translator is imported to read its ``_classes_map`` and extension maps only when the
+    on-disk cache has no up-to-date entry for it. The cache entry is checked against the
+    installed translator once per process.
+
+    Parameters
+    ----------
+    tname: str
+        Translator name e.g. mmic_mda.
+    refresh: bool, optional
+        Check the cache entry again e.g. after reinstalling the translator.
+
+    Returns
+    -------
+    TransInfo or None
+        Translator capabilities, or None if the translator is not installed.
+
+    """
+    info = get_trans_info(tname)
+    if info:
+        return info
+    info = _verified.get(tname)
+    if info is not None and not refresh and _probed is not None:
+        return info
+    key = _fingerprint(tname)
+    if key is None:
+        return None
+    with _lock:
+        entries = _load_disk_cache()
+        entry = entries.get(tname)
+        if (
+            entry is None
+            or entry.get("key") != key
+            # e.g. a submodule defining the extension maps edited in a development install
+            or any(_stamp(path) != stamp for path, stamp in entry["files"])
+        ):
+            mod = importlib.import_module(tname)
+            # Source files of the translator read by the probe
+            files = sorted(
+                module.__file__
+                for name, module in list(sys.modules.items())
+                if (name == tname or name.startswith(tname + "."))
+                and getattr(module, "__file__", None)
+            )
+            entry = {
+                "key": key,
+                "dtype": reg_trans.get(tname),
+                "models": [
+                    model
+                    for model, cls in getattr(mod, "_classes_map", {}).items()
+                    if cls
+                ],
+                "ext_maps": {
+                    attr[: -len("_ext_maps")]: maps
+                    for attr, maps in vars(mod).items()
+                    if attr.endswith("_ext_maps") and maps is not None
+                },
+                "version": getattr(mod, "__version__", None),
+                "files": [[path, _stamp(path)] for path in files],
+            }
+            entries[tname] = entry
+            _save_disk_cache(entries)
+        info = _verified[tname] = TransInfo(
+            name=tname,
+            dtype=entry["dtype"],
+            models=tuple(entry["models"]),
+            ext_maps=entry["ext_maps"],
+            version=entry["version"],
+        )
+    return info
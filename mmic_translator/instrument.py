@@ -0,0 +1,196 @@
+"""
+instrument.py
+Optional timing hooks around translation stages
+
+Stages: discovery, find_trans, validation, from_file, from_schema, to_schema, to_file.
+Hooks are only called when registered, otherwise instrumented functions cost a single check.
+"""
+from typing import Callable, Dict, Optional, Tuple
+import functools
+import math
+import threading
+import time
+
+__all__ = [
+    "StageHook",
+    "StageHistogram",
+    "add_hook",
+    "remove_hook",
+    "instrumented",
+]
+
+# Replaced (never mutated) on registration so that instrumented calls read it without locking
+_hooks: Tuple["StageHook", ...] = ()
+_hooks_lock = threading.Lock()
+
+
+class StageHook:
+    """Base class for callbacks notified around each translation stage. Subclasses override
+    :meth:`on_start` and/or :meth:`on_end`. Hooks can be used as context managers to register
+    them for the duration of a block.
+
+    Examples
+    --------
+    >>> with StageHistogram() as hist:
+    ...     TransComponent.compute(inputs)
+    >>> hist.summary()["to_schema"]["total"]
+    """
+
+    def on_start(self, stage: str, source: str):
+        """Called before a stage runs.
+
+        Parameters
+        ----------
+        stage: str
+            Stage name e.g. to_schema.
+        source: str
+            Qualified name of the instrumented function e.g. MdaMol.to_schema.
+        """
+        pass
+
+    def on_end(
+        self, stage: str, source: str, elapsed: float, error: Optional[BaseException]
+    ):
+        """Called after a stage ran.
+
+        Parameters
+        ----------
+        stage: str
+            Stage name e.g. to_schema.
+        source: str
+            Qualified name of the instrumented function e.g. MdaMol.to_schema.
+        elapsed: float
+            Wall time in seconds.
+        error: Optional[BaseException]
+            Exception raised by the stage, if any.
+        """
+        pass
+
+    def __enter__(self):
+        return add_hook(self)
+
+    def __exit__(self, *exc):
+        remove_hook(self)
+        return False
+
+
+class StageHistogram(StageHook):
+    """Aggregates stage wall times into per-stage histograms with logarithmic (power of 2)
+    buckets, starting at ``resolution`` seconds.
+
+    Parameters
+    ----------
+    resolution: float, optional
+        Upper bound of the first bucket in seconds.
+    """
+
+    def __init__(self, resolution: float = 1e-6):
+        self.resolution = resolution
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Discards all recorded timings."""
+        with self._lock:
+            self._stats: Dict[str, dict] = {}
+
+    def on_end(
+        self, stage: str, source: str, elapsed: float, error: Optional[BaseException]
+    ):
+        bucket = max(0, math.ceil(math.log2(max(elapsed, 1e-15) / self.resolution)))
+        with self._lock:
+            stats = self._stats.get(stage)
+            if stats is None:
+                stats = self._stats[stage] = {
+                    "count": 0,
+                    "errors": 0,
+                    "total": 0.0,
+                    "min": math.inf,
+                    "max": 0.0,
+                    "buckets": {},
+                }
+            stats["count"] += 1
+            stats["errors"] += error is not None
+            stats["total"] += elapsed
+            stats["min"] = min(stats["min"], elapsed)
+            stats["max"] = max(stats["max"], elapsed)
+            stats["buckets"][bucket] = stats["buckets"].get(bucket, 0) + 1
+
+    def summary(self) -> Dict[str, dict]:
+        """Returns the recorded statistics of each stage.
+
+        Returns
+        -------
+        Dict[str, dict]
+            Dictionary of stage names: dictionary of count, errors, total, mean, min, max
+            (in seconds) and histogram, the latter mapping bucket upper bounds in seconds to counts.
+
+        """
+        with self._lock:
+            return {
+                stage: {
+                    "count": stats["count"],
+                    "errors": stats["errors"],
+                    "total": stats["total"],
+                    "mean": stats["total"] / stats["count"],
+                    "min": stats["min"],
+                    "max": stats["max"],
+                    "histogram": {
+                        self.resolution * 2**bucket: count
+                        for bucket, count in sorted(stats["buckets"].items())
+                    },
+                }
+                for stage, stats in self._stats.items()
+            }
+
+
+def add_hook(hook: StageHook) -> StageHook:
+    """Registers a hook to be notified around every translation stage."""
+    global _hooks
+    with _hooks_lock:
+        _hooks = _hooks + (hook,)
+    return hook
+
+
+def remove_hook(hook: StageHook):
+    """Unregisters a hook added with :func:`add_hook`."""
+    global _hooks
+    with _hooks_lock:
+        _hooks = tuple(h for h in _hooks if h is not hook)
+
+
+def instrumented(stage: str) -> Callable:
+    """Decorator that notifies the registered hooks around each call of a function.
+
+    Parameters
+    ----------
+    stage: str
+        Stage name e.g. to_schema.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        source = func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            hooks = _hooks
+            if not hooks:
+                return func(*args, **kwargs)
+            for hook in hooks:
+                hook.on_start(stage, source)
+            error = None
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except BaseException as exc:
+                error = exc
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                for hook in hooks:
+                    hook.on_end(stage, source, elapsed, error)
+
+        wrapper._stage = stage
+        return wrapper
+
+    return decorator
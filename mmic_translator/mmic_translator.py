@@ -6,7 +6,9 @@ Handles the primary functions
 """
 
 
-__all__ = ["reg_trans"]
+import os
+
+__all__ = ["reg_trans", "debug_validation", "set_debug_validation"]
 
 reg_trans = {
     "mmic_mda": "mdanalysis",
@@ -16,3 +18,29 @@ reg_trans = {
     # "mmic_gmx": "gmx",
 }
 reg_vers = {}
+
+# Trusted constructions skip pydantic validation unless this is set
+_debug_validation = os.environ.get("MMIC_TRANSLATOR_DEBUG_VALIDATION", "") not in (
+    "",
+    "0",
+)
+
+
+def debug_validation() -> bool:
+    """Returns True if trusted model constructions are fully validated."""
+    return _debug_validation
+
+
+def set_debug_validation(flag: bool = True):
+    """Enables or disables full validation of models built with the trusted ``construct``-style
+    factories e.g. ToolkitModel.trusted. Can also be enabled by setting the
+    MMIC_TRANSLATOR_DEBUG_VALIDATION environment variable.
+
+    Parameters
+    ----------
+    flag: bool, optional
+        Validate trusted constructions.
+
+    """
+    global _debug_validation
+    _debug_validation = flag
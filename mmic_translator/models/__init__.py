@@ -1,2 +1,9 @@
+from .buffers import *
+from .selection import *
+from .columnar import *
+from .shared import *
+from .lazy import *
 from .base import *
 from .io import *
+from .stream import *
+from .binary import *
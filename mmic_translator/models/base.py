@@ -1,14 +1,133 @@
 import importlib
-import inspect
 import abc
-from typing import Optional, Any, Dict
-from pydantic import Field, validator
+import asyncio
+import functools
+import threading
+from typing import Optional, Any, Dict, Iterator, List, Tuple
+import numpy
+from concurrent.futures import Executor
+from pydantic import Field, PrivateAttr, root_validator, validator
 from mmelemental.models.base import ProtoModel
 from cmselemental.util.decorators import classproperty
+from .stream import ToolkitWriter
+from .buffers import ArrayBuffer, share_array
+from .selection import Selection
+from .columnar import ColumnarBatch
+from .lazy import LazySchema
+from ..mmic_translator import debug_validation
+from ..instrument import instrumented
+from ..registry import trans_registry
+from ..units import convert_units, unit_factor
+from ..cache import digest
 
 __all__ = ["ToolkitModel"]
 
 
+def _selecting(func):
+    """Wraps ``from_file`` so that frame and atom selections the translator does not decode
+    natively are applied to the object read, see :attr:`ToolkitModel.selectable`."""
+
+    @functools.wraps(func)
+    def wrapper(
+        cls, *args, frames: Selection = None, atoms: Selection = None, **kwargs
+    ):
+        native = cls.selectable
+        pending = {}
+        for name, selection in (("frames", frames), ("atoms", atoms)):
+            if name in native:
+                kwargs[name] = selection
+            elif selection is not None:
+                pending[name] = selection
+        # Other arguments are forwarded as passed, translators' signatures may differ
+        obj = func(cls, *args, **kwargs)
+        return obj.select(**pending) if pending else obj
+
+    return wrapper
+
+
+def _convert_schema(schema: Any, data_units: Dict[str, str], to_data: bool) -> Any:
+    """Converts the array fields of an MMSchema object named in ``data_units`` between the
+    units of the toolkit data object and the units of the MMSchema object e.g. its
+    ``geometry_units``, in a single vectorized pass per field."""
+    update = {}
+    for name, units in data_units.items():
+        value = getattr(schema, name, None)
+        schema_units = getattr(schema, name + "_units", None)
+        if not isinstance(value, numpy.ndarray) or not schema_units:
+            continue
+        if to_data:
+            converted = convert_units(value, schema_units, units)
+            update[name + "_units"] = units
+        else:
+            converted = convert_units(value, units, schema_units)
+        if converted is not value:
+            update[name] = converted
+    return schema.copy(update=update) if update else schema
+
+
+def _to_schema_units(func):
+    """Wraps ``to_schema`` so that fields built from the data object are converted from
+    :attr:`ToolkitModel.data_units` to the units of the MMSchema object."""
+
+    @functools.wraps(func)
+    def wrapper(self, version: Optional[str] = None, **kwargs):
+        schema = func(self, version, **kwargs)
+        if not self.data_units:
+            return schema
+        return _convert_schema(schema, self.data_units, to_data=False)
+
+    return wrapper
+
+
+def _from_schema_units(func):
+    """Wraps ``from_schema`` so that the fields of the MMSchema object named in the
+    ``data_units`` kwarg are converted to those units before the translator reads them,
+    the data units being recorded in :attr:`ToolkitModel.data_units`."""
+
+    @functools.wraps(func)
+    def wrapper(
+        cls,
+        data: Any,
+        version: Optional[str] = None,
+        data_units: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ):
+        if not data_units:
+            return func(cls, data, version, **kwargs)
+        obj = func(
+            cls, _convert_schema(data, data_units, to_data=True), version, **kwargs
+        )
+        if obj.data_units is None:
+            obj = obj.copy(update={"data_units": data_units})
+        return obj
+
+    return wrapper
+
+
+# Objects (instances or classes) running a wrapped stage in this thread, by stage
+_running = threading.local()
+
+
+def _outermost(stage: str, func, wrapped):
+    """Runs ``wrapped`` only for the outermost call of a stage on an object, so that a
+    subclass calling e.g. ``super().to_schema()`` converts units, applies selections and
+    notifies hooks once. Nested calls run the plain translator implementation ``func``."""
+
+    @functools.wraps(func)
+    def wrapper(obj, *args, **kwargs):
+        running = _running.__dict__.setdefault(stage, set())
+        if id(obj) in running:
+            return func(obj, *args, **kwargs)
+        running.add(id(obj))
+        try:
+            return wrapped(obj, *args, **kwargs)
+        finally:
+            running.discard(id(obj))
+
+    wrapper._stage = stage
+    return wrapper
+
+
 class ToolkitModel(ProtoModel, abc.ABC):
     """An abstract base class that acts as a wrapper for toolkit data objects."""
 
@@ -16,8 +135,36 @@ class ToolkitModel(ProtoModel, abc.ABC):
         ..., description="Toolkit-specific data object."
     )  # validator added in subclasses
     data_units: Optional[Dict[str, Any]] = Field(
-        None, description="Units for the stored physical properties in data."
+        None,
+        description="Units for the stored physical properties in data, by MMSchema field "
+        "name e.g. {'geometry': 'nanometer'}. Converted to the units of the MMSchema object "
+        "by to_schema and from them by from_schema.",
     )
+    # (conversion key, topology version, last MMSchema object, buffer digests) of
+    # to_schema_incremental
+    _schema_state: Optional[Tuple[str, Any, Any, Dict[str, str]]] = PrivateAttr(None)
+
+    def __init_subclass__(cls, **kwargs):
+        """Instruments the translation stages implemented by subclasses."""
+        super().__init_subclass__(**kwargs)
+        for stage in ("from_file", "from_schema", "to_file", "to_schema"):
+            attr = cls.__dict__.get(stage)
+            func = attr.__func__ if isinstance(attr, classmethod) else attr
+            if not callable(func) or getattr(func, "__isabstractmethod__", False):
+                continue
+            wrapped = func
+            if stage == "from_file":
+                wrapped = _selecting(wrapped)
+            elif stage == "from_schema":
+                wrapped = _from_schema_units(wrapped)
+            elif stage == "to_schema":
+                wrapped = _to_schema_units(wrapped)
+            wrapped = _outermost(stage, func, instrumented(stage)(wrapped))
+            setattr(
+                cls,
+                stage,
+                classmethod(wrapped) if isinstance(attr, classmethod) else wrapped,
+            )
 
     @classproperty
     @abc.abstractmethod
@@ -30,18 +177,142 @@ class ToolkitModel(ProtoModel, abc.ABC):
         """Returns the fundamental data object type."""
         ...
 
+    @classproperty
+    def direct_dtypes(cls) -> Dict[str, float]:
+        """Returns the data types this model converts to directly, without going through
+        MMSchema, and the relative cost of each conversion e.g. {"parmed": 0.5}. A round
+        trip through MMSchema costs 2.0. See :meth:`to_toolkit`."""
+        return {}
+
+    @classproperty
+    def selectable(cls) -> frozenset:
+        """Returns the selections :meth:`from_file` decodes natively, a subset of
+        {"frames", "atoms"}. Other selections are applied after reading with :meth:`select`."""
+        return frozenset()
+
     @classmethod
     @abc.abstractmethod
-    def from_file(cls, filename: str = None, dtype: str = None, **kwargs):
-        """Constructs a data object from file(s)."""
+    def from_file(
+        cls,
+        filename: str = None,
+        dtype: str = None,
+        *,
+        frames: Selection = None,
+        atoms: Selection = None,
+        **kwargs,
+    ):
+        """Constructs a data object from file(s).
+        Parameters
+        ----------
+        filename : str
+            The filename to read from
+        dtype : Optional[str], optional
+            File format
+        frames : Selection, optional
+            Frames to read e.g. slice(0, 1000, 10), a sequence of indices or a boolean mask.
+            Only passed to translators declaring "frames" in :attr:`selectable`; see
+            :func:`select_indices` to normalize it.
+        atoms : Selection, optional
+            Atoms to read e.g. a sequence of indices or a boolean mask. Only passed to
+            translators declaring "atoms" in :attr:`selectable`.
+        **kwargs
+            Additional kwargs to pass to the constructors.
+        """
         ...
 
+    def select(self, frames: Selection = None, atoms: Selection = None):
+        """Returns a new object restricted to a subset of frames and/or atoms. Used to apply
+        selections :meth:`from_file` does not decode natively.
+        Parameters
+        ----------
+        frames : Selection, optional
+            Frames to keep, see :func:`select_indices`.
+        atoms : Selection, optional
+            Atoms to keep, see :func:`select_indices`.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support frame or atom selections."
+        )
+
     @classmethod
     @abc.abstractmethod
     def from_schema(cls, data: Any, version: Optional[str] = None, **kwargs):
-        """Constructs data object from MMSchema."""
+        """Constructs data object from MMSchema. If a ``data_units`` kwarg is passed e.g.
+        {"geometry": "nanometer"}, the named fields are converted to those units before the
+        translator reads them and the object constructed records them in ``data_units``."""
         ...
 
+    @classmethod
+    def from_columnar(
+        cls, batch: ColumnarBatch, version: Optional[str] = None, **kwargs
+    ) -> List["ToolkitModel"]:
+        """Constructs data objects from a batch of MMSchema objects stored as columns.
+        Translators able to build toolkit objects from packed arrays override this method;
+        the default implementation calls :meth:`from_schema` on each object of the batch.
+        Parameters
+        ----------
+        batch : ColumnarBatch
+            MMSchema objects stored as columns.
+        version: str, optional
+            Schema specification version to comply with e.g. 1.0.1.
+        **kwargs
+            Additional kwargs to pass to the constructors.
+        """
+        return [cls.from_schema(obj, version=version, **kwargs) for obj in batch]
+
+    @classmethod
+    def iter_schema(
+        cls,
+        filename: str,
+        dtype: str = None,
+        chunk_size: Optional[int] = None,
+        version: Optional[str] = None,
+        frames: Selection = None,
+        atoms: Selection = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """Reads file(s) incrementally, yielding MMSchema objects e.g. one Trajectory per chunk of frames.
+        Translators that can decode files incrementally override this method so that reading runs
+        in bounded memory. The default implementation reads the whole file with :meth:`from_file`
+        and yields a single object.
+        Parameters
+        ----------
+        filename : str
+            The filename to read from
+        dtype : Optional[str], optional
+            File format
+        chunk_size : Optional[int], optional
+            Number of frames per yielded object. Defaults to 1 for streaming translators.
+        version: str, optional
+            Schema specification version to comply with e.g. 1.0.1.
+        frames : Selection, optional
+            Frames to read, see :meth:`from_file`.
+        atoms : Selection, optional
+            Atoms to read, see :meth:`from_file`.
+        **kwargs
+            Additional kwargs to pass to the constructors.
+        """
+        yield cls.from_file(
+            filename, dtype=dtype, frames=frames, atoms=atoms, **kwargs
+        ).to_schema(version=version)
+
+    @classmethod
+    def open_writer(cls, filename: str, dtype: str = None, **kwargs) -> ToolkitWriter:
+        """Opens a file for incremental writing of MMSchema objects. Translators that can
+        append to files override this method.
+        Parameters
+        ----------
+        filename : str
+            The filename to write to
+        dtype : Optional[str], optional
+            File format
+        **kwargs
+            Additional kwargs to pass to the toolkit writer.
+        """
+        raise NotImplementedError(
+            f"{cls.__name__} does not support incremental writing, use to_file instead."
+        )
+
     @abc.abstractmethod
     def to_file(self, filename: str, dtype: str = None, **kwargs):
         """Writes the data object to a file.
@@ -56,9 +327,62 @@ class ToolkitModel(ProtoModel, abc.ABC):
         """
         ...
 
+    @classmethod
+    async def afrom_file(
+        cls,
+        filename: str = None,
+        dtype: str = None,
+        executor: Optional[Executor] = None,
+        **kwargs,
+    ) -> "ToolkitModel":
+        """Asynchronous :meth:`from_file`, run in an executor so that the event loop is not
+        blocked while the toolkit decodes the file.
+        Parameters
+        ----------
+        filename : str
+            The filename to read from
+        dtype : Optional[str], optional
+            File format
+        executor : Optional[Executor], optional
+            Executor running the blocking call. Defaults to the event loop's default executor.
+        **kwargs
+            Additional kwargs to pass to :meth:`from_file`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, functools.partial(cls.from_file, filename, dtype=dtype, **kwargs)
+        )
+
+    async def ato_file(
+        self,
+        filename: str,
+        dtype: str = None,
+        executor: Optional[Executor] = None,
+        **kwargs,
+    ):
+        """Asynchronous :meth:`to_file`, run in an executor so that the event loop is not
+        blocked while the toolkit writes the file.
+        Parameters
+        ----------
+        filename : str
+            The filename to write to
+        dtype : Optional[str], optional
+            File format
+        executor : Optional[Executor], optional
+            Executor running the blocking call. Defaults to the event loop's default executor.
+        **kwargs
+            Additional kwargs to pass to :meth:`to_file`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, functools.partial(self.to_file, filename, dtype=dtype, **kwargs)
+        )
+
     @abc.abstractmethod
     def to_schema(self, version: Optional[str] = None, **kwargs):
-        """Converts the data object to MMSchema compliant object.
+        """Converts the data object to MMSchema compliant object. Fields named in
+        :attr:`data_units` are converted from those units to the units of the MMSchema object
+        e.g. its ``geometry_units`` once the translator has built it.
         Parameters
         ----------
         version: str, optional
@@ -68,6 +392,127 @@ class ToolkitModel(ProtoModel, abc.ABC):
         """
         ...
 
+    def schema_fields(self, version: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """Returns functions computing individual fields of the MMSchema object from the data
+        object e.g. {"symbols": lambda: ..., "masses": lambda: ...}, used by :meth:`to_schema_lazy`.
+        Translators override this method for fields that are cheaper to compute than the full
+        MMSchema object.
+        Parameters
+        ----------
+        version: str, optional
+            Schema specification version to comply with e.g. 1.0.1.
+        **kwargs
+            Additional kwargs to pass to the constructor.
+        """
+        return {}
+
+    def to_schema_lazy(self, version: Optional[str] = None, **kwargs) -> LazySchema:
+        """Converts the data object to a proxy of the MMSchema object whose fields are
+        computed on first access, see :class:`LazySchema`.
+        Parameters
+        ----------
+        version: str, optional
+            Schema specification version to comply with e.g. 1.0.1.
+        **kwargs
+            Additional kwargs to pass to :meth:`to_schema`.
+        """
+        getters = self.schema_fields(version=version, **kwargs)
+        if self.data_units:
+            # Fields stored in data units are only converted by to_schema
+            getters = {
+                name: getter
+                for name, getter in getters.items()
+                if name not in self.data_units
+            }
+        return LazySchema(
+            functools.partial(self.to_schema, version=version, **kwargs), getters
+        )
+
+    def to_schema_incremental(self, version: Optional[str] = None, **kwargs):
+        """Converts the data object to MMSchema, patching the object returned by the previous
+        call instead of rebuilding it when only arrays exposed by :meth:`buffers` changed
+        e.g. positions in an MD setup loop. Buffers are compared by content digest and mapped
+        to the MMSchema field of the same name. Any other change e.g. to the topology is
+        detected with :meth:`topology_version` and rebuilds the MMSchema object, as does
+        every call for translators that do not implement it.
+        Parameters
+        ----------
+        version: str, optional
+            Schema specification version to comply with e.g. 1.0.1.
+        **kwargs
+            Additional kwargs to pass to :meth:`to_schema`.
+        """
+        topology = self.topology_version()
+        if topology is None:
+            self._schema_state = None
+            return self.to_schema(version, **kwargs)
+        key = digest((version, kwargs))
+        buffers = self.buffers()
+        digests = {name: digest(buf.array) for name, buf in buffers.items()}
+        state = self._schema_state
+        if state is None or state[0] != key or state[1] != topology:
+            return self._remember_schema(
+                key, topology, self.to_schema(version, **kwargs), digests
+            )
+
+        _, _, schema, previous = state
+        update = {}
+        for name, buf in buffers.items():
+            if digests[name] == previous.get(name):
+                continue
+            field = getattr(schema, name, None)
+            if not isinstance(field, numpy.ndarray) or field.size != buf.array.size:
+                # e.g. atoms were added or a buffer has no matching field
+                return self._remember_schema(
+                    key, topology, self.to_schema(version, **kwargs), digests
+                )
+            units = getattr(schema, name + "_units", None)
+            value = numpy.array(buf.array, dtype=field.dtype).reshape(field.shape)
+            update[name] = convert_units(value, buf.units, units, inplace=True)
+        if update:
+            schema = schema.copy(update=update)
+        return self._remember_schema(key, topology, schema, digests)
+
+    def _remember_schema(
+        self, key: str, topology: Any, schema: Any, digests: Dict[str, str]
+    ):
+        self._schema_state = (key, topology, schema, digests)
+        return schema
+
+    def topology_version(self) -> Optional[Any]:
+        """Returns a value that changes whenever the data object changes outside of the arrays
+        exposed by :meth:`buffers` e.g. atoms, residues or bonds, compared on every call of
+        :meth:`to_schema_incremental`. Translators opt in to incremental translation by
+        overriding this method with a cheap equivalent e.g. a topology revision counter the
+        toolkit maintains. The default, None, rebuilds the MMSchema object on every call.
+        """
+        return None
+
+    def mark_dirty(self):
+        """Forces the next call of :meth:`to_schema_incremental` to rebuild the MMSchema
+        object e.g. after changes that :meth:`topology_version` cannot detect."""
+        self._schema_state = None
+
+    def to_toolkit(self, dtype: str, **kwargs) -> "ToolkitModel":
+        """Converts the data object to another toolkit's model e.g. MdaMol -> ParmedMol.
+        Translators declaring ``dtype`` in :attr:`direct_dtypes` override this method to convert
+        arrays directly, calling the base method for other data types. The base method goes
+        through MMSchema with :meth:`to_schema` and the target translator's :meth:`from_schema`.
+
+        Parameters
+        ----------
+        dtype: str
+            Target data type e.g. parmed.
+        **kwargs
+            Additional kwargs to pass to the constructors.
+        """
+        from ..components import TransComponent
+
+        model_cls = trans_registry.model_class(
+            TransComponent.find_trans(dtype), self.schema_model
+        )
+        return model_cls.from_schema(self.to_schema(**kwargs), **kwargs)
+
     @classmethod
     @abc.abstractclassmethod
     def isvalid(cls, data):
@@ -77,6 +522,76 @@ class ToolkitModel(ProtoModel, abc.ABC):
     def valid_data(cls, data):
         return cls.isvalid(data)
 
+    @root_validator(allow_reuse=True)
+    def _valid_unit(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Overrides the validation of MMSchema ``*_units`` fields, which would reject the
+        mapping stored in ``data_units``."""
+        data_units = values.get("data_units")
+        if data_units and not all(
+            isinstance(units, str) for units in data_units.values()
+        ):
+            raise ValueError(f"data_units must map field names to units: {data_units}.")
+        return values
+
+    @classmethod
+    def trusted(cls, data: Any, **kwargs) -> "ToolkitModel":
+        """Constructs a model without validation from a data object known to be valid e.g.
+        one a translator just created itself. Full validation is performed if enabled with
+        :func:`mmic_translator.set_debug_validation`.
+        Parameters
+        ----------
+        data : Any
+            Toolkit-specific data object.
+        **kwargs
+            Additional fields e.g. data_units.
+        """
+        if debug_validation():
+            return cls(data=data, **kwargs)
+        return cls.construct(data=data, **kwargs)
+
+    def buffers(self) -> Dict[str, ArrayBuffer]:
+        """Returns the arrays stored in the data object that can be shared without copies
+        e.g. {"geometry": ArrayBuffer(positions, "angstrom"), "velocities": ...}. Translators
+        override this method to expose coordinate, velocity, force arrays, etc."""
+        return {}
+
+    def get_buffer(
+        self,
+        name: str,
+        dtype: Optional[Any] = None,
+        copy: bool = False,
+        units: Optional[str] = None,
+    ) -> ArrayBuffer:
+        """Returns an array stored in the data object, sharing memory with it unless a copy
+        is explicitly requested.
+        Parameters
+        ----------
+        name : str
+            Buffer name e.g. geometry, velocities, forces, etc.
+        dtype : Optional[Any], optional
+            Required data type e.g. numpy.float64. Raises a ValueError if sharing the buffer
+            as ``dtype`` requires a copy and ``copy`` is not set.
+        copy : bool, optional
+            Return a copy of the buffer instead of a view.
+        units : Optional[str], optional
+            Required units e.g. nanometer. The copy is converted in place; raises a ValueError
+            if a conversion is needed and ``copy`` is not set.
+        """
+        buffers = self.buffers()
+        if name not in buffers:
+            raise KeyError(
+                f"{name} not found in the buffers of {type(self).__name__}: {list(buffers)}."
+            )
+        buf = buffers[name]
+        buf = ArrayBuffer(share_array(buf.array, dtype=dtype, copy=copy), buf.units)
+        if units is None or buf.units is None or unit_factor(buf.units, units).identity:
+            return buf
+        if not copy:
+            raise ValueError(
+                f"Converting {name} from {buf.units} to {units} requires a copy, pass copy=True."
+            )
+        return buf.to(units, inplace=True)
+
     @property
     def toolkit(self) -> str:
         """Returns the path module that defines the data type object."""
@@ -87,16 +602,25 @@ class ToolkitModel(ProtoModel, abc.ABC):
         name, _ = self.__module__.split(".", 1)
         return name
 
+    @property
+    def schema_model(self) -> str:
+        """Returns the name of the MMSchema model this object converts to e.g. Molecule."""
+        classes_map = importlib.import_module(self.translator)._classes_map
+        for model, model_cls in classes_map.items():
+            if model_cls is type(self):
+                return model
+        raise ValueError(
+            f"{type(self).__name__} is not registered in the _classes_map of {self.translator}."
+        )
+
     @property
     def path(self) -> str:
         return self.__module__ + "." + self.__name__
 
     @property
     def components(self):
-        comp_mod = importlib.import_module(self.translator + ".components")
-        return inspect.getmembers(comp_mod, inspect.isclass)
+        return trans_registry.members(self.translator, "components")
 
     @property
     def models(self):
-        mod = importlib.import_module(self.translator + ".models")
-        return inspect.getmembers(mod, inspect.isclass)
+        return trans_registry.members(self.translator, "models")
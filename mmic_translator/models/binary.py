@@ -0,0 +1,163 @@
+"""
+binary.py
+Memory-mappable binary container for MMSchema models
+
+Layout::
+
+    magic (8 bytes) | format (uint32) | header size (uint64) | JSON header | padding | arrays
+
+The JSON header stores the model class, its non-array fields and, for each array field, its
+dtype, shape and offset from the start of the array section. Arrays are written raw, in C
+order and aligned to 64 bytes, so that they can be memory-mapped back without parsing.
+"""
+from typing import Any, Dict, Optional
+import importlib
+import json
+import struct
+import numpy
+
+__all__ = ["save_schema", "load_schema"]
+
+MAGIC = b"MMICBIN\x00"
+ALIGNMENT = 64
+_FORMAT = 1
+_PREAMBLE = struct.Struct("<8sIQ")
+
+
+def _aligned(size: int) -> int:
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+
+def _descr(descr: Any) -> Any:
+    # JSON turns the tuples of structured dtype descriptors into lists
+    if isinstance(descr, list):
+        return [
+            (
+                tuple(field[0]) if isinstance(field[0], list) else field[0],
+                _descr(field[1]),
+                *(tuple(shape) for shape in field[2:]),
+            )
+            for field in descr
+        ]
+    return descr
+
+
+def save_schema(schema_object: Any, filename: str):
+    """Writes an MMSchema model to a binary file that can be memory-mapped with
+    :func:`load_schema`.
+
+    Parameters
+    ----------
+    schema_object: Any
+        MMSchema model e.g. mmelemental.models.Molecule.
+    filename: str
+        The filename to write to
+
+    """
+    arrays, fields, offset = {}, [], 0
+    for name in schema_object.__fields__:
+        value = getattr(schema_object, name)
+        if isinstance(value, numpy.ndarray) and not value.dtype.hasobject:
+            arrays[name] = {
+                "dtype": numpy.lib.format.dtype_to_descr(value.dtype),
+                "shape": value.shape,
+                "offset": offset,
+            }
+            offset += _aligned(value.nbytes)
+        elif value is not None:
+            fields.append(name)
+
+    model_cls = type(schema_object)
+    header = json.dumps(
+        {
+            "model": [model_cls.__module__, model_cls.__qualname__],
+            "fields_set": sorted(schema_object.__fields_set__),
+            "fields": json.loads(schema_object.json(include=set(fields))),
+            "arrays": arrays,
+        }
+    ).encode()
+    start = _aligned(_PREAMBLE.size + len(header))
+
+    with open(filename, "wb") as fp:
+        fp.write(_PREAMBLE.pack(MAGIC, _FORMAT, len(header)))
+        fp.write(header)
+        for name, meta in arrays.items():
+            fp.seek(start + meta["offset"])
+            numpy.ascontiguousarray(getattr(schema_object, name)).tofile(fp)
+        fp.truncate(start + offset)
+
+
+def load_schema(
+    filename: str, mmap_mode: Optional[str] = "r", validate: bool = False
+) -> Any:
+    """Reads an MMSchema model written by :func:`save_schema`. Array fields are memory-mapped
+    by default so that reopening a file is independent of its size and pages are shared
+    between processes.
+
+    Parameters
+    ----------
+    filename: str
+        The filename to read from
+    mmap_mode: Optional[str], optional
+        Memory-mapping mode of the array fields, see numpy.memmap e.g. "r" for read-only
+        or "c" for copy-on-write. If None, arrays are read into memory.
+    validate: bool, optional
+        Validate the model. Arrays were validated when the model was written, so only
+        non-array fields are validated by default.
+
+    Returns
+    -------
+    Any
+        MMSchema model e.g. mmelemental.models.Molecule.
+
+    """
+    with open(filename, "rb") as fp:
+        magic, version, size = _PREAMBLE.unpack(fp.read(_PREAMBLE.size))
+        if magic != MAGIC:
+            raise ValueError(f"{filename} is not an MMSchema binary file.")
+        if version != _FORMAT:
+            raise ValueError(
+                f"Unsupported MMSchema binary format {version} in {filename}."
+            )
+        header = json.loads(fp.read(size))
+    start = _aligned(_PREAMBLE.size + size)
+
+    module, qualname = header["model"]
+    model_cls = importlib.import_module(module)
+    for attr in qualname.split("."):
+        model_cls = getattr(model_cls, attr)
+
+    values: Dict[str, Any] = {}
+    for name, meta in header["arrays"].items():
+        dtype = numpy.lib.format.descr_to_dtype(_descr(meta["dtype"]))
+        shape = tuple(meta["shape"])
+        count = int(numpy.prod(shape))
+        if mmap_mode is None or count == 0:
+            values[name] = numpy.fromfile(
+                filename, dtype=dtype, count=count, offset=start + meta["offset"]
+            ).reshape(shape)
+        else:
+            values[name] = numpy.memmap(
+                filename,
+                dtype=dtype,
+                mode=mmap_mode,
+                offset=start + meta["offset"],
+                shape=shape,
+            )
+
+    if validate:
+        fields = model_cls.__fields__
+        return model_cls(
+            **{
+                fields[name].alias: value
+                for name, value in {**header["fields"], **values}.items()
+            }
+        )
+
+    for name, value in header["fields"].items():
+        field = model_cls.__fields__[name]
+        value, errors = field.validate(value, values, loc=name, cls=model_cls)
+        if errors:
+            raise ValueError(f"Invalid {name} field in {filename}: {errors}")
+        values[name] = value
+    return model_cls.construct(_fields_set=set(header["fields_set"]), **values)
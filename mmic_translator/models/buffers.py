@@ -0,0 +1,77 @@
+from typing import Any, NamedTuple, Optional
+import numpy
+from ..units import convert_units
+
+__all__ = ["ArrayBuffer", "share_array"]
+
+
+class ArrayBuffer(NamedTuple):
+    """A NumPy array shared between a toolkit data object and an MMSchema model, along
+    with the units of its values e.g. ArrayBuffer(positions, "angstrom")."""
+
+    array: numpy.ndarray
+    units: Optional[str] = None
+
+    @property
+    def dtype(self) -> numpy.dtype:
+        return self.array.dtype
+
+    @property
+    def shape(self) -> tuple:
+        return self.array.shape
+
+    def to(self, units: str, inplace: bool = False) -> "ArrayBuffer":
+        """Returns the buffer converted to ``units``, see :func:`convert_units`. The array is
+        shared when no conversion is needed, and overwritten if ``inplace`` is set."""
+        if self.units is None:
+            raise ValueError("Cannot convert a buffer without units.")
+        return ArrayBuffer(convert_units(self.array, self.units, units, inplace), units)
+
+
+def share_array(
+    data: Any, dtype: Optional[Any] = None, copy: bool = False
+) -> numpy.ndarray:
+    """Returns a NumPy array that shares memory with ``data``. Copies are only made on explicit
+    request: if ``data`` cannot be viewed as an array of ``dtype`` without a copy (e.g. float32
+    coordinates requested as float64, or a list), a ValueError is raised unless ``copy`` is set.
+
+    Parameters
+    ----------
+    data: Any
+        A NumPy array or any object exposing the array interface or buffer protocol.
+    dtype: Optional[Any], optional
+        Required data type of the array. Defaults to the data type of ``data``.
+    copy: bool, optional
+        Return a C-contiguous copy of ``data`` cast to ``dtype``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array view of, or copy of, ``data``.
+
+    """
+    if copy:
+        return numpy.array(data, dtype=dtype, copy=True, order="C")
+
+    if not (
+        isinstance(data, numpy.ndarray)
+        or hasattr(data, "__array_interface__")
+        or _has_buffer(data)
+    ):
+        raise ValueError(
+            f"Cannot share {type(data).__name__} objects without a copy, pass copy=True."
+        )
+    arr = numpy.asarray(data)
+    if dtype is not None and arr.dtype != numpy.dtype(dtype):
+        raise ValueError(
+            f"Sharing a {arr.dtype} array as {numpy.dtype(dtype)} requires a copy, pass copy=True."
+        )
+    return arr
+
+
+def _has_buffer(data: Any) -> bool:
+    try:
+        memoryview(data)
+    except TypeError:
+        return False
+    return True
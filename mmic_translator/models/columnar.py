@@ -0,0 +1,154 @@
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Type
+import numpy
+
+__all__ = ["ColumnarBatch"]
+
+
+def _same(value: Any, other: Any) -> bool:
+    if isinstance(value, numpy.ndarray) or isinstance(other, numpy.ndarray):
+        return False
+    try:
+        return bool(value == other)
+    except (TypeError, ValueError):
+        return False
+
+
+class ColumnarBatch:
+    """A batch of MMSchema objects of the same model stored as columns (structure of arrays).
+
+    Array fields of all objects (e.g. symbols, geometry, connectivity) are packed into one
+    contiguous array per field along the first axis, with ``offsets[name][i]`` the start of
+    object i, so that a batch crosses process boundaries as a handful of raw buffers instead
+    of a pickled object graph. Other fields are stored as one list per field, or as a single
+    value when it is the same for all objects. The batch can be carried by
+    InputTrans/OutputTrans as ``schema_object`` and consumed directly by translators, see
+    :meth:`ToolkitModel.from_columnar`.
+
+    Parameters
+    ----------
+    model: Type
+        MMSchema model class e.g. mmelemental.models.Molecule.
+    size: int
+        Number of objects.
+    columns: Dict[str, numpy.ndarray]
+        Packed array fields.
+    offsets: Dict[str, numpy.ndarray]
+        Offsets of each object in the packed array fields, of length ``size + 1``.
+    fields: Dict[str, List[Any]]
+        Other fields, one value per object.
+    constants: Optional[Dict[str, Any]], optional
+        Other fields sharing the same value across all objects e.g. units.
+    fields_set: Optional[List[frozenset]], optional
+        Fields explicitly set on each object.
+    """
+
+    def __init__(
+        self,
+        model: Type,
+        size: int,
+        columns: Dict[str, numpy.ndarray],
+        offsets: Dict[str, numpy.ndarray],
+        fields: Dict[str, List[Any]],
+        constants: Optional[Dict[str, Any]] = None,
+        fields_set: Optional[List[frozenset]] = None,
+    ):
+        self.model = model
+        self.size = size
+        self.columns = columns
+        self.offsets = offsets
+        self.fields = fields
+        self.constants = constants or {}
+        self.fields_set = fields_set
+
+    @classmethod
+    def from_schema(cls, objects: Sequence[Any]) -> "ColumnarBatch":
+        """Packs MMSchema objects of the same model into columns.
+
+        Parameters
+        ----------
+        objects: Sequence[Any]
+            MMSchema objects e.g. mmelemental.models.Molecule objects.
+
+        Returns
+        -------
+        ColumnarBatch
+
+        """
+        if not objects:
+            raise ValueError("Cannot pack an empty sequence of objects.")
+        model = type(objects[0])
+        if any(type(obj) is not model for obj in objects):
+            raise TypeError("All objects must be instances of the same model.")
+
+        columns, offsets, fields, constants = {}, {}, {}, {}
+        # Fields of the same length in every object e.g. per-atom fields share their offsets
+        shared: Dict[tuple, numpy.ndarray] = {}
+        distinct: Dict[frozenset, frozenset] = {}
+        for name in model.__fields__:
+            values = [getattr(obj, name) for obj in objects]
+            if all(
+                isinstance(value, numpy.ndarray)
+                and value.ndim
+                and not value.dtype.hasobject
+                and value.shape[1:] == values[0].shape[1:]
+                for value in values
+            ):
+                lengths = tuple(len(value) for value in values)
+                if lengths not in shared:
+                    shared[lengths] = numpy.concatenate(([0], numpy.cumsum(lengths)))
+                columns[name] = numpy.concatenate(values)
+                offsets[name] = shared[lengths]
+            elif all(_same(value, values[0]) for value in values):
+                if values[0] is not None:
+                    constants[name] = values[0]
+            else:
+                fields[name] = values
+        return cls(
+            model,
+            len(objects),
+            columns,
+            offsets,
+            fields,
+            constants,
+            # Identical sets are shared so that they are pickled once
+            [
+                distinct.setdefault(fields_set, fields_set)
+                for fields_set in (frozenset(obj.__fields_set__) for obj in objects)
+            ],
+        )
+
+    def column(self, name: str, index: int) -> numpy.ndarray:
+        """Returns a packed array field of an object as a view of the column."""
+        offsets = self.offsets[name]
+        return self.columns[name][offsets[index] : offsets[index + 1]]
+
+    def __getitem__(self, index: int) -> Any:
+        """Returns an MMSchema object, its array fields being views of the columns."""
+        if not -self.size <= index < self.size:
+            raise IndexError(f"Index {index} is out of range for size {self.size}.")
+        index %= self.size
+        values = dict(self.constants)
+        values.update((name, self.column(name, index)) for name in self.columns)
+        for name, column in self.fields.items():
+            if column[index] is not None:
+                values[name] = column[index]
+        fields_set = None if self.fields_set is None else set(self.fields_set[index])
+        return self.model.construct(_fields_set=fields_set, **values)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self[index] for index in range(self.size))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def to_schema(self) -> List[Any]:
+        """Unpacks the batch into MMSchema objects."""
+        return list(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the size in bytes of the packed array fields and offsets."""
+        offsets = {id(arr): arr for arr in self.offsets.values()}
+        return sum(arr.nbytes for arr in self.columns.values()) + sum(
+            arr.nbytes for arr in offsets.values()
+        )
@@ -2,6 +2,8 @@ from typing import Dict, Any, Optional
 from cmselemental.models.procedures import InputProc, OutputProc
 from cmselemental.models.base import ProtoModel
 from pydantic import Field, root_validator
+from ..mmic_translator import debug_validation
+from ..instrument import instrumented
 
 __all__ = ["InputTrans", "OutputTrans"]
 
@@ -28,6 +30,10 @@ class InputTrans(InputProc):
         description="The version number of ``schema_name`` to which this model conforms.",
     )
 
+    @instrumented("validation")
+    def __init__(self, **data):
+        super().__init__(**data)
+
     @root_validator
     def _valid_trans_fields(cls, values):
         if values["data_object"] and values["schema_object"]:
@@ -36,6 +42,15 @@ class InputTrans(InputProc):
             )
         return values
 
+    @classmethod
+    def trusted(cls, **kwargs) -> "InputTrans":
+        """Constructs a model without validation from fields known to be valid e.g. for
+        internal hops between components. Full validation is performed if enabled with
+        :func:`mmic_translator.set_debug_validation`."""
+        if debug_validation():
+            return cls(**kwargs)
+        return cls.construct(**kwargs)
+
 
 class OutputTrans(OutputProc):
     """An output model that serves as an intermediate output object used in converting toolkit data objects
@@ -62,6 +77,10 @@ class OutputTrans(OutputProc):
         None, description="Translation procedure input model."
     )
 
+    @instrumented("validation")
+    def __init__(self, **data):
+        super().__init__(**data)
+
     @root_validator
     def _valid_trans_fields(cls, values):
         if values["data_object"] and values["schema_object"]:
@@ -69,3 +88,12 @@ class OutputTrans(OutputProc):
                 "data_object and schema_object cannot be simultaneously defined."
             )
         return values
+
+    @classmethod
+    def trusted(cls, **kwargs) -> "OutputTrans":
+        """Constructs a model without validation from fields known to be valid e.g. for
+        internal hops between components. Full validation is performed if enabled with
+        :func:`mmic_translator.set_debug_validation`."""
+        if debug_validation():
+            return cls(**kwargs)
+        return cls.construct(**kwargs)
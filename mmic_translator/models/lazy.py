@@ -0,0 +1,74 @@
+from typing import Any, Callable, Dict
+import threading
+
+__all__ = ["LazySchema"]
+
+
+class LazySchema:
+    """A proxy of the MMSchema object a ToolkitModel converts to, whose fields are computed
+    on first access from the toolkit object and memoized. Fields the translator cannot compute
+    individually (see :meth:`ToolkitModel.schema_fields`), as well as :meth:`materialize`,
+    build the full MMSchema object once with :meth:`ToolkitModel.to_schema`.
+
+    Parameters
+    ----------
+    factory: Callable[[], Any]
+        Builds the full MMSchema object.
+    getters: Dict[str, Callable[[], Any]]
+        Functions computing individual fields.
+
+    Examples
+    --------
+    >>> mol = tkmol.to_schema_lazy()
+    >>> len(mol.symbols)  # no coordinates, connectivity, etc. converted
+    >>> mol.materialize()  # full Molecule
+    """
+
+    __slots__ = ("_factory", "_getters", "_fields", "_model", "_lock")
+
+    def __init__(
+        self, factory: Callable[[], Any], getters: Dict[str, Callable[[], Any]]
+    ):
+        self._factory = factory
+        self._getters = getters
+        self._fields: Dict[str, Any] = {}
+        self._model = None
+        self._lock = threading.RLock()
+
+    def materialize(self) -> Any:
+        """Returns the full MMSchema object, built on first call."""
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    self._model = self._factory()
+        return self._model
+
+    @property
+    def materialized(self) -> bool:
+        """Whether the full MMSchema object was built."""
+        return self._model is not None
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if self._model is not None:
+            return getattr(self._model, name)
+        getter = self._getters.get(name)
+        if getter is None:
+            return getattr(self.materialize(), name)
+        try:
+            return self._fields[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._fields:
+                self._fields[name] = getter()
+            return self._fields[name]
+
+    def __dir__(self):
+        return sorted(set(self._getters) | set(dir(type(self))))
+
+    def __repr__(self) -> str:
+        if self._model is not None:
+            return f"LazySchema({self._model!r})"
+        return f"LazySchema(computed={sorted(self._fields)})"
@@ -0,0 +1,62 @@
+from typing import Sequence, Union
+import numpy
+
+__all__ = ["Selection", "select_indices", "selection_size"]
+
+Selection = Union[None, int, slice, Sequence[int], numpy.ndarray]
+
+
+def select_indices(selection: Selection, size: int) -> Union[slice, numpy.ndarray]:
+    """Normalizes a frame or atom selection so that it can index NumPy arrays and toolkit
+    objects consistently across translators.
+
+    Parameters
+    ----------
+    selection: Selection
+        None (everything), an index, a slice e.g. slice(0, 100, 10) for every 10th of the
+        first 100 frames, a sequence of indices, or a boolean mask of length ``size``.
+    size: int
+        Number of frames or atoms available.
+
+    Returns
+    -------
+    Union[slice, numpy.ndarray]
+        A slice with non-negative start and stop, or an array of non-negative indices.
+
+    Raises
+    ------
+    IndexError
+        If an index or the mask length is out of range.
+
+    """
+    if selection is None:
+        return slice(0, size, 1)
+    if isinstance(selection, slice):
+        return slice(*selection.indices(size))
+    if isinstance(selection, (int, numpy.integer)):
+        if not -size <= selection < size:
+            raise IndexError(f"Index {selection} is out of range for size {size}.")
+        start = selection % size
+        return slice(start, start + 1, 1)
+
+    indices = numpy.asarray(selection)
+    if indices.dtype == bool:
+        if indices.shape != (size,):
+            raise IndexError(
+                f"Boolean mask of shape {indices.shape} does not match size {size}."
+            )
+        return numpy.flatnonzero(indices)
+    if indices.size and not numpy.issubdtype(indices.dtype, numpy.integer):
+        raise TypeError(f"Selection indices must be integers, not {indices.dtype}.")
+    indices = indices.astype(numpy.intp).ravel()
+    if indices.size and (indices.min() < -size or indices.max() >= size):
+        raise IndexError(f"Selection indices are out of range for size {size}.")
+    return indices % size if size else indices
+
+
+def selection_size(selection: Selection, size: int) -> int:
+    """Returns the number of frames or atoms in a selection, see :func:`select_indices`."""
+    indices = select_indices(selection, size)
+    if isinstance(indices, slice):
+        return len(range(indices.start, indices.stop, indices.step))
+    return len(indices)
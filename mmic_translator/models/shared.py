@@ -0,0 +1,195 @@
+"""
+shared.py
+Shared-memory transport of arrays and MMSchema models across processes
+
+Arrays are copied once into ``multiprocessing.shared_memory`` segments; handles pickle as the
+segment name, dtype descriptor and shape so that other processes attach to the segment by name instead
+of receiving the data. The process creating a segment is responsible for unlinking it, which
+:class:`TransExecutor` does once a batch completes.
+"""
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+import threading
+import weakref
+import numpy
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # python < 3.8
+    shared_memory = None
+
+__all__ = ["SharedArray", "SharedSchema"]
+
+# Segments created or attached in this process, by name
+_segments: Dict[str, "shared_memory.SharedMemory"] = {}
+# Arrays viewing each segment; views of views keep them alive through their base
+_views: Dict[str, List[weakref.ref]] = {}
+_lock = threading.Lock()
+
+
+def _segment(name: str) -> "shared_memory.SharedMemory":
+    with _lock:
+        shm = _segments.get(name)
+        if shm is None:
+            shm = _segments[name] = shared_memory.SharedMemory(name=name)
+        return shm
+
+
+def _alive(name: str) -> List[weakref.ref]:
+    return [ref for ref in _views.get(name, ()) if ref() is not None]
+
+
+class SharedArray:
+    """A handle to a NumPy array stored in shared memory. Pickling the handle only sends
+    the segment name, dtype and shape; the array is attached on first access.
+
+    Parameters
+    ----------
+    name: str
+        Name of the shared memory segment.
+    dtype: Any
+        Array data type descriptor, see numpy.lib.format.dtype_to_descr e.g. <f8.
+    shape: Tuple[int, ...]
+        Array shape.
+    """
+
+    def __init__(self, name: str, dtype: Any, shape: Tuple[int, ...]):
+        if shared_memory is None:
+            raise ImportError("Shared memory transport requires python >= 3.8.")
+        self.name = name
+        self.dtype = numpy.lib.format.descr_to_dtype(dtype)
+        self.shape = tuple(shape)
+
+    @classmethod
+    def from_array(cls, data: Any) -> "SharedArray":
+        """Copies an array into a new shared memory segment owned by this process."""
+        if shared_memory is None:
+            raise ImportError("Shared memory transport requires python >= 3.8.")
+        data = numpy.asarray(data)
+        if data.dtype.hasobject:
+            raise TypeError("Cannot share arrays of Python objects.")
+        shm = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+        with _lock:
+            _segments[shm.name] = shm
+        handle = cls(shm.name, numpy.lib.format.dtype_to_descr(data.dtype), data.shape)
+        view = numpy.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)
+        view[...] = data
+        del view
+        return handle
+
+    @property
+    def array(self) -> numpy.ndarray:
+        """Returns the array, a view of the shared memory segment."""
+        shm = _segment(self.name)
+        arr = numpy.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf)
+        with _lock:
+            _views[self.name] = _alive(self.name) + [weakref.ref(arr)]
+        return arr
+
+    @property
+    def nbytes(self) -> int:
+        return int(numpy.prod(self.shape)) * self.dtype.itemsize
+
+    def close(self) -> bool:
+        """Detaches the segment from this process. The segment stays attached while arrays
+        viewing it are alive, in which case False is returned."""
+        with _lock:
+            shm = _segments.get(self.name)
+            if shm is None:
+                return True
+            # Unmapping the segment while arrays view it would leave them dangling
+            if _alive(self.name):
+                return False
+            shm.close()
+            del _segments[self.name]
+            _views.pop(self.name, None)
+        return True
+
+    def unlink(self):
+        """Destroys the segment once all processes have detached from it."""
+        try:
+            _segment(self.name).unlink()
+        except FileNotFoundError:
+            pass
+
+    def __reduce__(self):
+        # dtype.str would reduce structured dtypes to raw void bytes
+        descr = numpy.lib.format.dtype_to_descr(self.dtype)
+        return type(self), (self.name, descr, self.shape)
+
+    def __repr__(self) -> str:
+        return (
+            f"SharedArray(name={self.name!r}, dtype={self.dtype!r}, shape={self.shape})"
+        )
+
+
+class SharedSchema:
+    """An MMSchema model whose array fields are stored in shared memory, to be carried by
+    InputTrans/OutputTrans as ``schema_object`` across processes without pickling the arrays.
+    Used as a context manager, the segments are destroyed on exit.
+
+    Parameters
+    ----------
+    model: Type
+        MMSchema model class e.g. mmelemental.models.Molecule.
+    arrays: Dict[str, SharedArray]
+        Array fields stored in shared memory.
+    fields: Dict[str, Any]
+        Other fields.
+    fields_set: Optional[Set[str]], optional
+        Fields explicitly set on the model.
+    """
+
+    def __init__(
+        self,
+        model: Type,
+        arrays: Dict[str, SharedArray],
+        fields: Dict[str, Any],
+        fields_set: Optional[Set[str]] = None,
+    ):
+        self.model = model
+        self.arrays = arrays
+        self.fields = fields
+        self.fields_set = fields_set
+
+    @classmethod
+    def from_schema(cls, schema_object: Any) -> "SharedSchema":
+        """Copies the array fields of an MMSchema model into shared memory."""
+        arrays, fields = {}, {}
+        for name in schema_object.__fields__:
+            value = getattr(schema_object, name)
+            if isinstance(value, numpy.ndarray) and not value.dtype.hasobject:
+                arrays[name] = SharedArray.from_array(value)
+            elif value is not None:
+                fields[name] = value
+        return cls(
+            type(schema_object), arrays, fields, set(schema_object.__fields_set__)
+        )
+
+    def to_schema(self, copy: bool = False) -> Any:
+        """Returns the MMSchema model, its array fields being views of the shared memory
+        segments unless ``copy`` is set."""
+        values = dict(self.fields)
+        for name, handle in self.arrays.items():
+            values[name] = handle.array.copy() if copy else handle.array
+        return self.model.construct(_fields_set=self.fields_set, **values)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(handle.nbytes for handle in self.arrays.values())
+
+    def close(self) -> bool:
+        """Detaches the segments from this process, see :meth:`SharedArray.close`."""
+        return all([handle.close() for handle in self.arrays.values()])
+
+    def unlink(self):
+        """Destroys the segments once all processes have detached from them."""
+        for handle in self.arrays.values():
+            handle.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.unlink()
+        self.close()
+        return False
@@ -0,0 +1,46 @@
+import abc
+from typing import Any, Iterable
+
+__all__ = ["ToolkitWriter"]
+
+
+class ToolkitWriter(abc.ABC):
+    """An abstract base class for incremental writers returned by :meth:`ToolkitModel.open_writer`.
+    MMSchema objects (e.g. trajectory frames or chunks of frames) are appended one at a time so
+    that writing runs in bounded memory.
+
+    Examples
+    --------
+    >>> with MdaTraj.open_writer("traj.dcd") as writer:
+    ...     for frames in MdaTraj.iter_schema("traj.trr", chunk_size=100):
+    ...         writer.write(frames)
+    """
+
+    @abc.abstractmethod
+    def write(self, schema_object: Any, **kwargs):
+        """Appends an MMSchema object to the file.
+        Parameters
+        ----------
+        schema_object : Any
+            MMSchema object e.g. a Trajectory holding one or more frames.
+        **kwargs
+            Additional kwargs to pass to the toolkit writer.
+        """
+        ...
+
+    @abc.abstractmethod
+    def close(self):
+        """Flushes and closes the underlying file."""
+        ...
+
+    def write_all(self, schema_objects: Iterable[Any], **kwargs):
+        """Appends every MMSchema object from an iterable e.g. :meth:`ToolkitModel.iter_schema`."""
+        for schema_object in schema_objects:
+            self.write(schema_object, **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -0,0 +1,200 @@
+"""
+planner.py
+Shortest-path routing of conversions between toolkits
+
+Nodes are toolkit data types (e.g. mdanalysis, parmed) plus MMSchema, and edges are the
+conversions offered by the installed translators: ``to_schema``, ``from_schema`` and direct
+toolkit-to-toolkit conversions declared via ``ToolkitModel.direct_dtypes``.
+"""
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+import heapq
+import itertools
+import threading
+from .mmic_translator import reg_trans
+from .registry import TransRegistry, trans_registry
+
+__all__ = [
+    "SCHEMA",
+    "ConversionStep",
+    "ConversionPlan",
+    "ConversionPlanner",
+    "conversion_planner",
+]
+
+SCHEMA = "mmschema"
+
+
+class ConversionStep(NamedTuple):
+    """A single conversion performed by a translator.
+
+    Attributes
+    ----------
+    method: str
+        One of to_schema, from_schema or to_toolkit.
+    translator: str
+        Translator performing the conversion e.g. mmic_mda.
+    source: str
+        Source data type e.g. mdanalysis or mmschema.
+    target: str
+        Target data type e.g. parmed or mmschema.
+    cost: float
+        Relative cost of the conversion.
+    """
+
+    method: str
+    translator: str
+    source: str
+    target: str
+    cost: float
+
+
+class ConversionPlan(NamedTuple):
+    """The cheapest sequence of conversions between two data types for a given model."""
+
+    model: str
+    steps: Tuple[ConversionStep, ...]
+
+    @property
+    def cost(self) -> float:
+        return sum(step.cost for step in self.steps)
+
+    def run(self, obj: Any, registry: Optional[TransRegistry] = None, **kwargs) -> Any:
+        """Executes the plan.
+
+        Parameters
+        ----------
+        obj: Any
+            ToolkitModel object, or MMSchema object if the plan starts from mmschema.
+        registry: Optional[TransRegistry], optional
+            Registry used to resolve translator model classes.
+        **kwargs
+            Additional kwargs to pass to every conversion.
+
+        Returns
+        -------
+        Any
+            ToolkitModel object, or MMSchema object if the plan ends at mmschema.
+
+        """
+        registry = registry or trans_registry
+        for step in self.steps:
+            if step.method == "to_schema":
+                obj = obj.to_schema(**kwargs)
+            elif step.method == "from_schema":
+                model_cls = registry.model_class(step.translator, self.model)
+                obj = model_cls.from_schema(obj, **kwargs)
+            else:
+                obj = obj.to_toolkit(step.target, **kwargs)
+        return obj
+
+
+class ConversionPlanner:
+    """Computes the cheapest route between any two data types from the translators' capabilities.
+    A round trip through MMSchema costs ``to_schema_cost + from_schema_cost``; translators
+    bypass it by declaring cheaper direct conversions in ``ToolkitModel.direct_dtypes``.
+
+    Parameters
+    ----------
+    registry: Optional[TransRegistry], optional
+        Capability registry of the installed translators.
+    to_schema_cost: float, optional
+        Cost of converting a toolkit object to MMSchema.
+    from_schema_cost: float, optional
+        Cost of converting an MMSchema object to a toolkit object.
+    """
+
+    def __init__(
+        self,
+        registry: Optional[TransRegistry] = None,
+        to_schema_cost: float = 1.0,
+        from_schema_cost: float = 1.0,
+    ):
+        self.registry = registry or trans_registry
+        self.to_schema_cost = to_schema_cost
+        self.from_schema_cost = from_schema_cost
+        self._lock = threading.Lock()
+        self._plans: Dict[Tuple[str, str, str], ConversionPlan] = {}
+        self._snapshot = None
+
+    def invalidate(self):
+        """Drops all cached plans."""
+        with self._lock:
+            self._plans = {}
+
+    def _edges(self, node: str, model: str, translators: Dict[str, str]):
+        if node == SCHEMA:
+            for tname, dtype in translators.items():
+                yield ConversionStep(
+                    "from_schema", tname, SCHEMA, dtype, self.from_schema_cost
+                )
+            return
+        for tname, dtype in translators.items():
+            if dtype != node:
+                continue
+            yield ConversionStep("to_schema", tname, node, SCHEMA, self.to_schema_cost)
+            # Direct conversions are only looked up (and the translator imported) when reached
+            model_cls = self.registry.model_class(tname, model)
+            for target, cost in (
+                getattr(model_cls, "direct_dtypes", None) or {}
+            ).items():
+                yield ConversionStep("to_toolkit", tname, node, target, cost)
+
+    def plan(self, source: str, target: str, model: str = "Molecule") -> ConversionPlan:
+        """Returns the cheapest conversion plan between two data types.
+
+        Parameters
+        ----------
+        source: str
+            Source data type e.g. parmed, or mmschema.
+        target: str
+            Target data type e.g. mdanalysis, or mmschema.
+        model: str, optional
+            Model name e.g. Molecule, ForceField, ...
+
+        Returns
+        -------
+        ConversionPlan
+            Sequence of conversions with the lowest total cost.
+
+        """
+        snapshot = tuple(reg_trans.items())
+        key = (source, target, model)
+        with self._lock:
+            if self._snapshot != snapshot:
+                self._plans, self._snapshot = {}, snapshot
+            plan = self._plans.get(key)
+        if plan is not None:
+            return plan
+
+        translators = {
+            tname: reg_trans[tname]
+            for tname in self.registry.installed_model(model)
+            if tname in reg_trans
+        }
+        # Dijkstra's algorithm over lazily expanded edges
+        counter = itertools.count()
+        queue = [(0.0, next(counter), source, ())]
+        done = set()
+        while queue:
+            cost, _, node, steps = heapq.heappop(queue)
+            if node == target:
+                plan = ConversionPlan(model, steps)
+                with self._lock:
+                    self._plans[key] = plan
+                return plan
+            if node in done:
+                continue
+            done.add(node)
+            for step in self._edges(node, model, translators):
+                if step.target not in done:
+                    heapq.heappush(
+                        queue,
+                        (cost + step.cost, next(counter), step.target, steps + (step,)),
+                    )
+
+        raise ValueError(
+            f"Could not find a conversion route from {source} to {target} for {model} models."
+        )
+
+
+conversion_planner = ConversionPlanner()
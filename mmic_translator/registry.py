@@ -0,0 +1,373 @@
+"""
+registry.py
+Capability registry for installed translators
+
+Maps (model kind, direction, file format) to an ordered list of translators.
+"""
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+import importlib
+import inspect
+import threading
+from .mmic_translator import reg_trans
+from .discovery import installed_translators, probe_trans_info, register_discovered
+
+__all__ = ["TransCapability", "TransRegistry", "trans_registry"]
+
+
+class TransCapability(NamedTuple):
+    """A translator able to handle a given (kind, direction, format) triplet."""
+
+    translator: str
+    priority: int = 0
+
+
+class TransRegistry:
+    """A lazily built, process-wide registry of translator capabilities.
+
+    Capabilities are read from the entry point metadata of each translator (see
+    :mod:`mmic_translator.discovery`) or, failing that, from the installed translator module's
+    ``<kind><direction>_ext_maps`` attribute e.g. ``molread_ext_maps`` via the on-disk
+    discovery cache. The registry is built
+    once on first lookup and rebuilt automatically when the registered translators change,
+    or explicitly via :meth:`invalidate`. Lookups restricted to translator names that are
+    not registered probe those translators too.
+
+    Parameters
+    ----------
+    trans: Dict[str, str], optional
+        Registered translators i.e. translator name: data type. Defaults to ``reg_trans``.
+    """
+
+    directions = ("read", "write")
+
+    def __init__(self, trans: Optional[Dict[str, str]] = None):
+        self._trans = reg_trans if trans is None else trans
+        self._kinds = {"mol": "Molecule", "ff": "ForceField", "traj": "Trajectory"}
+        self._priorities: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._snapshot = None
+        self._installed: Set[str] = set()
+        self._ext_maps: Dict[Tuple[str, str], Dict[str, Dict]] = {}
+        self._table: Dict[Tuple[str, str, str], List[TransCapability]] = {}
+        self._models: Dict[str, Tuple[str, ...]] = {}
+        # Capabilities of the unregistered translators passed to lookups, None if not installed
+        self._unregistered: Dict[str, Any] = {}
+        # Resolved classes, kept across rebuilds since they only depend on the translator
+        self._classes: Dict[Tuple[str, str], Any] = {}
+        self._members: Dict[Tuple[str, str], List[Tuple[str, type]]] = {}
+
+    @property
+    def kinds(self) -> Dict[str, str]:
+        """Returns the supported model kinds e.g. {"mol": "Molecule", ...}."""
+        return dict(self._kinds)
+
+    def kind_of(self, model: str) -> str:
+        """Returns the kind of a model e.g. kind_of("Molecule") -> "mol".
+
+        Parameters
+        ----------
+        model: str
+            MMSchema model name.
+
+        Raises
+        ------
+        ValueError
+            If no kind is registered for the model.
+        """
+        for kind, name in self._kinds.items():
+            if name == model:
+                return kind
+        raise ValueError(f"Unknown model {model}.")
+
+    def add_kind(self, kind: str, model: str):
+        """Registers a new model kind e.g. add_kind("top", "Topology"). Translators
+        advertise support for it via ``<kind>read_ext_maps`` and ``<kind>write_ext_maps``.
+
+        Parameters
+        ----------
+        kind: str
+            Prefix of the translator extension map attributes.
+        model: str
+            MMSchema model name.
+        """
+        with self._lock:
+            self._kinds[kind] = model
+            self.invalidate()
+
+    def set_priority(self, tname: str, priority: int):
+        """Sets the priority of a translator. When several translators support the same
+        format, higher priorities are preferred; ties are broken by registration order.
+
+        Parameters
+        ----------
+        tname: str
+            Translator name e.g. mmic_mda.
+        priority: int
+            Translator priority, 0 by default.
+        """
+        with self._lock:
+            self._priorities[tname] = priority
+            self.invalidate()
+
+    def invalidate(self):
+        """Drops all cached capabilities and resolved classes. The registry is rebuilt on the
+        next lookup."""
+        with self._lock:
+            self._snapshot = None
+            self._unregistered = {}
+            self._classes = {}
+            self._members = {}
+
+    def _ensure_built(self):
+        if self._snapshot is None:
+            register_discovered()
+        snapshot = tuple(self._trans.items())
+        if self._snapshot == snapshot:
+            return
+        with self._lock:
+            if self._snapshot == snapshot:
+                return
+            installed = installed_translators(set(self._trans))
+            ext_maps = {}
+            table = {}
+            models = {}
+            for order, tname in enumerate(self._trans):
+                if tname not in installed:
+                    continue
+                # Declared or disk-cached capabilities avoid importing the toolkits
+                info = probe_trans_info(tname)
+                models[tname] = info.models
+                priority = self._priorities.get(tname, 0)
+                for kind in self._kinds:
+                    for direc in self.directions:
+                        maps = info.ext_maps.get(f"{kind}{direc}")
+                        if maps is None:
+                            continue
+                        ext_maps.setdefault((kind, direc), {})[tname] = maps
+                        for fmt, supported in maps.items():
+                            if supported:
+                                table.setdefault((kind, direc, fmt), []).append(
+                                    (-priority, order, TransCapability(tname, priority))
+                                )
+            self._installed = installed
+            self._ext_maps = ext_maps
+            self._models = models
+            self._table = {
+                key: [cap for *_, cap in sorted(caps)] for key, caps in table.items()
+            }
+            self._snapshot = snapshot
+
+    def _extra(self, trans: Optional[Set[str]]) -> Dict[str, Any]:
+        """Returns the capabilities of the installed translators in ``trans`` that are not
+        registered, probed once per translator."""
+        if trans is None:
+            return {}
+        extra = {}
+        for tname in sorted(set(trans).difference(self._trans)):
+            if tname not in self._unregistered:
+                with self._lock:
+                    self._unregistered[tname] = (
+                        probe_trans_info(tname)
+                        if installed_translators({tname})
+                        else None
+                    )
+            if self._unregistered[tname] is not None:
+                extra[tname] = self._unregistered[tname]
+        return extra
+
+    def _check(self, kind: str, direction: str):
+        if kind not in self._kinds:
+            raise KeyError(
+                f"Unknown model kind {kind}, must be one of {list(self._kinds)}."
+            )
+        if direction not in self.directions:
+            raise KeyError(
+                f"Unknown direction {direction}, must be one of {self.directions}."
+            )
+
+    def installed(self) -> Set[str]:
+        """Returns the names of the registered translators that are installed."""
+        self._ensure_built()
+        return set(self._installed)
+
+    def installed_model(self, model: str) -> Set[str]:
+        """Returns the names of the installed translators supporting a specific model.
+
+        Parameters
+        ----------
+        model: str
+            Model name e.g. Molecule, ForceField, ...
+
+        Returns
+        -------
+        Set[str]
+            Translator names.
+
+        """
+        self._ensure_built()
+        return set(tname for tname, models in self._models.items() if model in models)
+
+    def model_class(self, tname: str, model: str):
+        """Returns the ToolkitModel subclass a translator uses for a specific model. Classes
+        are resolved once and memoized.
+
+        Parameters
+        ----------
+        tname: str
+            Translator name e.g. mmic_mda
+        model: str
+            Model name e.g. Molecule, ForceField, ...
+
+        Returns
+        -------
+        ToolkitModel
+            Translator model class e.g. MdaMol
+
+        """
+        key = (tname, model)
+        try:
+            return self._classes[key]
+        except KeyError:
+            pass
+        with self._lock:
+            model_cls = importlib.import_module(tname)._classes_map.get(model)
+            if model_cls is None:
+                raise ValueError(f"Translator {tname} does not support {model} models.")
+            self._classes[key] = model_cls
+        return model_cls
+
+    def members(self, tname: str, submodule: str) -> List[Tuple[str, type]]:
+        """Returns the classes defined in a translator submodule e.g. members("mmic_mda", "models").
+        Members are resolved once and memoized.
+
+        Parameters
+        ----------
+        tname: str
+            Translator name e.g. mmic_mda
+        submodule: str
+            Submodule name e.g. components, models.
+
+        Returns
+        -------
+        List[Tuple[str, type]]
+            List of (name, class) pairs as returned by ``inspect.getmembers``.
+
+        """
+        key = (tname, submodule)
+        try:
+            return list(self._members[key])
+        except KeyError:
+            pass
+        with self._lock:
+            mod = importlib.import_module(tname + "." + submodule)
+            members = self._members[key] = inspect.getmembers(mod, inspect.isclass)
+        return list(members)
+
+    def candidates(
+        self, kind: str, direction: str, fmt: str, trans: Optional[Set[str]] = None
+    ) -> List[TransCapability]:
+        """Returns the translators supporting a file format, in order of preference.
+
+        Parameters
+        ----------
+        kind: str
+            Model kind e.g. mol, ff, traj.
+        direction: str
+            Either read or write.
+        fmt: str
+            File format e.g. gro, pdb, etc.
+        trans: Optional[Set[str]], optional
+            Translator names to restrict the search to. Names that are not registered are
+            probed and ranked after registered translators of the same priority.
+
+        Returns
+        -------
+        List[TransCapability]
+            Translators and their priorities.
+
+        """
+        self._check(kind, direction)
+        self._ensure_built()
+        caps = self._table.get((kind, direction, fmt), [])
+        if trans is None:
+            return list(caps)
+        caps = [cap for cap in caps if cap.translator in trans]
+        extra = [
+            TransCapability(tname, self._priorities.get(tname, 0))
+            for tname, info in self._extra(trans).items()
+            if info.ext_maps.get(f"{kind}{direction}", {}).get(fmt)
+        ]
+        if extra:
+            # Stable sort: registration order is kept among translators of equal priority
+            caps = sorted(caps + extra, key=lambda cap: -cap.priority)
+        return caps
+
+    def lookup(
+        self, kind: str, direction: str, fmt: str, trans: Optional[Set[str]] = None
+    ) -> Optional[str]:
+        """Returns the preferred translator supporting a file format, or None.
+
+        Parameters
+        ----------
+        kind: str
+            Model kind e.g. mol, ff, traj.
+        direction: str
+            Either read or write.
+        fmt: str
+            File format e.g. gro, pdb, etc.
+        trans: Optional[Set[str]], optional
+            Translator names to restrict the search to, see :meth:`candidates`.
+
+        Returns
+        -------
+        str or None
+            Translator name e.g. mmic_mda
+
+        """
+        self._check(kind, direction)
+        self._ensure_built()
+        if self._extra(trans):
+            caps = self.candidates(kind, direction, fmt, trans)
+            return caps[0].translator if caps else None
+        for cap in self._table.get((kind, direction, fmt), ()):
+            if trans is None or cap.translator in trans:
+                return cap.translator
+        return None
+
+    def ext_maps(
+        self, kind: str, direction: str, trans: Optional[Set[str]] = None
+    ) -> Dict[str, Dict]:
+        """Returns a Dict of translators and the file formats they support.
+
+        Parameters
+        ----------
+        kind: str
+            Model kind e.g. mol, ff, traj.
+        direction: str
+            Either read or write.
+        trans: Optional[Set[str]], optional
+            Translator names to restrict the search to. Names that are not registered are
+            probed.
+
+        Returns
+        -------
+        Dict[str, Dict]
+            Dictionary of translator names: dictionary of file formats.
+
+        """
+        self._check(kind, direction)
+        self._ensure_built()
+        maps = self._ext_maps.get((kind, direction), {})
+        ext_maps = {
+            tname: ext_map
+            for tname, ext_map in maps.items()
+            if trans is None or tname in trans
+        }
+        for tname, info in self._extra(trans).items():
+            ext_map = info.ext_maps.get(f"{kind}{direction}")
+            if ext_map is not None:
+                ext_maps[tname] = ext_map
+        return ext_maps
+
+
+trans_registry = TransRegistry()
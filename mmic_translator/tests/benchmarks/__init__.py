@@ -0,0 +1,8 @@
+"""
+Benchmarks for translator dispatch and conversion hot paths, run with pytest-benchmark e.g.
+pytest mmic_translator/tests/benchmarks --benchmark-only
+
+CI saves the timings of each run under .benchmarks and fails when a mean time regresses by
+more than 25% over the previous run on the same OS and Python version. Locally, save a
+baseline with --benchmark-autosave and compare to it with --benchmark-compare.
+"""
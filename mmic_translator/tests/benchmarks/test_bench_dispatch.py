@@ -0,0 +1,61 @@
+"""
+Benchmarks of package import and translator dispatch.
+"""
+
+import subprocess
+import sys
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+from mmic_translator.components import TransComponent
+from mmic_translator.registry import trans_registry
+
+kinds = {"mol": "stub", "ff": "stubff", "traj": "stub"}
+directions = ("read", "write")
+
+
+def test_import(benchmark):
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", "import mmic_translator"],),
+        kwargs={"check": True},
+        rounds=5,
+    )
+
+
+def test_import_components(benchmark):
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", "import mmic_translator.components"],),
+        kwargs={"check": True},
+        rounds=5,
+    )
+
+
+@pytest.mark.parametrize("kind", kinds)
+@pytest.mark.parametrize("direction", directions)
+def test_find_tk(benchmark, stub_trans, kind, direction):
+    find_tk = getattr(TransComponent, f"find_{kind}{direction}_tk")
+    assert benchmark(find_tk, kinds[kind]) == stub_trans
+
+
+@pytest.mark.parametrize("kind", kinds)
+@pytest.mark.parametrize("direction", directions)
+def test_find_tk_cold(benchmark, stub_trans, kind, direction):
+    find_tk = getattr(TransComponent, f"find_{kind}{direction}_tk")
+    result = benchmark.pedantic(
+        find_tk, args=(kinds[kind],), setup=trans_registry.invalidate, rounds=20
+    )
+    assert result == stub_trans
+
+
+def test_installed_comps(benchmark, stub_trans):
+    assert stub_trans in benchmark(TransComponent.installed_comps)
+
+
+def test_installed_comps_model(benchmark, stub_trans):
+    assert stub_trans in benchmark(TransComponent.installed_comps_model, "Molecule")
+
+
+def test_find_trans(benchmark, stub_trans):
+    assert benchmark(TransComponent.find_trans, "stub") == stub_trans
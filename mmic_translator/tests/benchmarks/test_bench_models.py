@@ -0,0 +1,58 @@
+"""
+Benchmarks of model construction and translation round trips.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+from mmic_translator.models import InputTrans, OutputTrans
+
+natoms = (10, 1000, 100000)
+
+
+def test_input_trans(benchmark):
+    benchmark(InputTrans, schema_name="stub", schema_version=1, data_object=1)
+
+
+def test_output_trans(benchmark):
+    benchmark(
+        OutputTrans,
+        schema_name="stub",
+        schema_version=1,
+        success=True,
+        schema_object=1,
+    )
+
+
+@pytest.mark.parametrize("natoms", natoms)
+def test_toolkit_model(benchmark, stub, natoms):
+    benchmark(stub.StubMol, data=stub.StubSystem.random(natoms))
+
+
+@pytest.mark.parametrize("natoms", natoms)
+def test_toolkit_model_trusted(benchmark, stub, natoms):
+    benchmark(stub.StubMol.trusted, stub.StubSystem.random(natoms))
+
+
+@pytest.mark.parametrize("natoms", natoms)
+def test_mol_to_schema(benchmark, stub, natoms):
+    tkmol = stub.StubMol(data=stub.StubSystem.random(natoms))
+    benchmark(tkmol.to_schema)
+
+
+@pytest.mark.parametrize("natoms", natoms)
+def test_mol_round_trip(benchmark, stub, natoms):
+    mol = stub.StubMol(data=stub.StubSystem.random(natoms)).to_schema()
+    benchmark(lambda: stub.StubMol.from_schema(mol).to_schema())
+
+
+@pytest.mark.parametrize("natoms", natoms)
+def test_ff_round_trip(benchmark, stub, natoms):
+    ff = stub.StubFF(data=stub.StubForceField.random(natoms)).to_schema()
+    benchmark(lambda: stub.StubFF.from_schema(ff).to_schema())
+
+
+@pytest.mark.parametrize("natoms,nframes", [(1000, 10), (1000, 1000)])
+def test_traj_round_trip(benchmark, stub, natoms, nframes):
+    traj = stub.StubTraj(data=stub.StubSystem.random(natoms, nframes)).to_schema()
+    benchmark(lambda: stub.StubTraj.from_schema(traj).to_schema())
@@ -0,0 +1,40 @@
+import os
+import sys
+import pytest
+from mmic_translator import discovery
+
+stubs_dir = os.path.join(os.path.dirname(__file__), "stubs")
+
+
+@pytest.fixture(autouse=True)
+def discovery_cache_dir(tmp_path, monkeypatch):
+    """Isolates the on-disk discovery cache of each test."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("MMIC_TRANSLATOR_CACHE_DIR", str(path))
+    monkeypatch.setattr(discovery, "_probed", None)
+    return path
+
+
+@pytest.fixture(scope="session")
+def stub_trans():
+    """Registers the synthetic mmic_stub and mmic_stub2 translators (see tests/stubs) in reg_trans."""
+    pytest.importorskip("mmelemental")
+    from mmic_translator.mmic_translator import reg_trans
+    from mmic_translator.registry import trans_registry
+
+    sys.path.insert(0, stubs_dir)
+    reg_trans["mmic_stub"] = "stub"
+    reg_trans["mmic_stub2"] = "stub2"
+    trans_registry.invalidate()
+    yield "mmic_stub"
+    del reg_trans["mmic_stub"], reg_trans["mmic_stub2"]
+    sys.path.remove(stubs_dir)
+    trans_registry.invalidate()
+
+
+@pytest.fixture
+def stub(stub_trans):
+    """Returns the mmic_stub module, see :func:`stub_trans`."""
+    import mmic_stub
+
+    return mmic_stub
@@ -0,0 +1,23 @@
+"""
+mmic_stub
+A synthetic translator backed by pure NumPy data objects, used to test and benchmark
+the framework's own overhead without any real toolkit (MDAnalysis, ParmEd, ...) installed.
+
+Register it at test time with the ``stub_trans`` fixture in mmic_translator/tests/conftest.py.
+"""
+
+from . import models, components
+from .data import StubSystem, StubForceField
+from .models import StubMol, StubFF, StubTraj
+from .components import StubComponent
+
+molread_ext_maps = {"stub": "stub"}
+molwrite_ext_maps = {"stub": "stub"}
+ffread_ext_maps = {"stubff": "stubff"}
+ffwrite_ext_maps = {"stubff": "stubff"}
+trajread_ext_maps = {"stub": "stub"}
+trajwrite_ext_maps = {"stub": "stub"}
+
+_classes_map = {"Molecule": StubMol, "ForceField": StubFF, "Trajectory": StubTraj}
+
+__version__ = "0.0.0"
@@ -0,0 +1,25 @@
+"""
+mmic_stub translates through its models; StubComponent only runs MMSchema round trips
+through StubMol, e.g. to exercise TransExecutor.
+"""
+from typing import Any, Dict, Union
+from mmic_translator.components import TransComponent
+from mmic_translator.models import InputTrans, OutputTrans
+from .models import StubMol
+
+__all__ = ["StubComponent"]
+
+
+class StubComponent(TransComponent):
+    @classmethod
+    def compute(cls, inputs: Union[Dict[str, Any], InputTrans]) -> OutputTrans:
+        if isinstance(inputs, dict):
+            inputs = cls.input(**inputs)
+        return OutputTrans.trusted(
+            schema_object=StubMol.from_schema(
+                inputs.schema_object, data_units=inputs.data_units
+            ).to_schema(),
+            schema_name=inputs.schema_name,
+            schema_version=inputs.schema_version,
+            success=True,
+        )
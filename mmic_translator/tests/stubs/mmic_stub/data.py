@@ -0,0 +1,137 @@
+from typing import Optional
+import numpy
+
+__all__ = ["StubSystem", "StubForceField"]
+
+
+class StubSystem:
+    """A toolkit-like data object storing a system of atoms and its trajectory as NumPy arrays.
+
+    Parameters
+    ----------
+    symbols: numpy.ndarray
+        Atomic symbols of shape (natoms,).
+    positions: numpy.ndarray
+        Atomic positions in angstrom of shape (nframes, natoms, 3).
+    velocities: Optional[numpy.ndarray], optional
+        Atomic velocities in angstrom/femtosecond of shape (nframes, natoms, 3).
+    timestep: float, optional
+        Time between frames in femtosecond.
+
+    Attributes
+    ----------
+    revision: int
+        Incremented whenever the symbols or timestep are set, like the topology revision
+        counters some toolkits maintain.
+    """
+
+    def __init__(
+        self,
+        symbols: numpy.ndarray,
+        positions: numpy.ndarray,
+        velocities: Optional[numpy.ndarray] = None,
+        timestep: float = 1.0,
+    ):
+        self.revision = 0
+        self.symbols = numpy.asarray(symbols)
+        self.positions = numpy.asarray(positions)
+        self.velocities = velocities
+        self.timestep = timestep
+
+    @property
+    def symbols(self) -> numpy.ndarray:
+        return self._symbols
+
+    @symbols.setter
+    def symbols(self, value: numpy.ndarray):
+        self._symbols = value
+        self.revision += 1
+
+    @property
+    def timestep(self) -> float:
+        return self._timestep
+
+    @timestep.setter
+    def timestep(self, value: float):
+        self._timestep = value
+        self.revision += 1
+
+    @property
+    def natoms(self) -> int:
+        return self.positions.shape[1]
+
+    @property
+    def nframes(self) -> int:
+        return self.positions.shape[0]
+
+    def subset(self, frames=slice(None), atoms=slice(None)) -> "StubSystem":
+        """Returns a system restricted to the frames and atoms given as NumPy indices."""
+        return StubSystem(
+            symbols=self.symbols[atoms],
+            positions=self.positions[frames][:, atoms],
+            velocities=None
+            if self.velocities is None
+            else self.velocities[frames][:, atoms],
+            timestep=self.timestep,
+        )
+
+    @classmethod
+    def random(
+        cls, natoms: int = 100, nframes: int = 1, seed: int = 0, dtype=numpy.float64
+    ) -> "StubSystem":
+        """Generates a system of ``natoms`` carbon atoms with random positions and velocities
+        over ``nframes`` frames."""
+        rng = numpy.random.default_rng(seed)
+        return cls(
+            symbols=numpy.full(natoms, "C"),
+            positions=rng.random((nframes, natoms, 3)).astype(dtype) * 10.0,
+            velocities=rng.standard_normal((nframes, natoms, 3)).astype(dtype),
+        )
+
+    @classmethod
+    def load(cls, filename: str) -> "StubSystem":
+        with numpy.load(filename) as data:
+            return cls(
+                symbols=data["symbols"],
+                positions=data["positions"],
+                velocities=data["velocities"] if "velocities" in data else None,
+                timestep=float(data["timestep"]),
+            )
+
+    def save(self, filename: str):
+        arrays = {"symbols": self.symbols, "positions": self.positions}
+        if self.velocities is not None:
+            arrays["velocities"] = self.velocities
+        with open(filename, "wb") as fp:
+            numpy.savez(fp, timestep=self.timestep, **arrays)
+
+
+class StubForceField:
+    """A toolkit-like data object storing per-atom force field parameters as NumPy arrays."""
+
+    def __init__(
+        self, symbols: numpy.ndarray, charges: numpy.ndarray, masses: numpy.ndarray
+    ):
+        self.symbols = numpy.asarray(symbols)
+        self.charges = numpy.asarray(charges)
+        self.masses = numpy.asarray(masses)
+
+    @classmethod
+    def random(cls, natoms: int = 100, seed: int = 0) -> "StubForceField":
+        rng = numpy.random.default_rng(seed)
+        return cls(
+            symbols=numpy.full(natoms, "C"),
+            charges=rng.uniform(-1.0, 1.0, natoms),
+            masses=numpy.full(natoms, 12.011),
+        )
+
+    @classmethod
+    def load(cls, filename: str) -> "StubForceField":
+        with numpy.load(filename) as data:
+            return cls(data["symbols"], data["charges"], data["masses"])
+
+    def save(self, filename: str):
+        with open(filename, "wb") as fp:
+            numpy.savez(
+                fp, symbols=self.symbols, charges=self.charges, masses=self.masses
+            )
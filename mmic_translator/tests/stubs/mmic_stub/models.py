@@ -0,0 +1,224 @@
+from typing import Any, Dict, Iterator, List, Optional
+from cmselemental.util.decorators import classproperty
+from mmelemental.models import Molecule, ForceField, Trajectory
+from mmic_translator.models import ToolkitModel, ToolkitWriter, ArrayBuffer
+from mmic_translator.models import select_indices, ColumnarBatch
+from .data import StubSystem, StubForceField
+import numpy
+
+__all__ = ["StubMol", "StubFF", "StubTraj"]
+
+# Units of the arrays of StubSystem objects unless data_units says otherwise
+_UNITS = {"geometry": "angstrom", "velocities": "angstrom/femtosecond"}
+
+
+class StubModel(ToolkitModel):
+    @classproperty
+    def engine(cls):
+        return "stub", "0.0.0"
+
+    @classproperty
+    def dtype(cls):
+        return "stub"
+
+    def units(self, name: str) -> str:
+        """Returns the units of an array of the data object, angstrom based by default."""
+        return (self.data_units or {}).get(name, _UNITS[name])
+
+
+class StubMol(StubModel):
+    """A model for a single frame of a StubSystem object."""
+
+    @classproperty
+    def direct_dtypes(cls) -> Dict[str, float]:
+        return {"stub2": 0.5}
+
+    def to_toolkit(self, dtype: str, **kwargs) -> ToolkitModel:
+        if dtype == "stub2":
+            # Both toolkits share the same arrays, no copy or MMSchema model needed
+            from mmic_stub2 import _classes_map
+
+            return _classes_map[self.schema_model].trusted(
+                self.data, data_units=self.data_units
+            )
+        return super().to_toolkit(dtype, **kwargs)
+
+    @classmethod
+    def isvalid(cls, data):
+        if not isinstance(data, StubSystem):
+            raise ValueError(f"Invalid data object: {type(data)}.")
+        return data
+
+    @classmethod
+    def from_file(cls, filename: str, dtype: str = None, **kwargs):
+        return cls(data=StubSystem.load(filename))
+
+    @classmethod
+    def from_schema(cls, data: Molecule, version: Optional[str] = None, **kwargs):
+        # Positions are kept in the units of the Molecule, converted back by to_schema
+        return cls.trusted(
+            StubSystem(data.symbols, data.geometry.reshape(1, -1, 3)),
+            data_units={"geometry": data.geometry_units},
+        )
+
+    @classmethod
+    def from_columnar(
+        cls, batch: ColumnarBatch, version: Optional[str] = None, **kwargs
+    ) -> List["StubMol"]:
+        # Systems are views of the packed columns
+        units = batch.fields.get(
+            "geometry_units", [batch.constants.get("geometry_units")] * len(batch)
+        )
+        return [
+            cls.trusted(
+                StubSystem(
+                    batch.column("symbols", i),
+                    batch.column("geometry", i).reshape(1, -1, 3),
+                ),
+                data_units={"geometry": units[i]} if units[i] else None,
+            )
+            for i in range(len(batch))
+        ]
+
+    def select(self, frames=None, atoms=None) -> "StubMol":
+        return self.trusted(
+            self.data.subset(
+                select_indices(frames, self.data.nframes),
+                select_indices(atoms, self.data.natoms),
+            ),
+            data_units=self.data_units,
+        )
+
+    def to_file(self, filename: str, dtype: str = None, **kwargs):
+        self.data.save(filename)
+
+    def schema_fields(self, version: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        return {
+            "symbols": lambda: self.data.symbols,
+            "geometry": lambda: self.data.positions[0].flatten(),
+        }
+
+    def to_schema(self, version: Optional[str] = None, **kwargs) -> Molecule:
+        return Molecule(
+            symbols=self.data.symbols, geometry=self.data.positions[0].flatten()
+        )
+
+    def topology_version(self) -> int:
+        return self.data.revision
+
+    def buffers(self) -> Dict[str, ArrayBuffer]:
+        return {"geometry": ArrayBuffer(self.data.positions[0], self.units("geometry"))}
+
+
+class StubFF(StubModel):
+    """A model for StubForceField objects."""
+
+    @classmethod
+    def isvalid(cls, data):
+        if not isinstance(data, StubForceField):
+            raise ValueError(f"Invalid data object: {type(data)}.")
+        return data
+
+    @classmethod
+    def from_file(cls, filename: str, dtype: str = None, **kwargs):
+        return cls(data=StubForceField.load(filename))
+
+    @classmethod
+    def from_schema(cls, data: ForceField, version: Optional[str] = None, **kwargs):
+        return cls.trusted(StubForceField(data.symbols, data.charges, data.masses))
+
+    def to_file(self, filename: str, dtype: str = None, **kwargs):
+        self.data.save(filename)
+
+    def to_schema(self, version: Optional[str] = None, **kwargs) -> ForceField:
+        return ForceField(
+            symbols=self.data.symbols,
+            charges=self.data.charges,
+            masses=self.data.masses,
+        )
+
+
+class StubTrajWriter(ToolkitWriter):
+    """Appends trajectory frames in memory and saves them on close."""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.symbols = None
+        self.positions = []
+        self.timestep = 1.0
+
+    def write(self, schema_object: Trajectory, **kwargs):
+        traj = StubTraj.from_schema(schema_object).data
+        self.symbols, self.timestep = traj.symbols, traj.timestep
+        self.positions.append(traj.positions)
+
+    def close(self):
+        StubSystem(
+            self.symbols, numpy.concatenate(self.positions), timestep=self.timestep
+        ).save(self.filename)
+
+
+class StubTraj(StubMol):
+    """A model for all frames of a StubSystem object."""
+
+    @classproperty
+    def selectable(cls) -> frozenset:
+        return frozenset({"frames", "atoms"})
+
+    @classmethod
+    def from_file(
+        cls, filename: str, dtype: str = None, frames=None, atoms=None, **kwargs
+    ):
+        return cls(data=StubSystem.load(filename)).select(frames=frames, atoms=atoms)
+
+    @classmethod
+    def from_schema(cls, data: Trajectory, version: Optional[str] = None, **kwargs):
+        positions = data.geometry.reshape(data.nframes, data.natoms, 3)
+        symbols = numpy.full(data.natoms, "C")
+        return cls.trusted(StubSystem(symbols, positions, timestep=data.timestep))
+
+    @classmethod
+    def iter_schema(
+        cls,
+        filename: str,
+        dtype: str = None,
+        chunk_size: Optional[int] = None,
+        version: Optional[str] = None,
+        frames=None,
+        atoms=None,
+        **kwargs,
+    ) -> Iterator[Trajectory]:
+        data = StubSystem.load(filename)
+        indices = numpy.arange(data.nframes)[select_indices(frames, data.nframes)]
+        atoms = select_indices(atoms, data.natoms)
+        chunk_size = chunk_size or 1
+        for start in range(0, len(indices), chunk_size):
+            chunk = data.subset(indices[start : start + chunk_size], atoms)
+            yield cls.trusted(chunk).to_schema(version=version)
+
+    @classmethod
+    def open_writer(cls, filename: str, dtype: str = None, **kwargs) -> StubTrajWriter:
+        return StubTrajWriter(filename)
+
+    def schema_fields(self, version: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        return {
+            "natoms": lambda: self.data.natoms,
+            "nframes": lambda: self.data.nframes,
+            "timestep": lambda: self.data.timestep,
+        }
+
+    def to_schema(self, version: Optional[str] = None, **kwargs) -> Trajectory:
+        return Trajectory(
+            geometry=self.data.positions.flatten(),
+            natoms=self.data.natoms,
+            nframes=self.data.nframes,
+            timestep=self.data.timestep,
+        )
+
+    def buffers(self) -> Dict[str, ArrayBuffer]:
+        buffers = {"geometry": ArrayBuffer(self.data.positions, self.units("geometry"))}
+        if self.data.velocities is not None:
+            buffers["velocities"] = ArrayBuffer(
+                self.data.velocities, self.units("velocities")
+            )
+        return buffers
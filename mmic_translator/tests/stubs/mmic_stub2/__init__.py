@@ -0,0 +1,17 @@
+"""
+mmic_stub2
+A second synthetic translator exposing mmic_stub's data objects under the stub2 data type,
+used to test conversions between toolkits.
+"""
+
+from . import models
+from .models import Stub2Mol, Stub2FF, Stub2Traj
+
+molread_ext_maps = {"stub2": "stub2"}
+molwrite_ext_maps = {"stub2": "stub2"}
+trajread_ext_maps = {"stub2": "stub2"}
+trajwrite_ext_maps = {"stub2": "stub2"}
+
+_classes_map = {"Molecule": Stub2Mol, "ForceField": Stub2FF, "Trajectory": Stub2Traj}
+
+__version__ = "0.0.0"
@@ -0,0 +1,31 @@
+from typing import Dict
+from cmselemental.util.decorators import classproperty
+from mmic_stub.models import StubMol, StubFF, StubTraj
+
+__all__ = ["Stub2Mol", "Stub2FF", "Stub2Traj"]
+
+
+class Stub2Mol(StubMol):
+    @classproperty
+    def dtype(cls):
+        return "stub2"
+
+    @classproperty
+    def direct_dtypes(cls) -> Dict[str, float]:
+        return {}
+
+
+class Stub2FF(StubFF):
+    @classproperty
+    def dtype(cls):
+        return "stub2"
+
+
+class Stub2Traj(StubTraj):
+    @classproperty
+    def dtype(cls):
+        return "stub2"
+
+    @classproperty
+    def direct_dtypes(cls) -> Dict[str, float]:
+        return {}
@@ -0,0 +1,68 @@
+"""
+Unit tests for the memory-mappable binary container of MMSchema models.
+"""
+
+import pytest
+
+pytest.importorskip("mmelemental")
+import numpy
+from mmelemental.models import Molecule, Trajectory
+from mmic_translator.models import load_schema, save_schema
+
+
+def test_molecule_round_trip(tmp_path):
+    mol = Molecule(symbols=["C", "H", "H"], geometry=numpy.arange(9.0), name="test")
+    fname = str(tmp_path / "mol.mmb")
+    save_schema(mol, fname)
+
+    loaded = load_schema(fname)
+    assert isinstance(loaded, Molecule)
+    assert isinstance(loaded.geometry, numpy.memmap)
+    assert loaded.geometry.ctypes.data % 64 == 0
+    numpy.testing.assert_array_equal(loaded.geometry, mol.geometry)
+    numpy.testing.assert_array_equal(loaded.symbols, mol.symbols)
+    assert loaded.name == "test"
+    assert loaded.provenance == mol.provenance
+    assert loaded.__fields_set__ == mol.__fields_set__
+
+    validated = load_schema(fname, mmap_mode=None, validate=True)
+    assert not isinstance(validated.geometry, numpy.memmap)
+    numpy.testing.assert_array_equal(validated.geometry, mol.geometry)
+
+
+def test_trajectory_round_trip(tmp_path):
+    traj = Trajectory(
+        geometry=numpy.random.rand(4 * 5 * 3),
+        natoms=5,
+        nframes=4,
+        timestep=1.0,
+    )
+    fname = str(tmp_path / "traj.mmb")
+    save_schema(traj, fname)
+    loaded = load_schema(fname, mmap_mode="c")
+    assert loaded.geometry.dtype == traj.geometry.dtype
+    loaded.geometry[:] = 0
+    numpy.testing.assert_array_equal(load_schema(fname).geometry, traj.geometry)
+
+
+def test_bad_file(tmp_path):
+    fname = tmp_path / "bad.mmb"
+    fname.write_bytes(b"\x00" * 64)
+    with pytest.raises(ValueError):
+        load_schema(str(fname))
+
+
+def test_structured_and_aliased_fields(tmp_path):
+    mol = Molecule(
+        symbols=["C", "C", "O"],
+        geometry=numpy.arange(9.0),
+        masses=[12.0, 12.0, 16.0],
+        connectivity=[(0, 1, 1.0), (1, 2, 2.0)],
+    )
+    fname = str(tmp_path / "mol.mmb")
+    save_schema(mol, fname)
+
+    for loaded in (load_schema(fname), load_schema(fname, validate=True)):
+        assert loaded.connectivity.dtype == mol.connectivity.dtype
+        assert loaded.connectivity.tolist() == mol.connectivity.tolist()
+        numpy.testing.assert_array_equal(loaded.masses, mol.masses)
@@ -0,0 +1,27 @@
+"""
+Unit tests for zero-copy array sharing.
+"""
+
+import pytest
+
+numpy = pytest.importorskip("numpy")
+from mmic_translator.models.buffers import share_array
+
+
+def test_share_array_no_copy():
+    positions = numpy.zeros((10, 3), dtype=numpy.float32)
+    shared = share_array(positions)
+    assert numpy.shares_memory(shared, positions)
+    shared = share_array(memoryview(positions))
+    assert numpy.shares_memory(shared, positions)
+
+
+def test_share_array_explicit_copy():
+    positions = numpy.zeros((10, 3), dtype=numpy.float32)
+    with pytest.raises(ValueError):
+        share_array(positions, dtype=numpy.float64)
+    with pytest.raises(ValueError):
+        share_array(positions.tolist())
+    copied = share_array(positions, dtype=numpy.float64, copy=True)
+    assert copied.dtype == numpy.float64
+    assert not numpy.shares_memory(copied, positions)
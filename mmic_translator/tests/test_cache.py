@@ -0,0 +1,105 @@
+"""
+Unit tests for the content-addressed translation result cache.
+"""
+
+import os
+import pytest
+
+pytest.importorskip("mmelemental")
+import numpy
+from mmic_translator.cache import TransCache, digest
+from mmic_translator.components import TransComponent
+from mmic_translator.models import OutputTrans
+
+
+def test_digest():
+    arr = numpy.arange(6, dtype=float)
+    assert digest({"a": arr, "b": [1, "x"]}) == digest({"b": [1, "x"], "a": arr.copy()})
+    assert digest(arr) != digest(arr.astype("f4"))
+    assert digest(arr) != digest(arr.reshape(2, 3))
+    # Structured arrays with the same bytes but different fields
+    assert digest(numpy.zeros(2, dtype=[("a", "<i4"), ("b", "<f4")])) != digest(
+        numpy.zeros(2, dtype=[("x", "<f4"), ("y", "<i4")])
+    )
+    with pytest.raises(TypeError):
+        digest(lambda: None)
+
+
+def test_digest_file(tmp_path):
+    fname = tmp_path / "in.txt"
+    fname.write_text("abc")
+    key = digest(str(fname))
+    assert digest(fname) == key
+    stat = os.stat(fname)
+    os.utime(fname, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert digest(str(fname)) != key
+
+
+def test_cache_memory_and_disk(discovery_cache_dir):
+    cache = TransCache(maxsize=2)
+    keys = [TransCache.key(i, "mmic_stub", "1.0") for i in range(3)]
+    assert TransCache.key(0, "mmic_stub", "1.1") != keys[0]
+    assert TransCache.key(0, "mmic_stub", "1.0", frame=1) != keys[0]
+    for i, key in enumerate(keys):
+        cache.put(key, i)
+    assert len(cache) == 2
+
+    # Evicted from memory but still found on disk, including by another process
+    assert cache.get(keys[0]) == 0
+    assert TransCache().get(keys[1]) == 1
+    assert TransCache(path="").get(keys[1]) is None
+
+    cache.clear()
+    assert TransCache().get(keys[2]) is None
+
+
+def test_cache_disk_eviction(tmp_path):
+    cache = TransCache(max_bytes=5000, path=str(tmp_path))
+    for i in range(10):
+        cache.put(str(i), numpy.zeros(100))
+        os.utime(tmp_path / f"{i}.pkl", ns=(i, i))
+    remaining = sorted(int(fname[:-4]) for fname in os.listdir(tmp_path))
+    assert sum(os.path.getsize(tmp_path / f"{i}.pkl") for i in remaining) <= 5000
+    assert remaining == list(range(10 - len(remaining), 10))
+
+
+def test_compute_cached(stub):
+    calls = []
+
+    class CountingComponent(TransComponent):
+        @classmethod
+        def compute(cls, inputs):
+            calls.append(inputs)
+            return OutputTrans.trusted(
+                schema_object=inputs.schema_object,
+                schema_name=inputs.schema_name,
+                schema_version=inputs.schema_version,
+                success=True,
+            )
+
+    cache = TransCache(path="")
+    inputs = {
+        "schema_object": stub.StubMol(data=stub.StubSystem.random(5)).to_schema(),
+        "schema_name": "test",
+        "schema_version": 1,
+    }
+    first = CountingComponent.compute_cached(inputs, cache=cache)
+    assert CountingComponent.compute_cached(inputs, cache=cache) is first
+    assert len(calls) == 1
+
+    # Unpicklable inputs bypass the cache
+    inputs = {"data_object": lambda: None, "schema_name": "test", "schema_version": 1}
+    CountingComponent.compute_cached(inputs, cache=cache)
+    CountingComponent.compute_cached(inputs, cache=cache)
+    assert len(calls) == 3
+
+
+def test_from_file_cached(stub, tmp_path):
+    fname = str(tmp_path / "in.stub")
+    stub.StubSystem.random(5, seed=1).save(fname)
+    cache = TransCache(path=str(tmp_path / "results"))
+    mol = TransComponent.from_file_cached(fname, cache=cache)
+    assert TransComponent.from_file_cached(fname, cache=cache) is mol
+
+    stub.StubSystem.random(7, seed=2).save(fname)
+    assert len(TransComponent.from_file_cached(fname, cache=cache).symbols) == 7
@@ -0,0 +1,50 @@
+"""
+Unit tests for the columnar transport of MMSchema objects.
+"""
+
+import pickle
+import pytest
+
+pytest.importorskip("mmelemental")
+import numpy
+from mmelemental.models import Molecule
+from mmic_translator.components import TransComponent
+from mmic_translator.models import ColumnarBatch
+
+
+def test_pack_unpack():
+    mols = [
+        Molecule(symbols=["C"] * n, geometry=numpy.arange(3.0 * n), name=f"mol{n}")
+        for n in (1, 3, 2)
+    ]
+    batch = ColumnarBatch.from_schema(mols)
+    assert len(batch) == 3
+    assert batch.columns["geometry"].shape == (18,)
+    assert batch.offsets["symbols"].tolist() == [0, 1, 4, 6]
+
+    batch = pickle.loads(pickle.dumps(batch))
+    for mol, unpacked in zip(mols, batch.to_schema()):
+        assert isinstance(unpacked, Molecule)
+        numpy.testing.assert_array_equal(unpacked.geometry, mol.geometry)
+        numpy.testing.assert_array_equal(unpacked.symbols, mol.symbols)
+        assert unpacked.name == mol.name
+    assert numpy.shares_memory(batch[-1].geometry, batch.columns["geometry"])
+    with pytest.raises(IndexError):
+        batch[3]
+
+
+def test_pickle_size():
+    mols = [Molecule(symbols=["C"] * 3, geometry=numpy.zeros(9)) for _ in range(200)]
+    batch = ColumnarBatch.from_schema(mols)
+    assert len(pickle.dumps(batch)) < len(pickle.dumps(mols)) / 2
+
+
+def test_compute_batch_columnar(stub):
+    systems = [stub.StubSystem.random(natoms, seed=natoms) for natoms in (1, 5, 10)]
+    batch = TransComponent.compute_batch(data_objects=systems, columnar=True)
+    assert isinstance(batch, ColumnarBatch)
+
+    tkmols = TransComponent.compute_batch(schema_objects=batch, dtype="stub")
+    for tkmol, system in zip(tkmols, systems):
+        numpy.testing.assert_allclose(tkmol.data.positions, system.positions)
+        assert numpy.shares_memory(tkmol.data.positions, batch.columns["geometry"])
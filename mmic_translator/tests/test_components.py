@@ -0,0 +1,154 @@
+"""
+Unit tests for the translation component.
+"""
+
+import multiprocessing
+import time
+import pytest
+
+pytest.importorskip("mmelemental")
+import numpy
+from mmelemental.models import Molecule
+from mmic_translator.components import TransComponent, TransExecutor
+
+
+def test_find_tk(stub):
+    assert TransComponent.find_molread_tk("stub") == "mmic_stub"
+    assert TransComponent.find_ffwrite_tk("stubff") == "mmic_stub"
+    assert TransComponent.find_trajwrite_tk("stub") == "mmic_stub"
+    assert TransComponent.find_trajwrite_ext_maps()["mmic_stub"] == {"stub": "stub"}
+    assert TransComponent.find_molread_tk("stubff") is None
+
+
+def test_compute_batch(stub):
+    systems = [stub.StubSystem.random(natoms, seed=natoms) for natoms in (1, 5, 10)]
+    mols = TransComponent.compute_batch(data_objects=systems)
+    assert [len(mol.symbols) for mol in mols] == [1, 5, 10]
+
+    tkmols = TransComponent.compute_batch(schema_objects=mols, dtype="stub")
+    for tkmol, system in zip(tkmols, systems):
+        numpy.testing.assert_allclose(tkmol.data.positions, system.positions)
+
+    with pytest.raises(ValueError):
+        TransComponent.compute_batch(schema_objects=mols)
+
+
+def _molecule_inputs(sizes):
+    return [
+        {
+            "schema_object": Molecule(
+                symbols=["C"] * natoms, geometry=numpy.arange(3.0 * natoms)
+            ),
+            "schema_name": "test",
+            "schema_version": 1,
+        }
+        for natoms in sizes
+    ]
+
+
+@pytest.mark.parametrize("method", ["fork", "spawn"])
+def test_executor_map(stub, method):
+    inputs = _molecule_inputs(range(1, 12))
+    with TransExecutor(
+        stub.StubComponent,
+        max_workers=2,
+        chunksize=3,
+        warm={"mmic_stub"},
+        mp_context=multiprocessing.get_context(method),
+    ) as executor:
+        outputs = executor.map(inputs)
+        # The same workers translate the next batch
+        assert len(executor.map(inputs[:2])) == 2
+    assert len(outputs) == len(inputs)
+    for inp, output in zip(inputs, outputs):
+        assert output.success
+        numpy.testing.assert_array_equal(
+            output.schema_object.geometry, inp["schema_object"].geometry
+        )
+
+
+def test_compute_parallel(stub):
+    inputs = _molecule_inputs(range(1, 6))
+    outputs = stub.StubComponent.compute_parallel(inputs, max_workers=2)
+    assert [len(output.schema_object.symbols) for output in outputs] == list(
+        range(1, 6)
+    )
+
+
+def test_translate_stream(stub, tmp_path):
+    system = stub.StubSystem.random(10, nframes=7)
+    system.save(tmp_path / "in.stub")
+    TransComponent.translate_stream(
+        str(tmp_path / "in.stub"), str(tmp_path / "out.stub"), chunk_size=3
+    )
+    numpy.testing.assert_allclose(
+        stub.StubSystem.load(tmp_path / "out.stub").positions, system.positions
+    )
+
+
+def test_find_model(stub):
+    assert TransComponent.find_model("mmic_stub", "Trajectory") is stub.StubTraj
+    assert "mmic_stub" in TransComponent.installed_comps_model("ForceField")
+    with pytest.raises(ValueError):
+        TransComponent.find_model("mmic_stub", "Topology")
+
+
+def test_convert_direct(stub):
+    from mmic_translator.instrument import StageHistogram
+
+    system = stub.StubSystem.random(10)
+    with StageHistogram() as hist:
+        tkmol = TransComponent.convert(system, "stub2")
+    assert tkmol.dtype == "stub2"
+    assert tkmol.data is system
+    assert "to_schema" not in hist.summary()
+
+
+def test_convert_schema_fallback(stub):
+    from mmic_translator.instrument import StageHistogram
+
+    system = stub.StubSystem.random(10)
+    tkmol = TransComponent.convert(system, "stub2")
+    with StageHistogram() as hist:
+        back = TransComponent.convert(tkmol, "stub")
+        via_schema = tkmol.to_toolkit("stub")
+    assert back.dtype == via_schema.dtype == "stub"
+    numpy.testing.assert_allclose(back.data.positions, system.positions)
+    assert hist.summary()["to_schema"]["count"] == 2
+
+
+def test_acompute_many(stub):
+    import asyncio
+    import threading
+    from mmic_translator.models import OutputTrans
+
+    lock, running, peak = threading.Lock(), [0], [0]
+
+    class SlowComponent(TransComponent):
+        @classmethod
+        def compute(cls, inputs):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+            return OutputTrans.trusted(schema_object=inputs["schema_object"])
+
+    inputs = [{"schema_object": i} for i in range(12)]
+    outputs = asyncio.run(SlowComponent.acompute_many(inputs, max_concurrency=3))
+    assert [out.schema_object for out in outputs] == list(range(12))
+    assert 1 <= peak[0] <= 3
+
+
+def test_afile(stub, tmp_path):
+    import asyncio
+
+    system = stub.StubSystem.random(10, nframes=3)
+
+    async def round_trip():
+        await stub.StubTraj(data=system).ato_file(str(tmp_path / "out.stub"))
+        return await stub.StubTraj.afrom_file(str(tmp_path / "out.stub"))
+
+    traj = asyncio.run(round_trip())
+    numpy.testing.assert_allclose(traj.data.positions, system.positions)
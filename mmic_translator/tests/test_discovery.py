@@ -0,0 +1,100 @@
+"""
+Unit tests for entry-point based translator discovery.
+"""
+
+import os
+import sys
+import pytest
+from mmic_translator import discovery
+from mmic_translator.mmic_translator import reg_trans, reg_vers
+
+
+@pytest.fixture
+def fake_dist(tmp_path, monkeypatch):
+    dist_info = tmp_path / "mmic_fake-0.1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: mmic_fake\nVersion: 0.1.0\n"
+    )
+    (dist_info / "entry_points.txt").write_text(
+        "[mmic_translator.translators]\nmmic_fake = mmic_fake_info:info\n"
+    )
+    (tmp_path / "mmic_fake_info.py").write_text(
+        "info = {'dtype': 'fake', 'models': ['Molecule'], "
+        "'ext_maps': {'molread': {'fk': 'fk'}}}\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(discovery, "_discovered", None)
+    yield
+    sys.modules.pop("mmic_fake_info", None)
+    reg_trans.pop("mmic_fake", None)
+    reg_vers.pop("mmic_fake", None)
+
+
+def test_discover_translators(fake_dist):
+    info = discovery.discover_translators()["mmic_fake"]
+    assert info.dtype == "fake"
+    assert info.models == ("Molecule",)
+    assert info.ext_maps == {"molread": {"fk": "fk"}}
+    assert info.version == "0.1.0"
+    assert info.distribution == "mmic_fake"
+
+
+def test_register_discovered(fake_dist):
+    discovery.register_discovered()
+    assert reg_trans["mmic_fake"] == "fake"
+    assert reg_vers["mmic_fake"] == "0.1.0"
+    assert "mmic_fake" in discovery.installed_translators({"mmic_fake"})
+    # The translator module itself is never imported
+    assert "mmic_fake" not in sys.modules
+
+
+def test_probe_disk_cache(tmp_path, monkeypatch, discovery_cache_dir):
+    (tmp_path / "mmic_probed.py").write_text(
+        "_classes_map = {'Molecule': object, 'Trajectory': None}\n"
+        "molread_ext_maps = {'pdb': 'pdb'}\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    info = discovery.probe_trans_info("mmic_probed")
+    assert info.models == ("Molecule",)
+    assert info.ext_maps == {"molread": {"pdb": "pdb"}}
+    assert (discovery_cache_dir / discovery.CACHE_FILE).exists()
+
+    # A fresh process answers from the disk cache without importing the translator
+    sys.modules.pop("mmic_probed")
+    monkeypatch.setattr(discovery, "_probed", None)
+    assert discovery.probe_trans_info("mmic_probed") == info
+    assert "mmic_probed" not in sys.modules
+
+    # Modifying the translator invalidates its entry
+    (tmp_path / "mmic_probed.py").write_text(
+        "_classes_map = {'Molecule': object}\n" "molread_ext_maps = {'gro': 'gro'}\n"
+    )
+    assert discovery.probe_trans_info("mmic_probed", refresh=True).ext_maps == {
+        "molread": {"gro": "gro"}
+    }
+    sys.modules.pop("mmic_probed")
+
+
+def test_probe_disk_cache_submodule(tmp_path, monkeypatch, discovery_cache_dir):
+    pkg = tmp_path / "mmic_probed_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("from .maps import *\n")
+    (pkg / "maps.py").write_text("molread_ext_maps = {'pdb': 'pdb'}\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    info = discovery.probe_trans_info("mmic_probed_pkg")
+    assert info.ext_maps == {"molread": {"pdb": "pdb"}}
+
+    # Editing the submodule defining the maps invalidates the entry, e.g. in an
+    # editable install where neither the version nor __init__.py change
+    for name in ("mmic_probed_pkg", "mmic_probed_pkg.maps"):
+        sys.modules.pop(name)
+    (pkg / "maps.py").write_text("molread_ext_maps = {'gro': 'gro'}\n")
+    stat = os.stat(pkg / "maps.py")
+    os.utime(pkg / "maps.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    monkeypatch.setattr(discovery, "_probed", None)
+    assert discovery.probe_trans_info("mmic_probed_pkg").ext_maps == {
+        "molread": {"gro": "gro"}
+    }
+    for name in ("mmic_probed_pkg", "mmic_probed_pkg.maps"):
+        sys.modules.pop(name)
@@ -0,0 +1,53 @@
+"""
+Unit tests for the translation stage hooks.
+"""
+
+import pytest
+from mmic_translator.instrument import StageHistogram, StageHook, instrumented
+
+
+class RecordingHook(StageHook):
+    def __init__(self):
+        self.calls = []
+
+    def on_start(self, stage, source):
+        self.calls.append(("start", stage, source))
+
+    def on_end(self, stage, source, elapsed, error):
+        self.calls.append(("end", stage, source, type(error)))
+
+
+@instrumented("test")
+def fail():
+    raise RuntimeError
+
+
+def test_hooks_only_called_when_registered():
+    hook = RecordingHook()
+    with hook:
+        with pytest.raises(RuntimeError):
+            fail()
+    fail_source = fail.__wrapped__.__qualname__
+    with pytest.raises(RuntimeError):
+        fail()
+    assert hook.calls == [
+        ("start", "test", fail_source),
+        ("end", "test", fail_source, RuntimeError),
+    ]
+
+
+def test_stage_histogram(stub_trans):
+    from mmic_stub import StubSystem
+    from mmic_translator.components import TransComponent
+    from mmic_translator.models import InputTrans
+
+    with StageHistogram() as hist:
+        TransComponent.compute_batch(
+            data_objects=[StubSystem.random(10) for _ in range(3)]
+        )
+        InputTrans(schema_name="test", schema_version=1)
+    summary = hist.summary()
+    assert summary["to_schema"]["count"] == 3
+    assert summary["find_trans"]["count"] == 1
+    assert summary["validation"]["count"] == 1
+    assert sum(summary["to_schema"]["histogram"].values()) == 3
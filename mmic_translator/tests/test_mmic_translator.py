@@ -5,9 +5,37 @@ Unit and regression test for the mmic_translator package.
 # Import package, test suite, and other packages as needed
 import mmic_translator
 import pytest
+import subprocess
 import sys
 
+# Generous upper bound on the wall time of a bare ``import mmic_translator``
+IMPORT_TIME_BUDGET = 0.25
+
 
 def test_mmic_translator_imported():
     """Sample test, will always pass so long as import statement worked"""
     assert "mmic_translator" in sys.modules
+
+
+def test_mmic_translator_lazy_import():
+    """Importing the package must not eagerly import its heavy dependencies."""
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import mmic_translator\n"
+        "print(time.perf_counter() - start)\n"
+        "heavy = ('pydantic', 'mmic', 'mmelemental', 'cmselemental', 'mmic_translator._version')\n"
+        "print(','.join(mod for mod in heavy if mod in sys.modules))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout.split("\n")
+    assert float(out[0]) < IMPORT_TIME_BUDGET
+    assert out[1] == ""
+
+
+def test_mmic_translator_lazy_attrs():
+    assert "TransComponent" in dir(mmic_translator)
+    assert mmic_translator.reg_trans is mmic_translator.mmic_translator.reg_trans
+    with pytest.raises(AttributeError):
+        mmic_translator.not_an_attribute
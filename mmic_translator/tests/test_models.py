@@ -0,0 +1,207 @@
+"""
+Unit tests for the translator models.
+"""
+
+import pytest
+
+pytest.importorskip("mmelemental")
+import numpy
+import mmic_translator
+from mmelemental.models import Molecule
+from mmic_translator.models import ArrayBuffer, InputTrans
+
+
+@pytest.fixture
+def debug_validation():
+    mmic_translator.set_debug_validation(True)
+    yield
+    mmic_translator.set_debug_validation(False)
+
+
+def test_trusted_skips_validation(stub):
+    assert stub.StubMol.trusted(None).data is None
+    inputs = InputTrans.trusted(
+        schema_name="test", schema_version=1, data_object=1, schema_object=1
+    )
+    assert inputs.data_object == inputs.schema_object == 1
+
+
+def test_trusted_debug_validation(stub, debug_validation):
+    assert stub.StubMol.trusted(stub.StubSystem.random(10)).data.natoms == 10
+    with pytest.raises(ValueError):
+        stub.StubMol.trusted(None)
+    with pytest.raises(ValueError):
+        InputTrans.trusted(
+            schema_name="test", schema_version=1, data_object=1, schema_object=1
+        )
+
+
+def test_get_buffer(stub):
+    traj = stub.StubTraj(
+        data=stub.StubSystem.random(10, nframes=2, dtype=numpy.float32)
+    )
+    buf = traj.get_buffer("geometry")
+    assert buf.units == "angstrom"
+    assert numpy.shares_memory(buf.array, traj.data.positions)
+    with pytest.raises(ValueError):
+        traj.get_buffer("geometry", dtype=numpy.float64)
+    with pytest.raises(KeyError):
+        traj.get_buffer("forces")
+
+
+def test_translator_members(stub):
+    tkmol = stub.StubMol(data=stub.StubSystem.random(10))
+    assert tkmol.translator == "mmic_stub"
+    assert ("StubMol", stub.StubMol) in tkmol.models
+    assert tkmol.models == tkmol.models
+    assert ("StubComponent", stub.StubComponent) in tkmol.components
+
+
+def test_select_indices():
+    from mmic_translator.models import select_indices, selection_size
+
+    assert select_indices(None, 5) == slice(0, 5, 1)
+    assert select_indices(slice(None, None, -2), 5) == slice(4, -1, -2)
+    assert select_indices(-1, 5) == slice(4, 5, 1)
+    assert select_indices([0, -1], 5).tolist() == [0, 4]
+    assert select_indices([True, False, True], 3).tolist() == [0, 2]
+    assert selection_size(slice(None, None, -2), 5) == 3
+    with pytest.raises(IndexError):
+        select_indices([5], 5)
+    with pytest.raises(IndexError):
+        select_indices([True], 3)
+
+
+def test_from_file_selection(stub, tmp_path):
+    system = stub.StubSystem.random(10, nframes=8)
+    fname = str(tmp_path / "in.stub")
+    system.save(fname)
+
+    # Decoded natively by the trajectory model
+    traj = stub.StubTraj.from_file(fname, frames=slice(1, None, 3), atoms=[0, 2])
+    numpy.testing.assert_allclose(
+        traj.data.positions, system.positions[1::3][:, [0, 2]]
+    )
+    schemas = list(
+        stub.StubTraj.iter_schema(fname, chunk_size=2, frames=slice(1, None, 3))
+    )
+    assert [schema.nframes for schema in schemas] == [2, 1]
+
+    # Applied after reading by the molecule model
+    mol = stub.StubMol.from_file(fname, frames=-1, atoms=slice(5))
+    numpy.testing.assert_allclose(mol.data.positions, system.positions[-1:, :5])
+
+
+def test_from_file_selection_arguments(stub, tmp_path):
+    system = stub.StubSystem.random(10, nframes=2)
+    fname = str(tmp_path / "in.stub")
+    system.save(fname)
+
+    class TopMol(stub.StubMol):
+        @classmethod
+        def from_file(cls, filename, top_file=None, dtype=None, **kwargs):
+            assert (top_file, dtype) == ("in.top", None)
+            return super().from_file(filename, dtype=dtype, **kwargs)
+
+    # Positional arguments reach the translator unchanged
+    assert TopMol.from_file(fname, "in.top").data.nframes == 2
+    mol = TopMol.from_file(fname, "in.top", frames=0)
+    numpy.testing.assert_allclose(mol.data.positions, system.positions[:1])
+    with pytest.raises(TypeError):
+        TopMol.from_file(fname, "in.top", None, 0)
+
+
+def test_to_schema_lazy(stub):
+    from mmic_translator.instrument import StageHistogram
+
+    tkmol = stub.StubMol(data=stub.StubSystem.random(10))
+    with StageHistogram() as hist:
+        mol = tkmol.to_schema_lazy()
+        assert len(mol.symbols) == 10
+        assert mol.geometry is mol.geometry
+        assert not mol.materialized and "to_schema" not in hist.summary()
+
+        # Fields without a getter build the full object, once
+        assert mol.name == tkmol.to_schema().name
+        assert mol.materialized
+        full = mol.materialize()
+        assert mol.materialize() is full
+        assert hist.summary()["to_schema"]["count"] == 2
+    numpy.testing.assert_array_equal(full.geometry, tkmol.data.positions[0].ravel())
+
+
+def test_to_schema_incremental(stub):
+    from mmic_translator.instrument import StageHistogram
+
+    system = stub.StubSystem.random(10, nframes=3)
+    tktraj = stub.StubTraj(data=system)
+    with StageHistogram() as hist:
+        traj = tktraj.to_schema_incremental()
+        assert tktraj.to_schema_incremental() is traj
+
+        system.positions[1, 2] += 1.0
+        patched = tktraj.to_schema_incremental()
+        numpy.testing.assert_array_equal(patched.geometry, system.positions.ravel())
+        numpy.testing.assert_array_equal(traj.geometry[:3], patched.geometry[:3])
+        assert patched.nframes == traj.nframes
+        assert hist.summary()["to_schema"]["count"] == 1
+
+        tktraj.mark_dirty()
+        tktraj.to_schema_incremental()
+        assert hist.summary()["to_schema"]["count"] == 2
+
+        # Changing the number of atoms rebuilds the object
+        tktraj.data.positions = system.positions[:, :5]
+        assert tktraj.to_schema_incremental().natoms == 5
+        assert hist.summary()["to_schema"]["count"] == 3
+
+
+def test_to_schema_incremental_topology(stub, monkeypatch):
+    system = stub.StubSystem.random(4)
+    tkmol = stub.StubMol(data=system)
+    mol = tkmol.to_schema_incremental()
+    assert tkmol.to_schema_incremental() is mol
+
+    # Changes outside of the buffers are never returned stale
+    system.symbols = numpy.array(["O", "H", "H", "C"])
+    assert list(tkmol.to_schema_incremental().symbols) == ["O", "H", "H", "C"]
+
+    # Translators without a topology version always rebuild
+    monkeypatch.setattr(stub.StubMol, "topology_version", lambda self: None)
+    assert tkmol.to_schema_incremental() is not tkmol.to_schema_incremental()
+
+
+def test_to_schema_incremental_nested(stub):
+    from types import SimpleNamespace
+    from mmic_translator.instrument import StageHistogram
+
+    class NestedMol(stub.StubMol):
+        """Positions nested below the data object, as in Universe.trajectory.ts.positions."""
+
+        def topology_version(self):
+            return self.data.revision
+
+        def buffers(self):
+            return {"geometry": ArrayBuffer(self.data.ts.positions, "angstrom")}
+
+        def to_schema(self, version=None, **kwargs):
+            return Molecule(
+                symbols=self.data.symbols, geometry=self.data.ts.positions.ravel()
+            )
+
+    positions = numpy.random.rand(4, 3)
+    data = SimpleNamespace(
+        symbols=["C"] * 4, ts=SimpleNamespace(positions=positions), revision=0
+    )
+    tkmol = NestedMol.trusted(data)
+    with StageHistogram() as hist:
+        mol = tkmol.to_schema_incremental()
+        positions[0] += 1.0
+        patched = tkmol.to_schema_incremental()
+        numpy.testing.assert_array_equal(patched.geometry, positions.ravel())
+        assert hist.summary()["to_schema"]["count"] == 1
+
+        data.symbols, data.revision = ["O"] * 4, 1
+        assert list(tkmol.to_schema_incremental().symbols) == ["O"] * 4
+        assert hist.summary()["to_schema"]["count"] == 2
+    assert mol is not patched
@@ -0,0 +1,34 @@
+"""
+Unit tests for the conversion planner.
+"""
+
+import pytest
+
+pytest.importorskip("mmelemental")
+from mmic_translator.planner import SCHEMA, ConversionPlanner
+
+
+def test_plan_through_schema(stub, monkeypatch):
+    monkeypatch.setattr(stub.StubMol, "direct_dtypes", {})
+    plan = ConversionPlanner().plan("stub", "stub2")
+    assert [(step.method, step.translator) for step in plan.steps] == [
+        ("to_schema", "mmic_stub"),
+        ("from_schema", "mmic_stub2"),
+    ]
+    assert plan.cost == 2.0
+
+    tkmol = plan.run(stub.StubMol(data=stub.StubSystem.random(10)))
+    assert tkmol.dtype == "stub2"
+
+
+def test_plan_direct(stub):
+    plan = ConversionPlanner().plan("stub", "stub2")
+    assert [(step.method, step.target) for step in plan.steps] == [
+        ("to_toolkit", "stub2")
+    ]
+    assert ConversionPlanner().plan("stub", SCHEMA).cost == 1.0
+
+
+def test_plan_not_found(stub):
+    with pytest.raises(ValueError):
+        ConversionPlanner().plan("stub", "unknown")
@@ -0,0 +1,70 @@
+"""
+Unit tests for the translator capability registry.
+"""
+
+import sys
+import pytest
+from mmic_translator.registry import TransRegistry
+
+
+@pytest.fixture
+def trans(tmp_path, monkeypatch):
+    (tmp_path / "mmic_fake_a.py").write_text(
+        "molread_ext_maps = {'pdb': 'pdb', 'gro': 'gro'}\n"
+        "trajwrite_ext_maps = {'dcd': 'dcd'}\n"
+    )
+    (tmp_path / "mmic_fake_b.py").write_text(
+        "molread_ext_maps = {'pdb': 'pdb'}\n" "ffwrite_ext_maps = {'top': 'top'}\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield {"mmic_fake_a": "fake_a", "mmic_fake_b": "fake_b", "mmic_missing": "missing"}
+    for name in ("mmic_fake_a", "mmic_fake_b"):
+        sys.modules.pop(name, None)
+
+
+def test_lookup(trans):
+    reg = TransRegistry(trans)
+    assert reg.installed() == {"mmic_fake_a", "mmic_fake_b"}
+    assert reg.lookup("mol", "read", "pdb") == "mmic_fake_a"
+    assert reg.lookup("mol", "read", "pdb", trans={"mmic_fake_b"}) == "mmic_fake_b"
+    assert reg.lookup("traj", "write", "dcd") == "mmic_fake_a"
+    assert reg.lookup("ff", "write", "dcd") is None
+    assert reg.ext_maps("traj", "write") == {"mmic_fake_a": {"dcd": "dcd"}}
+
+
+def test_unregistered(trans):
+    reg = TransRegistry({"mmic_fake_b": "fake_b"})
+    assert reg.lookup("mol", "read", "gro") is None
+    # Installed translators passed explicitly are probed even if not registered
+    assert reg.lookup("mol", "read", "gro", trans={"mmic_fake_a"}) == "mmic_fake_a"
+    assert reg.lookup("mol", "read", "pdb", trans=set(trans)) == "mmic_fake_b"
+    assert reg.lookup("mol", "read", "pdb", trans={"mmic_missing"}) is None
+    assert reg.ext_maps("traj", "write", trans={"mmic_fake_a", "mmic_missing"}) == {
+        "mmic_fake_a": {"dcd": "dcd"}
+    }
+    assert reg.ext_maps("traj", "write") == {}
+
+
+def test_priority_and_invalidation(trans):
+    reg = TransRegistry(trans)
+    reg.set_priority("mmic_fake_b", 1)
+    assert [cap.translator for cap in reg.candidates("mol", "read", "pdb")] == [
+        "mmic_fake_b",
+        "mmic_fake_a",
+    ]
+    del trans["mmic_fake_b"]
+    assert reg.lookup("mol", "read", "pdb") == "mmic_fake_a"
+
+
+def test_unknown_kind(trans):
+    with pytest.raises(KeyError):
+        TransRegistry(trans).lookup("top", "read", "pdb")
+
+
+def test_kind_of(trans):
+    reg = TransRegistry(trans)
+    assert reg.kind_of("Trajectory") == "traj"
+    with pytest.raises(ValueError):
+        reg.kind_of("Topology")
+    reg.add_kind("top", "Topology")
+    assert reg.kind_of("Topology") == "top"
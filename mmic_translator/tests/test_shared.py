@@ -0,0 +1,137 @@
+"""
+Unit tests for the shared-memory transport of arrays and MMSchema models.
+"""
+
+import multiprocessing
+import os
+import pickle
+import sys
+import pytest
+
+pytest.importorskip("mmelemental")
+if sys.version_info < (3, 8):
+    pytest.skip("shared memory requires python >= 3.8", allow_module_level=True)
+import numpy
+from mmelemental.models import Molecule
+from mmic_translator.components import TransComponent, TransExecutor
+from mmic_translator.models import OutputTrans, SharedArray, SharedSchema
+
+
+class EchoComponent(TransComponent):
+    """Returns the input schema object as seen by the worker."""
+
+    @classmethod
+    def compute(cls, inputs):
+        return OutputTrans.trusted(
+            schema_object=inputs["schema_object"].copy(deep=True),
+            schema_name=inputs["schema_name"],
+            schema_version=inputs["schema_version"],
+            success=True,
+        )
+
+
+class FailingComponent(EchoComponent):
+    @classmethod
+    def compute(cls, inputs):
+        if inputs["schema_name"] == "fail":
+            raise ValueError("failed translation")
+        return super().compute(inputs)
+
+
+def test_shared_array():
+    data = numpy.arange(12.0).reshape(3, 4)
+    handle = SharedArray.from_array(data)
+    try:
+        payload = pickle.dumps(handle)
+        assert len(payload) < data.nbytes
+        attached = pickle.loads(payload)
+        numpy.testing.assert_array_equal(attached.array, data)
+        attached.array[0, 0] = -1.0
+        assert handle.array[0, 0] == -1.0
+    finally:
+        handle.unlink()
+    assert handle.close()
+
+
+def test_shared_schema():
+    mol = Molecule(symbols=["C", "O"], geometry=numpy.arange(6.0), name="co")
+    with SharedSchema.from_schema(mol) as shared:
+        assert set(shared.arrays) == {"symbols", "geometry"}
+        view = pickle.loads(pickle.dumps(shared)).to_schema()
+        numpy.testing.assert_array_equal(view.geometry, mol.geometry)
+        assert view.name == "co"
+        copy = shared.to_schema(copy=True)
+        del view
+    numpy.testing.assert_array_equal(copy.geometry, mol.geometry)
+
+
+def test_shared_structured_dtype():
+    mol = Molecule(
+        symbols=["C", "C", "O"],
+        geometry=numpy.arange(9.0),
+        connectivity=[(0, 1, 1.0), (1, 2, 2.0)],
+    )
+    with SharedSchema.from_schema(mol) as shared:
+        view = pickle.loads(pickle.dumps(shared)).to_schema(copy=True)
+    assert view.connectivity.dtype == mol.connectivity.dtype
+    assert view.connectivity.tolist() == mol.connectivity.tolist()
+
+    mols = [mol] * 3
+    inputs = [
+        {"schema_object": mol, "schema_name": "test", "schema_version": 1}
+        for mol in mols
+    ]
+    with TransExecutor(
+        EchoComponent,
+        max_workers=2,
+        mp_context=multiprocessing.get_context("fork"),
+        share_memory=True,
+    ) as executor:
+        outputs = executor.map(inputs)
+    for output in outputs:
+        assert output.schema_object.connectivity.dtype == mol.connectivity.dtype
+        assert output.schema_object.connectivity.tolist() == mol.connectivity.tolist()
+
+
+def test_executor_share_memory(stub_trans):
+    from mmic_stub import StubComponent
+
+    mols = [
+        Molecule(symbols=["C"] * n, geometry=numpy.random.rand(3 * n))
+        for n in (1, 10, 100)
+    ]
+    inputs = [
+        {"schema_object": mol, "schema_name": "test", "schema_version": 1}
+        for mol in mols
+    ]
+    with TransExecutor(
+        StubComponent,
+        max_workers=2,
+        mp_context=multiprocessing.get_context("fork"),
+        share_memory=True,
+    ) as executor:
+        outputs = executor.map(inputs)
+    for mol, output in zip(mols, outputs):
+        assert isinstance(output.schema_object, Molecule)
+        numpy.testing.assert_array_equal(output.schema_object.geometry, mol.geometry)
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="requires /dev/shm")
+@pytest.mark.parametrize("chunksize", [1, 2])
+def test_executor_share_memory_failure(chunksize):
+    before = set(os.listdir("/dev/shm"))
+    mol = Molecule(symbols=["C", "O"], geometry=numpy.arange(6.0))
+    inputs = [
+        {"schema_object": mol, "schema_name": name, "schema_version": 1}
+        for name in ("test", "test", "test", "fail", "test", "test")
+    ]
+    with TransExecutor(
+        FailingComponent,
+        max_workers=2,
+        chunksize=chunksize,
+        mp_context=multiprocessing.get_context("fork"),
+        share_memory=True,
+    ) as executor:
+        with pytest.raises(ValueError, match="failed translation"):
+            executor.map(inputs)
+    assert set(os.listdir("/dev/shm")) <= before
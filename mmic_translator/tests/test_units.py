@@ -0,0 +1,107 @@
+"""
+Unit tests for the vectorized unit conversion.
+"""
+
+import pytest
+import numpy
+from mmic_translator.units import convert_units, unit_factor
+
+
+def test_unit_factor():
+    assert unit_factor("nanometer", "angstrom").scale == pytest.approx(10.0)
+    assert unit_factor("nm", "angstrom") == unit_factor("nanometer", "angstrom")
+    assert unit_factor("degC", "kelvin") == (1.0, 273.15)
+    assert unit_factor("angstrom", " angstrom ").identity
+    with pytest.raises(ValueError):
+        unit_factor("angstrom", "femtosecond")
+
+
+def test_unit_factor_pint():
+    pytest.importorskip("pint")
+    factor = unit_factor("angstrom / femtosecond", "nanometer / picosecond")
+    assert factor.scale == pytest.approx(100.0)
+    assert unit_factor("kilocalorie / mole", "kilojoule / mole").scale == pytest.approx(
+        4.184
+    )
+
+
+def test_convert_units():
+    arr = numpy.arange(6.0)
+    assert convert_units(arr, "angstrom", "angstrom") is arr
+    assert convert_units(arr, None, "angstrom") is arr
+
+    converted = convert_units(arr, "nanometer", "angstrom")
+    numpy.testing.assert_allclose(converted, arr * 10.0)
+    assert converted is not arr
+
+    assert convert_units(arr, "degC", "kelvin", inplace=True) is arr
+    numpy.testing.assert_allclose(arr, numpy.arange(6.0) + 273.15)
+
+
+def test_get_buffer_units(stub_trans):
+    import mmic_stub
+    from mmelemental.models import Molecule
+
+    tkmol = mmic_stub.StubTraj(data=mmic_stub.StubSystem.random(10))
+    with pytest.raises(ValueError):
+        tkmol.get_buffer("geometry", units="nanometer")
+    buf = tkmol.get_buffer("geometry", units="nanometer", copy=True)
+    assert buf.units == "nanometer"
+    numpy.testing.assert_allclose(buf.array, tkmol.data.positions / 10.0)
+    assert tkmol.get_buffer("geometry", units="angstrom").array is tkmol.data.positions
+
+    mol = Molecule(
+        symbols=["C", "C"], geometry=numpy.arange(6.0), geometry_units="nanometer"
+    )
+    tkmol = mmic_stub.StubMol.from_schema(mol)
+    assert tkmol.get_buffer("geometry").units == "nanometer"
+    buf = tkmol.get_buffer("geometry", units="angstrom", copy=True)
+    numpy.testing.assert_allclose(buf.array.ravel(), mol.geometry * 10.0)
+
+
+def test_schema_boundary_units(stub_trans):
+    import mmic_stub
+    from mmelemental.models import Molecule
+
+    mol = Molecule(symbols=["C", "C"], geometry=numpy.arange(6.0))
+    # Converted to the data units before the translator reads the Molecule
+    tkmol = mmic_stub.StubMol.from_schema(mol, data_units={"geometry": "nanometer"})
+    assert tkmol.data_units == {"geometry": "nanometer"}
+    numpy.testing.assert_allclose(tkmol.data.positions.ravel(), mol.geometry / 10.0)
+
+    # and back to the units of the Molecule once the translator has built it
+    out = tkmol.to_schema()
+    assert out.geometry_units == "angstrom"
+    numpy.testing.assert_allclose(out.geometry, mol.geometry)
+    numpy.testing.assert_allclose(tkmol.to_schema_lazy().geometry, mol.geometry)
+
+    # Data objects stored in other units
+    system = mmic_stub.StubSystem.random(4)
+    tkmol = mmic_stub.StubMol(data=system, data_units={"geometry": "nanometer"})
+    numpy.testing.assert_allclose(
+        tkmol.to_schema().geometry, system.positions.ravel() * 10.0
+    )
+    numpy.testing.assert_allclose(
+        tkmol.to_schema_incremental().geometry, system.positions.ravel() * 10.0
+    )
+    system.positions[0, 0] += 1.0
+    numpy.testing.assert_allclose(
+        tkmol.to_schema_incremental().geometry, system.positions.ravel() * 10.0
+    )
+
+
+def test_schema_units_subclass(stub_trans):
+    import mmic_stub
+    from mmic_translator.instrument import StageHistogram
+
+    class SubMol(mmic_stub.StubMol):
+        def to_schema(self, version=None, **kwargs):
+            return super().to_schema(version, **kwargs)
+
+    system = mmic_stub.StubSystem.random(4)
+    tkmol = SubMol(data=system, data_units={"geometry": "nanometer"})
+    with StageHistogram() as hist:
+        mol = tkmol.to_schema()
+    # Converted and instrumented once although both classes define to_schema
+    numpy.testing.assert_allclose(mol.geometry, system.positions.ravel() * 10.0)
+    assert hist.summary()["to_schema"]["count"] == 1
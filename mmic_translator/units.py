@@ -0,0 +1,175 @@
+"""
+units.py
+Vectorized unit conversion of NumPy arrays
+
+Conversion factors are resolved once per (from_units, to_units) pair and cached as an affine
+map (scale, offset). Common molecular mechanics units are resolved from a built-in table;
+other units, including compound units such as "angstrom / femtosecond", are parsed with pint
+on first use.
+"""
+from typing import Any, NamedTuple, Optional
+import functools
+import threading
+import numpy
+
+__all__ = ["UnitFactor", "unit_factor", "convert_units"]
+
+
+class UnitFactor(NamedTuple):
+    """Affine conversion between two units: converted = value * scale + offset."""
+
+    scale: float
+    offset: float = 0.0
+
+    @property
+    def identity(self) -> bool:
+        return self.scale == 1.0 and self.offset == 0.0
+
+
+# unit: (dimension, scale, offset) to the reference unit of its dimension
+_BUILTIN = {
+    # length, meter
+    "meter": ("length", 1.0, 0.0),
+    "centimeter": ("length", 1e-2, 0.0),
+    "nanometer": ("length", 1e-9, 0.0),
+    "angstrom": ("length", 1e-10, 0.0),
+    "picometer": ("length", 1e-12, 0.0),
+    "bohr": ("length", 5.29177210903e-11, 0.0),
+    # time, second
+    "second": ("time", 1.0, 0.0),
+    "nanosecond": ("time", 1e-9, 0.0),
+    "picosecond": ("time", 1e-12, 0.0),
+    "femtosecond": ("time", 1e-15, 0.0),
+    # mass, kilogram
+    "kilogram": ("mass", 1.0, 0.0),
+    "gram": ("mass", 1e-3, 0.0),
+    "unified_atomic_mass_unit": ("mass", 1.66053906660e-27, 0.0),
+    # charge, coulomb
+    "coulomb": ("charge", 1.0, 0.0),
+    "elementary_charge": ("charge", 1.602176634e-19, 0.0),
+    # temperature, kelvin
+    "kelvin": ("temperature", 1.0, 0.0),
+    "degree_Celsius": ("temperature", 1.0, 273.15),
+}
+_ALIASES = {
+    "m": "meter",
+    "cm": "centimeter",
+    "nm": "nanometer",
+    "angstroms": "angstrom",
+    "pm": "picometer",
+    "s": "second",
+    "ns": "nanosecond",
+    "ps": "picosecond",
+    "fs": "femtosecond",
+    "kg": "kilogram",
+    "g": "gram",
+    "amu": "unified_atomic_mass_unit",
+    "u": "unified_atomic_mass_unit",
+    "dalton": "unified_atomic_mass_unit",
+    "Da": "unified_atomic_mass_unit",
+    "C": "coulomb",
+    "e": "elementary_charge",
+    "K": "kelvin",
+    "degC": "degree_Celsius",
+}
+
+_ureg = None
+_ureg_lock = threading.Lock()
+
+
+def _registry():
+    global _ureg
+    with _ureg_lock:
+        if _ureg is None:
+            try:
+                import pint
+            except ImportError:
+                raise ImportError(
+                    "pint is required to convert units missing from the built-in table."
+                )
+            _ureg = pint.UnitRegistry()
+        return _ureg
+
+
+@functools.lru_cache(maxsize=None)
+def unit_factor(from_units: str, to_units: str) -> UnitFactor:
+    """Returns the conversion factor between two units, computed once per pair.
+
+    Parameters
+    ----------
+    from_units: str
+        Units to convert from e.g. nanometer.
+    to_units: str
+        Units to convert to e.g. angstrom.
+
+    Returns
+    -------
+    UnitFactor
+        Affine conversion i.e. scale and offset.
+
+    Raises
+    ------
+    ValueError
+        If the units have incompatible dimensions.
+
+    """
+    from_name, to_name = (" ".join(units.split()) for units in (from_units, to_units))
+    if from_name == to_name:
+        return UnitFactor(1.0)
+    from_entry = _BUILTIN.get(_ALIASES.get(from_name, from_name))
+    to_entry = _BUILTIN.get(_ALIASES.get(to_name, to_name))
+    if from_entry and to_entry:
+        if from_entry[0] != to_entry[0]:
+            raise ValueError(
+                f"Cannot convert {from_units} ({from_entry[0]}) to {to_units} ({to_entry[0]})."
+            )
+        _, from_scale, from_offset = from_entry
+        _, to_scale, to_offset = to_entry
+        return UnitFactor(from_scale / to_scale, (from_offset - to_offset) / to_scale)
+
+    ureg = _registry()
+    try:
+        zero = ureg.Quantity(0.0, from_name).to(to_name).magnitude
+        one = ureg.Quantity(1.0, from_name).to(to_name).magnitude
+    except Exception as exc:
+        raise ValueError(f"Cannot convert {from_units} to {to_units}: {exc}") from exc
+    return UnitFactor(float(one - zero), float(zero))
+
+
+def convert_units(
+    data: Any,
+    from_units: Optional[str],
+    to_units: Optional[str],
+    inplace: bool = False,
+) -> numpy.ndarray:
+    """Converts an array between units in a single vectorized pass. Arrays already in
+    ``to_units`` (or without units) are returned as is, without a copy.
+
+    Parameters
+    ----------
+    data: Any
+        NumPy array, or any array-like if not ``inplace``.
+    from_units: Optional[str]
+        Units of ``data`` e.g. nanometer.
+    to_units: Optional[str]
+        Units to convert to e.g. angstrom.
+    inplace: bool, optional
+        Overwrite ``data`` instead of allocating a new array. ``data`` must then be a
+        writable floating point array.
+
+    Returns
+    -------
+    numpy.ndarray
+        Converted array, ``data`` itself if ``inplace`` or if no conversion is needed.
+
+    """
+    if not from_units or not to_units:
+        return numpy.asarray(data)
+    factor = unit_factor(from_units, to_units)
+    if factor.identity:
+        return numpy.asarray(data)
+    out = data if inplace else None
+    result = numpy.multiply(data, factor.scale, out=out)
+    if factor.offset:
+        numpy.add(result, factor.offset, out=result)
+    return result